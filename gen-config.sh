@@ -47,12 +47,35 @@ function cleanup_gc()
     [ -f /tmp/$USER/.bash_cmake_args_loc ] && rm -f /tmp/$USER/.bash_cmake_args_loc 2>/dev/null
     [ -f /tmp/$USER/.load_env_args ] && rm -f /tmp/$USER/.load_env_args 2>/dev/null
 
-    unset python_too_old script_dir cleanup_gc gen_config_py_call_args gen_config_helper
+    unset python_too_old script_dir cleanup_gc gen_config_py_call_args gen_config_helper gen_config_py
     unset gc_random config_prefix path_to_src load_env_args cmake_args_file ret have_cmake_fragment
+    unset gen_config_document cmake_fragment
     trap -  SIGHUP SIGINT SIGTERM
     return $ret_val
 }
 trap "cleanup_gc; return 1" SIGHUP SIGINT SIGTERM
+
+################################################################################
+# gen_config_py function
+#
+# Runs gen_config.py with the given args through the resident server started
+# with gen_config_daemon.py, if one is listening on $GENCONFIG_DAEMON_SOCKET
+# (or gen-config.sock in $XDG_RUNTIME_DIR, or /tmp/$USER if unset), which skips
+# Python imports and .ini parsing. Otherwise, or if the server cannot be reached
+# or trusted (exit code 75), runs gen_config.py directly.
+################################################################################
+function gen_config_py()
+{
+    local socket=${GENCONFIG_DAEMON_SOCKET:-${XDG_RUNTIME_DIR:-/tmp/$USER}/gen-config.sock}
+    if [[ -S $socket && -O $socket ]]; then
+        python3 -E -s ${script_dir}/gen_config_daemon.py --socket $socket --request "$@"
+        local daemon_ret=$?
+        if [[ $daemon_ret -ne 75 ]]; then
+            return $daemon_ret
+        fi
+    fi
+    python3 -E -s ${script_dir}/gen_config.py "$@"
+}
 ####### END helper functions #######
 
 
@@ -71,9 +94,9 @@ fi
 # enforcing users to supply path_to_src when listing options
 if [[ "$@" == *"--list-configs"* || "$@" == *"--list-config-flags"* ]]; then
     if [ -d ${@: -1} ]; then
-        python3 -E -s ${script_dir}/gen_config.py ${@: 1:$(expr $# - 1)}; ret=$?
+        gen_config_py ${@: 1:$(expr $# - 1)}; ret=$?
     else
-        python3 -E -s ${script_dir}/gen_config.py $@; ret=$?
+        gen_config_py $@; ret=$?
     fi
     cleanup_gc; return $?
 fi
@@ -121,19 +144,22 @@ fi
 
 
 ### Generate the configuration ###
+# A single gen_config.py call writes cmake_args, cmake_fragment and the
+# load_env_args array to stdout as bash assignments (see
+# GenConfig.get_shell_document); its other messages go to stderr.
 gc_random=$RANDOM
-bash_cmake_args_loc=.bash_cmake_args.$gc_random
-python3 -E -s ${script_dir}/gen_config.py --bash-cmake-args-location ${bash_cmake_args_loc} $gen_config_py_call_args; ret=$?
+gen_config_document=$(gen_config_py --output-shell-document $gen_config_py_call_args); ret=$?
 if [[ $ret -ne 0 ]]; then
     cleanup_gc; return $?
 fi
+eval "$gen_config_document"
 ### ========================== ###
 
 
 ### Run LoadEnv and CMake ###
 # Export these for load-env.sh
-export cmake_args=$([ -f ${bash_cmake_args_loc} ] && cat ${bash_cmake_args_loc} )
-if [[ "$gen_config_py_call_args" == *"--cmake-fragment"* ]]; then
+export cmake_args
+if [[ -n $cmake_fragment ]]; then
     export have_cmake_fragment="true"
 fi
 export path_to_src=$(realpath ${path_to_src})
@@ -175,13 +201,8 @@ function gen_config_helper()
 }
 declare -x -f gen_config_helper
 
-load_env_args=$(python3 -E -s ${script_dir}/gen_config.py --output-load-env-args-only $gen_config_py_call_args); ret=$?
-if [[ $ret -ne 0 ]]; then
-    cleanup_gc; return $?
-fi
-
 # Actually run LoadEnv:
-source ${script_dir}/LoadEnv/load-env.sh ${load_env_args}; ret=$?
+source ${script_dir}/LoadEnv/load-env.sh "${load_env_args[@]}"; ret=$?
 ### ========================== ###
 
 ####### END configuration #######
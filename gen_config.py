@@ -1,23 +1,30 @@
 #!/usr/bin/env python3
 
 # All imports must be base python or trilinos-consolidation modules only.
+# LoadEnv, SetProgramOptionsCMake, concurrent.futures and the src modules
+# other than file_utils and ini_registry are only imported by the code that
+# uses them, so that, e.g., --help and --output-load-env-args-only start
+# quickly.
 import argparse
 from contextlib import redirect_stdout
 import getpass
+import importlib.util
 import io
+import json
 import os
 from pathlib import Path
+import shlex
+import shutil
 import sys
 import textwrap
 from typing import List
 import uuid
 
 try:
-    from configparserenhanced import ConfigParserEnhanced
     from keywordparser import FormattedMsg
-    from LoadEnv.load_env import LoadEnv
-    from setprogramoptions import SetProgramOptionsCMake
-    from src.config_keyword_parser import ConfigKeywordParser
+    from src.file_utils import (get_file_hash, get_file_hashes, get_key_hash,
+                                write_file_atomically, write_file_if_changed)
+    from src.ini_registry import get_derived_object, get_parsed_ini
 except ImportError:                         # pragma: no cover
     cwd = Path.cwd()                        # pragma: no cover
     gen_config_dir = Path(__file__).parent  # pragma: no cover
@@ -98,6 +105,24 @@ class GenConfig(FormattedMsg):
         argv:  The command line arguments passed to ``gen_config.py``.
     """
 
+    #: Bump this whenever the checks in validate_config_specs_ini change.
+    VALIDATION_CACHE_VERSION = 1
+
+    #: Bump this whenever the CMake fragments written for the same
+    #: ``config-specs.ini`` change.
+    FRAGMENT_FINGERPRINT_VERSION = 1
+
+    #: The file in each directory of CMake fragments recording the
+    #: :attr:`fragment_fingerprints` the fragments were written with.
+    FRAGMENT_MANIFEST_NAME = ".gen-config-fragments.json"
+
+    #: Whether :func:`load_load_env` reuses the :class:`LoadEnv` loaded by
+    #: an earlier object for the same ``.ini`` files (see
+    #: :func:`get_derived_object`).  As a :class:`LoadEnv` holds the build
+    #: name it works on, this is only safe when objects are used one at a
+    #: time, as in :class:`GenConfigDaemon`, which enables it.
+    share_load_env = False
+
     def __init__(
         self, argv:List[str],
         gen_config_ini_file=(Path(os.path.realpath(__file__)).parent /
@@ -150,17 +175,13 @@ class GenConfig(FormattedMsg):
                   -DTeuchosCore_show_stack_DISABLE:BOOL=ON
         """
         if not hasattr(self, "_generated_config_flags_str"):
-            # These should be set already via validate_config_specs_ini,
-            # which comes before this in main(). Don't include in branch
-            # coverage, as it's just a safety check.
-            if self.set_program_options is None:             # pragma: no cover
-                self.load_set_program_options()
-            if not self.has_been_validated:                  # pragma: no cover
-                self.validate_config_specs_ini()
+            # Unless the whole file was validated with --validate, only
+            # validate what the complete config touches.
+            if not self.has_been_validated:
+                self.validate_complete_config()
 
-            options_list = self.set_program_options.gen_option_list(
-                self.complete_config, "bash"
-            )
+            self.assert_complete_config_exists()
+            options_list = self.get_option_list("bash")
             self._generated_config_flags_str = " \\\n    ".join(options_list)
 
         return self._generated_config_flags_str
@@ -168,26 +189,35 @@ class GenConfig(FormattedMsg):
     def write_cmake_fragment(self):
         """
         Writes the generated config flags to a CMake fragment file, where the
-        path is specified using the ``--cmake-fragment`` flag.
+        path is specified using the ``--cmake-fragment`` flag.  If the file
+        already exists, the user is asked before overwriting it, unless its
+        contents would not change, in which case it is left untouched (see
+        :func:`write_file_if_changed`).  With
+        ``--incremental``, a file that :func:`fragment_is_up_to_date` is left
+        as it is, without validating or evaluating anything.
 
         Returns:
             Path:  The path to the CMake fragment file.
         """
         if not hasattr(self, "_cmake_fragment_file"):
-            # These should be set already via validate_config_specs_ini,
-            # which comes before this in main(). Don't include in branch
-            # coverage, as it's just a safety check.
-            if self.set_program_options is None:             # pragma: no cover
-                self.load_set_program_options()
-            if not self.has_been_validated:                  # pragma: no cover
-                self.validate_config_specs_ini()
-
-            cmake_options_list = self.set_program_options.gen_option_list(
-                self.complete_config, "cmake_fragment"
-            )
-
             file = self.args.cmake_fragment
-            if file.exists():
+            manifest = (self.load_fragment_manifest(file.parent)
+                        if self.args.incremental else None)
+            if (manifest is not None and self.fragment_is_up_to_date(
+                    file, self.complete_config, manifest)):
+                self._cmake_fragment_file = file
+                print(f"* CMake fragment file is up to date: {str(file)}\n")
+                return self._cmake_fragment_file
+
+            # Unless the whole file was validated with --validate, only
+            # validate what the complete config touches.
+            if not self.has_been_validated:
+                self.validate_complete_config()
+
+            self.assert_complete_config_exists()
+            contents = "\n".join(self.get_option_list("cmake_fragment"))
+
+            if file.exists() and file.read_text() != contents:
                 if not self.args.yes:
                     response = input(
                         "\n**WARNING** A cmake fragment file containing configuration "
@@ -204,18 +234,576 @@ class GenConfig(FormattedMsg):
                         print("* CMake fragment file not written.")
                         sys.exit(1)
 
-                file.unlink()
-
-            file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(file, "w") as F:
-                F.write("\n".join(cmake_options_list))
+            written = write_file_if_changed(file, contents)
             self._cmake_fragment_file = file
 
-            print(f"* CMake fragment file written to: {str(file)}\n")
+            if manifest is not None:
+                manifest[file.name] = (
+                    self.fragment_fingerprints[self.complete_config]
+                )
+                self.save_fragment_manifest(file.parent, manifest)
+
+            if written:
+                print(f"* CMake fragment file written to: {str(file)}\n")
+            else:
+                print(f"* CMake fragment file is unchanged: {str(file)}\n")
 
         return self._cmake_fragment_file
 
+    def get_shell_document(self):
+        """
+        Generates the configuration and gets everything ``gen-config.sh``
+        needs to run :class:`LoadEnv` and CMake with it, as ``bash``
+        assignments it can ``eval``.  For example:
+
+        .. highlight:: none
+        .. code-block::
+
+            cmake_args='-DMPI_EXEC_NUMPROCS_FLAG:STRING="-p"'
+            cmake_fragment=''
+            load_env_args=(--supported-systems /path/to/supported-systems.ini ... ats1_intel-hsw)
+
+        With the ``--cmake-fragment`` flag, the fragment file is written and
+        ``cmake_fragment`` is its path, while ``cmake_args`` is empty.
+        Otherwise, ``cmake_args`` is the :attr:`generated_config_flags_str`.
+        ``load_env_args`` is an array holding the :attr:`load_env_args`.
+
+        Returns:
+            str:  The assignments, one per line.
+        """
+        if self.args.cmake_fragment is not None:
+            cmake_args = ""
+            cmake_fragment = str(self.write_cmake_fragment())
+        else:
+            cmake_args = self.generated_config_flags_str
+            cmake_fragment = ""
+
+        return "".join([
+            f"cmake_args={shlex.quote(cmake_args)}\n",
+            f"cmake_fragment={shlex.quote(cmake_fragment)}\n",
+            "load_env_args=("
+            + " ".join(shlex.quote(_) for _ in self.load_env_args) + ")\n",
+        ])
+
+    def write_all_cmake_fragments(self):
+        """
+        Writes a CMake fragment file, ``<complete-config>.cmake``, for every
+        complete configuration :func:`list_configs` lists for this system (or,
+        with ``--all-systems``, for every system) to the directory specified
+        using the ``--output-dir`` flag, in a single run.  ``config-specs.ini``
+        is parsed and the sections used by the complete configurations are
+        validated only once.
+
+        If :attr:`args.jobs` allows more than one worker, the complete
+        configurations are split into chunks across a
+        :class:`ProcessPoolExecutor`.  Each worker writes the files of its
+        chunks itself and only returns their paths, so the option lists never
+        pile up in memory, and each worker evaluates every section used by its
+        chunks only once (see :class:`MemoizedSetProgramOptionsCMake`).  The
+        workers are started after ``config-specs.ini`` is parsed, so where
+        processes are forked they share the parsed data rather than parsing
+        the file again.
+
+        With ``--incremental``, only the fragments that are not
+        :func:`fragment_is_up_to_date` are written (and their sections
+        validated), e.g., after a change to one ``[KOKKOS-ARCH|...]``
+        section, only the fragments of the complete configurations using it.
+
+        Returns:
+            list:  The paths to the CMake fragment files written, in the order
+            the complete configurations appear in ``config-specs.ini``.
+
+        Raises:
+            ValueError:  If ``--output-dir`` was not specified.
+        """
+        if self.args.output_dir is None:
+            raise ValueError(self.get_formatted_msg(
+                "The --all-configs flag requires the --output-dir flag.",
+                extras="Please specify the directory to write the CMake "
+                       "fragment files to."
+            ))
+
+        complete_configs = self.__get_selected_complete_configs()
+
+        n_up_to_date = 0
+        manifest = None
+        if self.args.incremental:
+            manifest = self.load_fragment_manifest(self.args.output_dir)
+            all_configs = complete_configs
+            complete_configs = [
+                _ for _ in all_configs if not self.fragment_is_up_to_date(
+                    self.args.output_dir / f"{_}.cmake", _, manifest
+                )
+            ]
+            n_up_to_date = len(all_configs) - len(complete_configs)
+
+        self.__validate_complete_configs(complete_configs)
+
+        jobs = self.args.jobs if self.args.jobs > 0 else os.cpu_count()
+        jobs = min(jobs, len(complete_configs))
+        if jobs <= 1:
+            files = self.write_cmake_fragments(complete_configs)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            chunksize = max(1, len(complete_configs) // (jobs * 4))
+            chunks = [complete_configs[i:i + chunksize]
+                      for i in range(0, len(complete_configs), chunksize)]
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_cmake_fragment_worker,
+                initargs=(self.argv, self.gen_config_ini_file),
+            ) as executor:
+                files = [_ for chunk_files in
+                         executor.map(_write_cmake_fragments, chunks)
+                         for _ in chunk_files]
+
+        if manifest is not None:
+            for complete_config in complete_configs:
+                manifest[f"{complete_config}.cmake"] = (
+                    self.fragment_fingerprints[complete_config]
+                )
+            self.save_fragment_manifest(self.args.output_dir, manifest)
+
+        print(f"* {len(files)} CMake fragment files written to: "
+              f"{str(self.args.output_dir)}"
+              + (f" ({n_up_to_date} up to date)" if manifest is not None
+                 else "") + "\n")
+
+        return files
+
+    def __get_selected_complete_configs(self):
+        """
+        Gets the complete configurations :func:`list_configs` lists for this
+        system or, with ``--all-systems``, those of every system.
+
+        Returns:
+            list:  The names of the complete configurations, in the order
+            they appear in ``config-specs.ini``.
+        """
+        if self.args.all_systems:
+            return self.config_specs_graph.complete_configs
+
+        if self.load_env is None:
+            self.load_load_env()
+
+        return self.config_specs_graph.complete_configs_by_system.get(
+            self.load_env.system_name, []
+        )
+
+    def __validate_complete_configs(self, complete_configs):
+        """
+        Validates every section the given complete configurations use, unless
+        the whole of ``config-specs.ini`` was already validated.
+
+        Parameters:
+            complete_configs (list):  The names of the complete
+                configurations.
+        """
+        if self.has_been_validated or len(complete_configs) == 0:
+            return
+
+        used_sections = {}  # Ordered, unlike a set
+        for complete_config in complete_configs:
+            used_sections.update(dict.fromkeys(
+                self.config_specs_graph.get_reachable_sections(complete_config)
+            ))
+        self.validate_config_specs_ini(list(used_sections))
+
+    def write_cmake_presets(self):
+        """
+        Writes a ``CMakePresets.json`` file, where the path is specified using
+        the ``--cmake-presets`` flag, with a configure preset for every
+        complete configuration :func:`list_configs` lists for this system (or,
+        with ``--all-systems``, for every system), so that, once the
+        environment is loaded, ``cmake --preset <complete-config>`` configures
+        without running this tool.  Each preset sets the same cache variables
+        as the CMake fragment of its complete configuration, and the partial
+        sections they ``use`` become hidden presets they inherit (see
+        :class:`CMakePresets`).
+
+        The file records a fingerprint of the :attr:`tool_version` and the
+        :attr:`fragment_fingerprints` of the complete configurations, and is
+        only generated again when that changes, i.e., when the ``.ini``
+        files, this tool or :class:`SetProgramOptionsCMake` change in a way
+        that could affect it.  With ``--cmake-user-presets``, the file is also added to
+        the ``include`` list of the given ``CMakeUserPresets.json`` file.
+
+        Returns:
+            Path:  The path to the ``CMakePresets.json`` file.
+        """
+        from src.cmake_presets import CMakePresets
+        file = self.args.cmake_presets
+        complete_configs = self.__get_selected_complete_configs()
+        fingerprint = get_key_hash(
+            CMakePresets.VERSION, self.tool_version,
+            *[f"{_}:{self.fragment_fingerprints[_]}" for _ in complete_configs]
+        )
+
+        if CMakePresets.get_fingerprint(file) == fingerprint:
+            print(f"* CMake presets file is up to date: {str(file)}\n")
+        else:
+            self.__validate_complete_configs(complete_configs)
+            presets = CMakePresets()
+            visited = set()
+            for complete_config in complete_configs:
+                self.__add_cmake_preset(presets, complete_config,
+                                        set(complete_configs), visited)
+            write_file_if_changed(file, presets.to_json(fingerprint))
+            print(f"* CMake presets file with {len(complete_configs)} "
+                  f"configure presets written to: {str(file)}\n")
+
+        if self.args.cmake_user_presets is not None:
+            self.__include_in_cmake_user_presets(file)
+
+        return file
+
+    def __add_cmake_preset(self, presets, section, complete_configs, visited):
+        """
+        Adds the preset of a section to ``presets``, after those of the
+        sections it ``use`` s.  Partial sections become hidden presets,
+        unless they set nothing or cannot be evaluated on their own, in which
+        case the presets using them set their cache variables instead.
+
+        Parameters:
+            presets (CMakePresets):  The presets being built.
+            section (str):  The name of the section.
+            complete_configs (set):  The complete configurations to add
+                presets for that are not hidden.
+            visited (set):  The sections already added or skipped.
+
+        Raises:
+            ValueError:  If a complete configuration cannot be evaluated.
+        """
+        if section in visited:
+            return
+        visited.add(section)
+
+        uses = self.config_specs_graph.uses[section]
+        for used in uses:
+            self.__add_cmake_preset(presets, used, complete_configs, visited)
+        inherits = [_ for _ in uses if _ in presets]
+
+        from src.cmake_presets import CMakePresets
+        try:
+            cache_variables = CMakePresets.get_cache_variables(
+                self.get_option_list("cmake_fragment", section)
+            )
+        except ValueError:
+            if section in complete_configs:
+                raise
+            return
+
+        hidden = section not in complete_configs
+        if hidden and len(cache_variables) == 0 and len(inherits) == 0:
+            return
+
+        presets.add_preset(section, cache_variables, inherits=inherits,
+                           hidden=hidden)
+
+    def __include_in_cmake_user_presets(self, presets_file):
+        """
+        Adds a presets file to the ``include`` list of the
+        ``CMakeUserPresets.json`` file specified using the
+        ``--cmake-user-presets`` flag, creating it if needed, and leaving the
+        rest of its contents as they are.
+
+        Parameters:
+            presets_file (Path):  The presets file to include.
+
+        Raises:
+            ValueError:  If the ``CMakeUserPresets.json`` file is not valid
+            JSON.
+        """
+        file = self.args.cmake_user_presets
+        try:
+            with open(file, "r") as F:
+                user_presets = json.load(F)
+        except FileNotFoundError:
+            user_presets = {}
+        except ValueError:
+            raise ValueError(self.get_formatted_msg(
+                f"Unable to add an include to\n'{str(file)}'\nas it is not "
+                "valid JSON."
+            ))
+
+        # The include field requires version 4, i.e., CMake 3.23
+        user_presets["version"] = max(user_presets.get("version", 4), 4)
+        include = os.path.relpath(presets_file, file.parent)
+        includes = user_presets.setdefault("include", [])
+        if include not in includes:
+            includes.append(include)
+
+        if write_file_if_changed(file,
+                                 json.dumps(user_presets, indent=2) + "\n"):
+            print(f"* '{include}' included in: {str(file)}\n")
+
+    def write_cmake_fragments(self, complete_configs):
+        """
+        Writes the CMake fragment file of each of the given complete
+        configurations to ``<complete-config>.cmake`` in the directory
+        specified using the ``--output-dir`` flag.  Existing files are
+        replaced without asking, unless their contents would not change, in
+        which case they are left untouched (see
+        :func:`write_file_if_changed`).
+
+        Parameters:
+            complete_configs (list):  The names of the complete
+                configurations.
+
+        Returns:
+            list:  The paths to the CMake fragment files written.
+        """
+        files = []
+        for complete_config in complete_configs:
+            file = self.args.output_dir / f"{complete_config}.cmake"
+            write_file_if_changed(file, "\n".join(
+                self.get_option_list("cmake_fragment", complete_config)
+            ))
+            files.append(file)
+
+        return files
+
+    @property
+    def fragment_fingerprints(self):
+        """
+        A fingerprint for each complete configuration in ``config-specs.ini``
+        that changes whenever its CMake fragment could change, i.e., whenever
+        the section, any section it ``use`` s, the flag schema in
+        ``supported-config-flags.ini``, the :attr:`tool_version`, or the
+        :attr:`set_program_options_version` change.
+
+        Returns:
+            dict:  The complete configuration names and their fingerprints.
+        """
+        if not hasattr(self, "_fragment_fingerprints"):
+            schema_hash = get_file_hash(self.args.supported_config_flags_file)
+            graph = self.config_specs_graph
+            self._fragment_fingerprints = {
+                _: get_key_hash(self.FRAGMENT_FINGERPRINT_VERSION,
+                                self.tool_version,
+                                self.set_program_options_version,
+                                graph.get_chain_hash(_), schema_hash)
+                for _ in graph.complete_configs
+            }
+
+        return self._fragment_fingerprints
+
+    def fragment_is_up_to_date(self, file, complete_config, manifest):
+        """
+        Checks whether a CMake fragment file was written for the current
+        contents of a complete configuration.
+
+        Parameters:
+            file (Path):  The CMake fragment file.
+            complete_config (str):  The name of the complete configuration.
+            manifest (dict):  The manifest of the directory containing
+                ``file``; see :func:`load_fragment_manifest`.
+
+        Returns:
+            bool:  ``True`` if the file exists and its fingerprint in
+            ``manifest`` matches the one in :attr:`fragment_fingerprints`,
+            ``False`` otherwise.
+        """
+        fingerprint = self.fragment_fingerprints.get(complete_config)
+        return (fingerprint is not None and file.exists()
+                and manifest.get(file.name) == fingerprint)
+
+    def load_fragment_manifest(self, directory):
+        """
+        Loads the :attr:`FRAGMENT_MANIFEST_NAME` file of a directory of CMake
+        fragments.
+
+        Parameters:
+            directory (Path):  The directory of CMake fragments.
+
+        Returns:
+            dict:  The fragment file names and their fingerprints, which is
+            empty if the manifest is missing or unreadable.
+        """
+        try:
+            with open(directory / self.FRAGMENT_MANIFEST_NAME, "r") as F:
+                manifest = json.load(F)
+        except (OSError, ValueError):
+            return {}
+
+        return manifest if isinstance(manifest, dict) else {}
+
+    def save_fragment_manifest(self, directory, manifest):
+        """
+        Saves the :attr:`FRAGMENT_MANIFEST_NAME` file of a directory of CMake
+        fragments.
+
+        Parameters:
+            directory (Path):  The directory of CMake fragments.
+            manifest (dict):  The fragment file names and their fingerprints.
+        """
+        write_file_atomically(directory / self.FRAGMENT_MANIFEST_NAME,
+                              json.dumps(manifest, indent=2, sort_keys=True))
+
+    def get_option_list(self, generator, complete_config=None):
+        """
+        Gets the option list of a complete configuration, as
+        :func:`SetProgramOptionsCMake.gen_option_list` generates it.  If
+        ``config-specs.ini`` was compiled with ``--compile`` and has not
+        changed since, the option list is read from
+        :attr:`compiled_config_specs` instead of evaluating the section.
+
+        Parameters:
+            generator (str):  The generator to use, i.e., ``"bash"`` or
+                ``"cmake_fragment"``.
+            complete_config (str):  The name of the complete configuration.
+                Defaults to the :attr:`complete_config`.
+
+        Returns:
+            list:  The option list.
+        """
+        if complete_config is None:
+            complete_config = self.complete_config
+
+        if self.compiled_config_specs is not None:
+            option_list = self.compiled_config_specs.get_option_list(
+                complete_config, generator
+            )
+            if option_list is not None:
+                return option_list
+
+        if self.set_program_options is None:
+            self.load_set_program_options()
+
+        return self.set_program_options.gen_option_list(complete_config,
+                                                        generator)
+
+    def compile_config_specs(self):
+        """
+        Validates ``config-specs.ini``, then evaluates every complete
+        configuration in it for each of the
+        :attr:`CompiledConfigSpecs.GENERATORS`, and writes the results to the
+        :attr:`compiled_config_specs_file`.  Later runs then look up the
+        option lists of a complete configuration there (see
+        :func:`get_option_list`) until ``config-specs.ini`` changes.
+
+        Returns:
+            Path:  The path to the compiled file.
+
+        Raises:
+            ValueError:  If caching is disabled, as there is nowhere to write
+            the compiled file.
+        """
+        if self.compiled_config_specs_file is None:
+            raise ValueError(self.get_formatted_msg(
+                "Unable to compile config-specs.ini because caching is "
+                "disabled.",
+                extras="Unset GENCONFIG_CACHE_DIR or set it to a directory."
+            ))
+
+        self.validate_config_specs_ini()
+        # Validation is skipped when its stamp matches, without loading this
+        if self.set_program_options is None:
+            self.load_set_program_options()
+        from src.compiled_config_specs import CompiledConfigSpecs
+        spo = self.set_program_options
+        option_lists = {
+            section: {
+                generator: spo.gen_option_list(section, generator)
+                for generator in CompiledConfigSpecs.GENERATORS
+            } for section in self.config_specs_graph.complete_configs
+        }
+        write_file_atomically(
+            self.compiled_config_specs_file,
+            CompiledConfigSpecs.to_bytes(self.compiled_config_specs_key,
+                                         option_lists)
+        )
+        print(f"* Compiled {len(option_lists)} complete configurations to: "
+              f"{str(self.compiled_config_specs_file)}\n")
+
+        return self.compiled_config_specs_file
+
+    @property
+    def compiled_config_specs_file(self):
+        """
+        The file in :attr:`cache_dir` to which :func:`compile_config_specs`
+        writes the compiled ``config-specs.ini``.
+
+        Returns:
+            Path:  The path to the compiled file, or ``None`` if caching is
+            disabled.
+        """
+        if self.cache_dir is None:
+            return None
+
+        return (self.cache_dir / "compiled" /
+                f"config-specs-{get_key_hash(self.args.config_specs_file)}.bin")
+
+    @property
+    def compiled_config_specs_key(self):
+        """
+        A key that changes whenever the option lists compiled by
+        :func:`compile_config_specs` could change, i.e., whenever the
+        contents of ``config-specs.ini``, the :attr:`tool_version`, the
+        :attr:`set_program_options_version`, or the
+        :attr:`CompiledConfigSpecs.VERSION` change.
+
+        Returns:
+            str:  The key, stored in and compared with
+            :attr:`CompiledConfigSpecs.source_hash`.
+        """
+        if not hasattr(self, "_compiled_config_specs_key"):
+            from src.compiled_config_specs import CompiledConfigSpecs
+            self._compiled_config_specs_key = get_key_hash(
+                CompiledConfigSpecs.VERSION, self.tool_version,
+                self.set_program_options_version,
+                get_file_hash(self.args.config_specs_file)
+            )
+
+        return self._compiled_config_specs_key
+
+    @property
+    def compiled_config_specs(self):
+        """
+        The :class:`CompiledConfigSpecs` written by
+        :func:`compile_config_specs`, if it exists and its key matches the
+        current :attr:`compiled_config_specs_key`.  It stays open until
+        :func:`close` is called.
+
+        Returns:
+            CompiledConfigSpecs:  The compiled ``config-specs.ini``, or
+            ``None`` if there is no up-to-date one.
+        """
+        if not hasattr(self, "_compiled_config_specs"):
+            self._compiled_config_specs = None
+            if self.compiled_config_specs_file is not None:
+                from src.compiled_config_specs import CompiledConfigSpecs
+                try:
+                    compiled = CompiledConfigSpecs(
+                        self.compiled_config_specs_file
+                    )
+                except (OSError, ValueError):
+                    compiled = None
+
+                if (compiled is not None and compiled.source_hash
+                        == self.compiled_config_specs_key):
+                    self._compiled_config_specs = compiled
+                elif compiled is not None:
+                    compiled.close()
+
+        return self._compiled_config_specs
+
+    def close(self):
+        """
+        Closes the :attr:`compiled_config_specs`, if it was opened.  It is
+        opened again if needed afterwards.
+        """
+        if hasattr(self, "_compiled_config_specs"):
+            if self._compiled_config_specs is not None:
+                self._compiled_config_specs.close()
+            del self._compiled_config_specs
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def list_config_flags(self):
         """
         List the available config flags from ``supported-config-flags.ini``.
@@ -251,19 +839,27 @@ class GenConfig(FormattedMsg):
             |   See /path/to/GenConfig/ini_files/supported-config-flags.ini for details.
             +==============================================================================+
 
+        The message is cached until ``supported-config-flags.ini`` changes; see
+        :func:`print_cached_msg`.
+
         Raises:
             SystemExit:  With the message displaying the available config flags
                 from which to choose.
         """
-        # This should be defined already via validate_config_specs_ini, which
-        # comes before this in main(). Don't include in branch coverage, as
-        # it's just a safety check.
-        if self.config_keyword_parser is None:               # pragma: no cover
-            self.load_config_keyword_parser()
+        def get_msg():
+            # This should be defined already via validate_config_specs_ini,
+            # which comes before this in main(). Don't include in branch
+            # coverage, as it's just a safety check.
+            if self.config_keyword_parser is None:           # pragma: no cover
+                self.load_config_keyword_parser()
 
-        print(self.config_keyword_parser.get_msg_showing_supported_flags(
-            "Please select options from the following.",
-            kind="INFO"))
+            return self.config_keyword_parser.get_msg_showing_supported_flags(
+                "Please select options from the following.",
+                kind="INFO")
+
+        flags_file = self.args.supported_config_flags_file
+        self.print_cached_msg("list-config-flags", get_msg,
+                              flags_file, get_file_hash(flags_file))
         sys.exit(0)
 
     def list_configs(self):
@@ -286,6 +882,9 @@ class GenConfig(FormattedMsg):
             |
             +==============================================================================+
 
+        The message is cached until ``config-specs.ini`` changes; see
+        :func:`print_cached_msg`.
+
         Raises:
             SystemExit:  With the message displaying the available complete
                 configs from which to choose.
@@ -295,18 +894,185 @@ class GenConfig(FormattedMsg):
 
         sys_name = self.load_env.system_name
 
-        config_specs = ConfigParserEnhanced(
-            self.args.config_specs_file
-        ).configparserenhanceddata
-        complete_configs = [_ for _ in config_specs.sections()
-                            if _.startswith(sys_name)]
+        def get_msg():
+            complete_configs = (
+                self.config_specs_graph.complete_configs_by_system.get(
+                    sys_name, []
+                )
+            )
+
+            return self.get_msg_for_list(
+                "Please select one of the following complete configurations "
+                f"from\n{str(self.args.config_specs_file)}\n\n",
+                complete_configs, kind="INFO", extras="\n")
 
-        print(self.get_msg_for_list(
-            "Please select one of the following complete configurations from\n"
-            f"{str(self.args.config_specs_file)}\n\n", complete_configs,
-            kind="INFO", extras="\n"))
+        config_specs_file = self.args.config_specs_file
+        self.print_cached_msg("list-configs", get_msg, config_specs_file,
+                              get_file_hash(config_specs_file), sys_name)
         sys.exit(0)
 
+    def print_cached_msg(self, name, get_msg, *key_parts):
+        """
+        Prints the message returned by ``get_msg``, caching it in
+        :attr:`cache_dir` so that repeated calls with the same ``name`` and
+        ``key_parts`` print it straight from the cache file without calling
+        ``get_msg`` at all.  This is used by :func:`list_config_flags` and
+        :func:`list_configs`, whose messages are expensive to build for large
+        ``.ini`` files.
+
+        Parameters:
+            name (str):  A name for the kind of message being printed.
+            get_msg (callable):  Builds the message when it is not cached.
+            key_parts:  Everything the message depends on, e.g., the paths and
+                hashes (see :func:`get_file_hash`) of the ``.ini`` files used
+                to build it.
+        """
+        cache_file = None
+        if self.cache_dir is not None:
+            cache_file = (self.cache_dir / "messages" /
+                          f"{name}-{get_key_hash(name, *key_parts)}.txt")
+            try:
+                with open(cache_file, "r") as F:
+                    shutil.copyfileobj(F, sys.stdout)
+                return
+            except OSError:
+                pass
+
+        msg = get_msg() + "\n"
+        sys.stdout.write(msg)
+
+        if cache_file is not None:
+            try:
+                write_file_atomically(cache_file, msg)
+            except OSError:
+                pass
+
+    def canonicalize_build_names(self, input_stream=None, output_stream=None):
+        """
+        Reads build names from ``input_stream``, one per line, and writes one
+        line of JSON to ``output_stream`` for each as soon as it is read.  The
+        line contains the build name and either the matching complete
+        configuration (see :attr:`complete_config`) or the error encountered
+        while matching it:
+
+        .. code-block:: none
+
+            {"build_name": "ats1_intel-hsw_sparc", "complete_config": "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_sparc"}
+            {"build_name": "ats1_intel-hsw_bad", "error": "..."}
+
+        This allows any number of build names to be resolved by a single
+        process, with the ``.ini`` files loaded only once.  Build names are
+        matched against ``supported-config-flags.ini`` and the
+        :class:`LoadEnv` ``.ini`` files; ``config-specs.ini`` itself is only
+        validated if ``--validate`` is also given.
+
+        Parameters:
+            input_stream (file):  Where to read build names from.  Defaults to
+                ``sys.stdin``.
+            output_stream (file):  Where to write the results to.  Defaults to
+                ``sys.stdout``.
+        """
+        input_stream = sys.stdin if input_stream is None else input_stream
+        output_stream = sys.stdout if output_stream is None else output_stream
+
+        if self.load_env is None:
+            self.load_load_env()
+        if self.config_keyword_parser is None:
+            self.load_config_keyword_parser()
+
+        le = self.load_env
+        ckp = self.config_keyword_parser
+        le.silent = True
+        for line in iter(input_stream.readline, ""):
+            build_name = line.strip()
+            if build_name == "":
+                continue
+
+            result = {"build_name": build_name}
+            # Keep LoadEnv's diagnostic messages out of the output stream
+            with redirect_stdout(io.StringIO()) as diagnostics:
+                try:
+                    le.build_name = build_name
+                    ckp.build_name = le.env_stripped_build_name
+                    result["complete_config"] = (
+                        f"{le.parsed_env_name}{ckp.selected_options_str}"
+                    )
+                except ValueError as e:
+                    result["error"] = str(e).strip()
+                except SystemExit as e:
+                    result["error"] = (e.code if isinstance(e.code, str)
+                                       else diagnostics.getvalue()).strip()
+
+            output_stream.write(json.dumps(result) + "\n")
+            output_stream.flush()
+
+        le.build_name = self.args.build_name
+        ckp.build_name = le.env_stripped_build_name
+        le.silent = False
+
+    def print_affected_configs(self, output_stream=None):
+        """
+        Writes the complete configurations that are affected by a change,
+        one per line, in the order they appear in ``config-specs.ini``, so
+        that only those need to be rebuilt.  The change is either:
+
+            * ``--affected-by SECTION``:  A change to any of the given
+              sections of ``config-specs.ini``.
+            * ``--affected-by-diff OLD NEW``:  The differences between two
+              versions of ``config-specs.ini``.  This lists the complete
+              configurations in ``NEW`` that reach an added, removed or
+              changed section through ``use`` operations in either version.
+
+        See :func:`ConfigSpecsGraph.get_affected_complete_configs`.
+
+        Parameters:
+            output_stream (file):  Where to write the complete configurations.
+                Defaults to ``sys.stdout``.
+
+        Raises:
+            ValueError:  If a section given with ``--affected-by`` is not in
+            ``config-specs.ini``.
+        """
+        output_stream = sys.stdout if output_stream is None else output_stream
+
+        if self.args.affected_by_diff is not None:
+            from src.config_specs_graph import ConfigSpecsGraph
+            old_graph, new_graph = [
+                ConfigSpecsGraph(get_parsed_ini(_).configparserdata)
+                for _ in self.args.affected_by_diff
+            ]
+            changed_sections = new_graph.get_changed_sections(old_graph)
+            affected = (
+                set(new_graph.get_affected_complete_configs(changed_sections))
+                | set(old_graph.get_affected_complete_configs(changed_sections))
+            )
+            affected_configs = [_ for _ in new_graph.complete_configs
+                                if _ in affected]
+        else:
+            graph = self.config_specs_graph
+            missing_sections = [_ for _ in self.args.affected_by
+                                if _ not in graph.used_by]
+            if len(missing_sections) > 0:
+                from src.suggestion_index import SuggestionIndex
+                suggestions = SuggestionIndex(graph.sections).get_suggestions(
+                    missing_sections[0]
+                )
+                msg = ("The following section(s) were not found in\n"
+                       f"'{str(self.args.config_specs_file)}':\n\n"
+                       + "\n".join(f"-  {_}" for _ in missing_sections))
+                if len(suggestions) > 0:
+                    msg += ("\n\nThe closest sections to "
+                            f"'{missing_sections[0]}' are:")
+                raise ValueError(self.get_msg_for_list(msg, suggestions))
+
+            affected_configs = graph.get_affected_complete_configs(
+                self.args.affected_by
+            )
+
+        for config in affected_configs:
+            output_stream.write(config + "\n")
+        output_stream.flush()
+
     @property
     def complete_config(self):
         """
@@ -340,19 +1106,112 @@ class GenConfig(FormattedMsg):
 
         return self._complete_config
 
-    def validate_config_specs_ini(self):
+    def assert_complete_config_exists(self):
+        """
+        Ensures the :attr:`complete_config` matched for the build name is a
+        section in ``config-specs.ini``.  If not, the closest complete
+        configurations are suggested, as found by
+        :attr:`complete_config_suggestion_index`.
+
+        Raises:
+            ValueError:  If the :attr:`complete_config` is not found.
+        """
+        if (self.compiled_config_specs is not None
+                and self.complete_config in self.compiled_config_specs):
+            return
+
+        if self.set_program_options is None:
+            self.load_set_program_options()
+
+        config_specs = self.set_program_options.configparserenhanceddata
+        if config_specs.has_section(self.complete_config):
+            return
+
+        suggestions = self.complete_config_suggestion_index.get_suggestions(
+            self.complete_config
+        )
+        msg = ("The complete configuration\n"
+               f"'{self.complete_config}'\n"
+               "matched for your build name was not found in\n"
+               f"'{str(self.args.config_specs_file)}'.")
+        if len(suggestions) > 0:
+            msg += "\n\nThe closest complete configurations are:"
+        raise ValueError(self.get_msg_for_list(
+            msg, suggestions, extras=("\nRun with --list-configs to see all "
+                                      "complete configurations.")
+        ))
+
+    @property
+    def complete_config_suggestion_index(self):
+        """
+        A :class:`SuggestionIndex` of the complete configurations (i.e., the
+        sections that are not ALL-CAPS) in ``config-specs.ini``, used to
+        suggest alternatives when a build name does not match any of them.
+
+        Returns:
+            SuggestionIndex:  The index of complete configurations.
+        """
+        if not hasattr(self, "_complete_config_suggestion_index"):
+            from src.suggestion_index import SuggestionIndex
+            self._complete_config_suggestion_index = SuggestionIndex(
+                self.config_specs_graph.complete_configs
+            )
+
+        return self._complete_config_suggestion_index
+
+    def validate_config_specs_ini(self, section_names=None):
         """
         Runs validation methods to ensure ``config-specs.ini`` has properly
         formatted section names and properly handled operations. For more
         information on these, see
         :func:`validate_config_specs_ini_section_names` and
         :func:`validate_config_specs_ini_operations`.
+
+        If the whole file was validated with the same ``.ini`` files and the
+        same version of this tool before, validation is skipped entirely; see
+        :attr:`validation_stamp`.  Otherwise, sections that have not changed
+        since the last successful validation are skipped; see
+        :attr:`validated_sections`.
+
+        Parameters:
+            section_names (list):  Only validate these sections.  Defaults to
+                every section in the file.
         """
-        self.validate_config_specs_ini_section_names()
-        self.validate_config_specs_ini_operations()
+        if self.validation_stamp_matches():
+            self.has_been_validated = True
+            return
+
+        self.validate_config_specs_ini_section_names(section_names)
+        self.validate_config_specs_ini_operations(section_names)
         self.has_been_validated = True
+        self.save_validated_sections(section_names)
+        if section_names is None:
+            self.write_validation_stamp()
+
+    def validate_complete_config(self):
+        """
+        Validates only the sections of ``config-specs.ini`` that the
+        :attr:`complete_config` depends on, i.e., its own section and every
+        section it reaches through ``use`` operations (see
+        :func:`ConfigSpecsGraph.get_reachable_sections`).  This is all that
+        is needed to generate the configuration for one build name; the
+        whole file is validated with ``--validate``.
+
+        Raises:
+            ValueError:  If the :attr:`complete_config` is not found, or if
+            any of its sections are invalid.
+        """
+        self.assert_complete_config_exists()
+        if self.validation_stamp_matches():
+            # Skip building the config_specs_graph too
+            self.has_been_validated = True
+            return
+
+        self.validate_config_specs_ini(
+            self.config_specs_graph.get_reachable_sections(self.complete_config)
+        )
 
-    def validate_config_specs_ini_section_names(self):
+    def validate_config_specs_ini_section_names(self, section_names=None):
         """
         Validates each section in ``config-specs.ini`` to ensure the format is
         correct.
@@ -384,68 +1243,42 @@ class GenConfig(FormattedMsg):
               rhel7_cee-cuda-10.1.243-gnu-7.2.0-openmpi-4.0.3_release_shared_Volta70_no-asan_no-complex_no-fpic_mpi_no-pt_no-rdc_no-package-enables
             # ^_____________________________________________^^____________________________________________________________________________________^
             #           LoadEnv.parsed_env_name               ConfigKeywordParser.selected_options_str
+
+        Parameters:
+            section_names (list):  Only validate these sections.  Defaults to
+                every section in the file.
         """
         if self.load_env is None:
             self.load_load_env()
         if self.config_keyword_parser is None:
             self.load_config_keyword_parser()
 
-        ckp = self.config_keyword_parser
         le = self.load_env
         le.args.force = True
         le.silent = True
-        config_specs = ConfigParserEnhanced(
-            self.args.config_specs_file
-        ).configparserenhanceddata
-        supported_systems = [x for x in le.supported_systems_data]
+        validated_sections = self.validated_sections
+        sections_to_validate = (set(section_names)
+                                if section_names is not None else None)
+        section_names = [
+            # ALL-CAPS sections are just supporting sections, so aren't
+            # complete configs, and unchanged sections were checked when they
+            # were last validated.
+            _ for _ in self.config_specs_graph.complete_configs
+            if _ not in validated_sections
+            and (sections_to_validate is None or _ in sections_to_validate)
+        ]
 
         invalid_sections = []
         sections_with_invalid_systems = []
-        for section_name in config_specs.keys():
-            if section_name.upper() == section_name:
-                continue  # This is just a supporting section
-
-            le.build_name = section_name
-
-            invalid_sys_name = False
-            try:
-                # Will not raise if a valid system name is found in the section
-                # name OR if the current hostname matches a system name.
-                ckp.build_name = le.env_stripped_build_name
-            except SystemExit:  # pragma: no cover
-                invalid_sys_name = True
-
-            # This will catch valid hostname but invalid section name
-            system_name = section_name.split("_")[0]
-            invalid_sys_name = (True
-                                if system_name not in supported_systems
-                                else invalid_sys_name)
-
-            if invalid_sys_name:
+        formatted_section_names = self.__get_formatted_section_names(
+            section_names
+        )
+        for section_name, formatted_section_name in zip(
+            section_names, formatted_section_names
+        ):
+            if formatted_section_name is None:
                 sections_with_invalid_systems.append(section_name)
-                continue
-
-            try:
-                selected_options_str = ckp.selected_options_str
-            except ValueError as e:                                     # pragma: no cover
-                # Don't require coverage of this, as this block of code only
-                # exists to give context to any potential ValueErrors in
-                # ConfigKeywordParser.
-                raise ValueError(self.get_formatted_msg(
-                    "When validating sections in\n"
-                    f"`{self.args.config_specs_file.name}`,\n"
-                    "the following error was encountered for the section name\n"
-                    "`{section_name}`:\n"
-                    f"{str(e)}"
-                ))
-
-            # Silences the LoadEnv diagnostic messages for all the section name
-            # matching (i.e. "Matched environment name ...")
-            with redirect_stdout(io.StringIO()):
-                formatted_section_name = (
-                    f"{le.parsed_env_name}{selected_options_str}"
-                )
-            if formatted_section_name != section_name:
+            elif formatted_section_name != section_name:
                 invalid_sections.append((section_name, formatted_section_name))
 
         if len(invalid_sections) > 0:
@@ -484,21 +1317,434 @@ class GenConfig(FormattedMsg):
         self.config_keyword_parser.build_name = self.load_env.env_stripped_build_name
         self.load_env.silent = False
 
-    def validate_config_specs_ini_operations(self):
+    def __get_formatted_section_names(self, section_names):
+        """
+        Gets the result of :func:`get_formatted_section_name` for each section
+        name.  If :attr:`args.jobs` allows more than one worker, the sections
+        are split across a :class:`ProcessPoolExecutor`, in which each worker
+        process loads its own :class:`LoadEnv` and
+        :class:`ConfigKeywordParser`.
+
+        Parameters:
+            section_names (list):  The section names to format.
+
+        Returns:
+            list:  The formatted section names, in the same order as
+            ``section_names``.
+
+        Raises:
+            ValueError:  The error for the first section, in the order of
+            ``section_names``, that cannot be parsed.
+        """
+        jobs = self.args.jobs if self.args.jobs > 0 else os.cpu_count()
+        jobs = min(jobs, len(section_names))
+        if jobs <= 1:
+            supported_systems = [x for x in self.load_env.supported_systems_data]
+            return [
+                self.get_formatted_section_name(_, supported_systems)
+                for _ in section_names
+            ]
+
+        # Results come back in the order they were submitted, so the first
+        # error raised is always that of the first bad section, no matter
+        # which worker finishes first.
+        from concurrent.futures import ProcessPoolExecutor
+        chunksize = max(1, len(section_names) // (jobs * 4))
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_section_name_worker,
+            initargs=(self.argv, self.gen_config_ini_file),
+        ) as executor:
+            return list(executor.map(_get_formatted_section_name,
+                                     section_names, chunksize=chunksize))
+
+    def get_formatted_section_name(self, section_name, supported_systems):
+        """
+        Formats a section name of ``config-specs.ini`` the way
+        :func:`validate_config_specs_ini_section_names` requires it to be.
+        This assumes :attr:`load_env` is forced and silent, as it is during
+        validation.
+
+        Parameters:
+            section_name (str):  The section name to format.
+            supported_systems (list):  The systems in
+                ``supported-systems.ini``.
+
+        Returns:
+            str:  The formatted section name, or ``None`` if the section name
+            does not start with a supported system.
+
+        Raises:
+            ValueError:  If the options in the section name cannot be parsed.
+        """
+        ckp = self.config_keyword_parser
+        le = self.load_env
+        le.build_name = section_name
+
+        invalid_sys_name = False
+        try:
+            # Will not raise if a valid system name is found in the section
+            # name OR if the current hostname matches a system name.
+            ckp.build_name = le.env_stripped_build_name
+        except SystemExit:  # pragma: no cover
+            invalid_sys_name = True
+
+        # This will catch valid hostname but invalid section name
+        from src.config_specs_graph import ConfigSpecsGraph
+        system_name = ConfigSpecsGraph.get_system_name(section_name)
+        invalid_sys_name = (True
+                            if system_name not in supported_systems
+                            else invalid_sys_name)
+
+        if invalid_sys_name:
+            return None
+
+        try:
+            selected_options_str = ckp.selected_options_str
+        except ValueError as e:                                     # pragma: no cover
+            # Don't require coverage of this, as this block of code only
+            # exists to give context to any potential ValueErrors in
+            # ConfigKeywordParser.
+            raise ValueError(self.get_formatted_msg(
+                "When validating sections in\n"
+                f"`{self.args.config_specs_file.name}`,\n"
+                "the following error was encountered for the section name\n"
+                "`{section_name}`:\n"
+                f"{str(e)}"
+            ))
+
+        # Silences the LoadEnv diagnostic messages for all the section name
+        # matching (i.e. "Matched environment name ...")
+        with redirect_stdout(io.StringIO()):
+            return f"{le.parsed_env_name}{selected_options_str}"
+
+    def validate_config_specs_ini_operations(self, section_names=None):
         """
         Uses the :class:`ConfigParserEnhanced` method
-        :func:`assert_file_all_sections_handled` to make sure all operations
-        within the ``config-specs.ini`` file have corresponding handlers to be
-        processed with :class:`SetProgramOptionsCMake`.
+        :func:`assert_section_all_options_handled` to make sure all operations
+        within the sections of the ``config-specs.ini`` file that are not in
+        :attr:`validated_sections` have corresponding handlers to be
+        processed with :class:`SetProgramOptionsCMake`.  If any do not,
+        :func:`assert_file_all_sections_handled` reports them all.
+
+        Also makes sure no sections ``use`` each other in a cycle (see
+        :func:`ConfigSpecsGraph.find_use_cycle`).
+
+        Parameters:
+            section_names (list):  Only validate these sections.  Defaults to
+                every section in the file.
         """
         if self.set_program_options is None:
             self.load_set_program_options()
 
-        # Raise an exception if the .ini file has any unhandled entries
+        cycle = self.config_specs_graph.find_use_cycle()
+        if cycle is not None:
+            raise ValueError(self.get_formatted_msg(
+                "The following sections in\n"
+                f"'{self.args.config_specs_file.name}'\n"
+                "`use` each other in a cycle:\n\n" + " -> ".join(cycle),
+                extras="Please remove one of these `use` operations."
+            ))
+
+        # Only check the sections changed since they were last validated, and
+        # if any of them have unhandled entries, check the whole file to raise
+        # an exception listing all of them.
         # Note: If `set_program_options.exception_control_level` is
         #       2 or less then `ValueError` will not be raised but
         #       rather `set_program_options` will return a nonzero value.
-        self.set_program_options.assert_file_all_sections_handled()
+        spo = self.set_program_options
+        validated_sections = self.validated_sections
+        sections_to_validate = (set(section_names)
+                                if section_names is not None else None)
+        for section_name in spo.configparserenhanceddata.sections(parse=False):
+            if section_name in validated_sections:
+                continue
+            if (sections_to_validate is not None
+                    and section_name not in sections_to_validate):
+                continue
+            if spo.assert_section_all_options_handled(section_name,
+                                                      do_raise=False) != 0:
+                spo.assert_file_all_sections_handled()
+                break
+
+    @property
+    def config_specs_graph(self):
+        """
+        The :class:`ConfigSpecsGraph` describing how the sections of
+        ``config-specs.ini`` ``use`` one another, and which complete
+        configurations it has for each system.  It is built once from the
+        raw ``config-specs.ini`` data and shared by listing, suggestions and
+        validation, as well as by every other object in this process using
+        the same file (see :func:`get_derived_object`).
+        """
+        if not hasattr(self, "_config_specs_graph"):
+            from src.config_specs_graph import ConfigSpecsGraph
+
+            def build_config_specs_graph():
+                if self.set_program_options is None:
+                    self.load_set_program_options()
+                return ConfigSpecsGraph(
+                    self.set_program_options.configparserdata
+                )
+
+            self._config_specs_graph = get_derived_object(
+                "ConfigSpecsGraph", [self.args.config_specs_file],
+                build_config_specs_graph
+            )
+
+        return self._config_specs_graph
+
+    @property
+    def section_validation_keys(self):
+        """
+        A key for each section in ``config-specs.ini`` that changes whenever
+        the result of validating that section could change, i.e., whenever
+        the section, any section it ``use`` s, ``supported-config-flags.ini``,
+        any of the :class:`LoadEnv` ``.ini`` files, or the
+        :attr:`tool_version` change.
+
+        Returns:
+            dict:  The section names and their keys.
+        """
+        if not hasattr(self, "_section_validation_keys"):
+            ini_file_hashes = get_file_hashes([
+                self.args.supported_config_flags_file,
+                self.args.supported_systems_file,
+                self.args.supported_envs_file,
+                self.args.environment_specs_file,
+            ], self.file_hashes_file)
+            graph = self.config_specs_graph
+            self._section_validation_keys = {
+                _: get_key_hash(self.VALIDATION_CACHE_VERSION,
+                                self.tool_version, graph.get_chain_hash(_),
+                                *ini_file_hashes)
+                for _ in graph.sections
+            }
+
+        return self._section_validation_keys
+
+    @property
+    def validation_cache_file(self):
+        """
+        The file in :attr:`cache_dir` recording the
+        :attr:`section_validation_keys` from the last time
+        ``config-specs.ini`` was successfully validated.
+
+        Returns:
+            Path:  The path to the cache file, or ``None`` if caching is
+            disabled.
+        """
+        if self.cache_dir is None:
+            return None
+
+        return (self.cache_dir / "validation" /
+                f"config-specs-{get_key_hash(self.args.config_specs_file)}.json")
+
+    @property
+    def validated_sections(self):
+        """
+        The sections in ``config-specs.ini`` that have not changed since they
+        were last successfully validated (see
+        :attr:`section_validation_keys`), and so can be skipped by
+        :func:`validate_config_specs_ini_section_names` and
+        :func:`validate_config_specs_ini_operations`.
+
+        Returns:
+            set:  The names of the sections that need no validation.
+        """
+        if not hasattr(self, "_validated_sections"):
+            self._validated_sections = set()
+            if self.validation_cache_file is not None:
+                try:
+                    with open(self.validation_cache_file, "r") as F:
+                        cached_keys = json.load(F)["sections"]
+                except (OSError, ValueError, KeyError, TypeError):
+                    cached_keys = {}
+
+                self._validated_sections = {
+                    section for section, key
+                    in self.section_validation_keys.items()
+                    if cached_keys.get(section) == key
+                }
+
+        return self._validated_sections
+
+    def save_validated_sections(self, section_names=None):
+        """
+        Records the :attr:`section_validation_keys` in the
+        :attr:`validation_cache_file` after a successful
+        :func:`validate_config_specs_ini`, so the next run only needs to
+        validate the sections that change in the meantime.  Failing to write
+        the file is not an error.
+
+        Parameters:
+            section_names (list):  The sections that were just validated,
+                which are recorded along with the :attr:`validated_sections`.
+                Defaults to every section in the file.
+        """
+        if self.validation_cache_file is None:
+            return
+
+        section_validation_keys = self.section_validation_keys
+        if section_names is not None:
+            validated_sections = self.validated_sections | set(section_names)
+            section_validation_keys = {
+                section: key for section, key in section_validation_keys.items()
+                if section in validated_sections
+            }
+
+        try:
+            write_file_atomically(self.validation_cache_file, json.dumps(
+                {"sections": section_validation_keys}
+            ))
+        except OSError:
+            pass
+
+    @property
+    def file_hashes_file(self):
+        """
+        The file in :attr:`cache_dir` recording the hash of each file hashed
+        with :func:`get_file_hashes`, so unchanged files are not read again
+        on later runs.
+
+        Returns:
+            Path:  The path to the file, or ``None`` if caching is disabled.
+        """
+        if self.cache_dir is None:
+            return None
+
+        return self.cache_dir / "file-hashes.json"
+
+    @property
+    def tool_version(self):
+        """
+        A key that changes whenever the contents of the source of this tool
+        (``gen_config.py`` and ``src/*.py``) change, which stands in for a
+        version number in the keys of what is cached between runs.  It is
+        the same for every checkout of the same source.
+
+        Returns:
+            str:  The tool version.
+        """
+        if not hasattr(self, "_tool_version"):
+            tool_dir = Path(os.path.realpath(__file__)).parent
+            files = [tool_dir / "gen_config.py",
+                     *sorted((tool_dir / "src").glob("*.py"))]
+            self._tool_version = get_key_hash(
+                *[_.name for _ in files],
+                *get_file_hashes(files, self.file_hashes_file)
+            )
+
+        return self._tool_version
+
+    @property
+    def set_program_options_version(self):
+        """
+        A key that changes whenever the contents of the source of
+        :class:`SetProgramOptionsCMake`, or of the
+        :class:`ConfigParserEnhanced` it builds on, change, so option lists
+        generated by an older version are not reused.  The packages are
+        found without being imported.
+
+        Returns:
+            str:  The SetProgramOptionsCMake version.
+        """
+        if not hasattr(self, "_set_program_options_version"):
+            files = []
+            for package in ["setprogramoptions", "configparserenhanced"]:
+                spec = importlib.util.find_spec(package)
+                if spec is None or spec.origin is None:
+                    continue
+                elif spec.submodule_search_locations is not None:
+                    files += sorted(Path(spec.origin).parent.glob("*.py"))
+                else:
+                    files.append(Path(spec.origin))
+
+            self._set_program_options_version = get_key_hash(
+                *[_.name for _ in files],
+                *get_file_hashes(files, self.file_hashes_file)
+            )
+
+        return self._set_program_options_version
+
+    @property
+    def validation_stamp(self):
+        """
+        A key that changes whenever the result of validating the whole of
+        ``config-specs.ini`` could change, i.e., whenever the contents of
+        any of the five ``.ini`` files or the :attr:`tool_version` change.
+        Since it only depends on contents, a stamp written by one checkout
+        of the ``.ini`` files, e.g., in a CI job, matches in every other
+        checkout sharing the :attr:`cache_dir`.
+
+        Returns:
+            str:  The validation stamp.
+        """
+        if not hasattr(self, "_validation_stamp"):
+            files = [
+                self.args.config_specs_file,
+                self.args.supported_config_flags_file,
+                self.args.supported_systems_file,
+                self.args.supported_envs_file,
+                self.args.environment_specs_file,
+            ]
+            self._validation_stamp = get_key_hash(
+                self.VALIDATION_CACHE_VERSION, self.tool_version,
+                *get_file_hashes(files, self.file_hashes_file)
+            )
+
+        return self._validation_stamp
+
+    @property
+    def validation_stamp_file(self):
+        """
+        The file in :attr:`cache_dir` recording the :attr:`validation_stamp`
+        from the last time the whole of ``config-specs.ini`` was
+        successfully validated.
+
+        Returns:
+            Path:  The path to the stamp file, or ``None`` if caching is
+            disabled.
+        """
+        if self.cache_dir is None:
+            return None
+
+        return (self.cache_dir / "validation" /
+                f"config-specs-{get_key_hash(self.args.config_specs_file)}.stamp")
+
+    def validation_stamp_matches(self):
+        """
+        Checks whether the :attr:`validation_stamp_file` records the current
+        :attr:`validation_stamp`, in which case every section of
+        ``config-specs.ini`` is known to be valid.
+
+        Returns:
+            bool:  ``True`` if validation can be skipped entirely.
+        """
+        if self.validation_stamp_file is None:
+            return False
+
+        try:
+            with open(self.validation_stamp_file, "r") as F:
+                return F.read() == self.validation_stamp
+        except OSError:
+            return False
+
+    def write_validation_stamp(self):
+        """
+        Writes the :attr:`validation_stamp` to the
+        :attr:`validation_stamp_file` after the whole of
+        ``config-specs.ini`` is successfully validated.  Failing to write the
+        file is not an error.
+        """
+        if self.validation_stamp_file is None:
+            return
+
+        try:
+            write_file_atomically(self.validation_stamp_file,
+                                  self.validation_stamp)
+        except OSError:
+            pass
 
     def load_config_keyword_parser(self):
         """
@@ -509,28 +1755,50 @@ class GenConfig(FormattedMsg):
         if self.load_env is None:
             self.load_load_env()
 
+        from src.config_keyword_parser import ConfigKeywordParser
         self.config_keyword_parser = ConfigKeywordParser(
             self.load_env.env_stripped_build_name,
             self.args.supported_config_flags_file,
+            schema_cache_dir=self.cache_dir,
         )
 
     def load_set_program_options(self):
         """
-        Instantiate a :class:`SetProgramOptions` object with this object's
-        ``config-specs.ini``.  Save the resulting object to
-        ``self.set_program_options``.
+        Get the :class:`MemoizedSetProgramOptionsCMake` object for this
+        object's ``config-specs.ini``, which is shared with any other object
+        in this process using the same file (see :func:`get_parsed_ini`).
+        Save the resulting object to ``self.set_program_options``.
         """
-        self.set_program_options = SetProgramOptionsCMake(
-            filename=self.args.config_specs_file
+        from src.memoized_set_program_options import \
+            MemoizedSetProgramOptionsCMake
+        self.set_program_options = get_parsed_ini(
+            self.args.config_specs_file, MemoizedSetProgramOptionsCMake
         )
         self.set_program_options.exception_control_level = 4
 
     def load_load_env(self):
         """
         Instantiate a :class:`LoadEnv` object with this object's configuration
-        files. Save the resulting object to ``self.load_env``.
+        files. Save the resulting object to ``self.load_env``.  With
+        :attr:`share_load_env`, the object loaded for the same files and
+        options by an earlier :class:`GenConfig` is reused instead, with its
+        build name set to this object's.
         """
-        self.load_env = LoadEnv(argv=self.load_env_args)
+        from LoadEnv.load_env import LoadEnv
+        if not self.share_load_env:
+            self.load_env = LoadEnv(argv=self.load_env_args)
+            return
+
+        # Everything but the build name
+        options = tuple(self.load_env_args[:-1])
+        self.load_env = get_derived_object(
+            ("LoadEnv", options),
+            [self.args.supported_systems_file, self.args.supported_envs_file,
+             self.args.environment_specs_file],
+            lambda: LoadEnv(argv=self.load_env_args)
+        )
+        self.load_env.build_name = self.args.build_name
+        self.load_env.silent = False
 
     @property
     def load_env_args(self):
@@ -549,15 +1817,50 @@ class GenConfig(FormattedMsg):
 
         return argv
 
+    @property
+    def cache_dir(self):
+        """
+        The directory in which data derived from the ``.ini`` files is cached
+        between runs, e.g., the compiled flag schema of
+        :class:`ConfigKeywordParser`.  This is, in order of precedence:
+
+            1. ``$GENCONFIG_CACHE_DIR``, if set.  Setting it to an empty
+               string disables caching.
+            2. ``$XDG_CACHE_HOME/gen-config``, if ``XDG_CACHE_HOME`` is set.
+            3. ``~/.cache/gen-config``.
+
+        Returns:
+            Path:  The cache directory, or ``None`` if caching is disabled.
+        """
+        if "GENCONFIG_CACHE_DIR" in os.environ:
+            cache_dir = os.environ["GENCONFIG_CACHE_DIR"]
+            return Path(cache_dir) if cache_dir != "" else None
+
+        xdg_cache_home = os.environ.get("XDG_CACHE_HOME", "")
+        if xdg_cache_home != "":
+            return Path(xdg_cache_home) / "gen-config"
+
+        return Path.home() / ".cache" / "gen-config"
+
     @property
     def gen_config_config_data(self):
         """
-        Parsed data from the ``gen-config.ini`` file.
+        Parsed data from the ``gen-config.ini`` file, i.e., the options of
+        each section, with relative paths resolved from the current working
+        directory or, failing that, from the directory of the file.  The
+        paths are resolved in a copy of the data shared by
+        :func:`get_parsed_ini`, so that, e.g., in a
+        :class:`GenConfigDaemon` serving clients in different working
+        directories, one :class:`GenConfig` never sees the paths resolved
+        by another.
         """
         if self._gen_config_config_data is None:
-            self._gen_config_config_data = ConfigParserEnhanced(
+            data = get_parsed_ini(
                 self.gen_config_ini_file
             ).configparserenhanceddata
+            self._gen_config_config_data = {
+                _: dict(data[_]) for _ in data.sections()
+            }
 
         self.__validate_gen_config_config_data()
         return self._gen_config_config_data
@@ -571,7 +1874,7 @@ class GenConfig(FormattedMsg):
             * Ensure the specified files exist.
         """
         for section in ["gen-config", "load-env"]:
-            if not self._gen_config_config_data.has_section(section):
+            if section not in self._gen_config_config_data:
                 raise ValueError(self.get_formatted_msg(
                     f"'{str(self.gen_config_ini_file)}' must contain a "
                     f"'{section}' section."
@@ -586,7 +1889,7 @@ class GenConfig(FormattedMsg):
             ("load-env", "environment-specs"),
         ]
         for section, key in section_keys:
-            if not self._gen_config_config_data.has_option(section, key):
+            if key not in self._gen_config_config_data[section]:
                 raise ValueError(self.get_formatted_msg(
                     f"'{str(self.gen_config_ini_file)}' must contain the "
                     f"following in the '{section}' section:",
@@ -690,6 +1993,40 @@ class GenConfig(FormattedMsg):
                     <build-name>
 
                 cmake -C foo.cmake /path/to/src
+
+            List the Complete Configurations a Change Affects:
+
+                python3 /path/to/gen_config.py --affected-by "BUILD-TYPE|DEBUG"
+
+                git show HEAD~1:ini_files/config-specs.ini > old-config-specs.ini
+                python3 /path/to/gen_config.py \\
+                    --affected-by-diff old-config-specs.ini ini_files/config-specs.ini
+
+            Save the CMake Fragment Files of Every Complete Configuration:
+
+                python3 /path/to/gen_config.py --all-configs --all-systems \\
+                    --output-dir fragments --jobs 0
+
+            Write a CMake Preset for Every Complete Configuration:
+
+                python3 /path/to/gen_config.py \\
+                    --cmake-presets /path/to/src/gen-config-presets.json \\
+                    --cmake-user-presets /path/to/src/CMakeUserPresets.json
+
+                cd /path/to/src && cmake --preset <complete-config>
+
+            Compile config-specs.ini to Speed Up Later Runs:
+
+                python3 /path/to/gen_config.py --compile
+
+            Validate Every Section of config-specs.ini (e.g., in CI):
+
+                python3 /path/to/gen_config.py --validate --jobs 0
+
+            Match Many Build Names to Complete Configurations:
+
+                cat build-names.txt | python3 /path/to/gen_config.py \\
+                    --canonicalize-build-names
         """
         examples = textwrap.dedent(examples)
         examples = "[ Examples ]".center(79, "-") + "\n\n" + examples
@@ -710,11 +2047,64 @@ class GenConfig(FormattedMsg):
         parser.add_argument("--list-config-flags", action="store_true",
                             default=False, help="List the available "
                             "configuration flags and options.")
+        parser.add_argument("--canonicalize-build-names", action="store_true",
+                            default=False, help="Read build names from stdin, "
+                            "one per line, and write the matching complete "
+                            "configuration (or error) for each to stdout as "
+                            "a line of JSON.")
+        parser.add_argument("--affected-by", action="append", default=None,
+                            metavar="SECTION", help="List the complete "
+                            "configurations that use SECTION of "
+                            "config-specs.ini, directly or indirectly, i.e., "
+                            "those affected by a change to it.  Can be given "
+                            "more than once.")
+        parser.add_argument("--affected-by-diff", nargs=2, default=None,
+                            metavar=("OLD", "NEW"),
+                            type=lambda p: Path(p).resolve(), help="List the "
+                            "complete configurations in NEW affected by the "
+                            "changes between two versions of "
+                            "config-specs.ini.")
+        parser.add_argument("--compile", action="store_true", default=False,
+                            help="Evaluate every complete configuration in "
+                            "config-specs.ini and save the results, so that "
+                            "later runs look them up rather than evaluating "
+                            "config-specs.ini, until it changes.")
         parser.add_argument("--cmake-fragment", action="store", default=None,
                             type=lambda p: Path(p).resolve(), help="Output a "
                             "cmake fragment that will give you an identical "
                             "set of configuration flags as when using this "
                             "tool.")
+        parser.add_argument("--all-configs", action="store_true",
+                            default=False, help="Write a cmake fragment, "
+                            "<complete-config>.cmake, for every complete "
+                            "configuration for this system to the directory "
+                            "given by --output-dir.")
+        parser.add_argument("--all-systems", action="store_true",
+                            default=False, help="With --all-configs or "
+                            "--cmake-presets, cover the complete "
+                            "configurations of every system rather than just "
+                            "this one.")
+        parser.add_argument("--output-dir", action="store", default=None,
+                            type=lambda p: Path(p).resolve(), help="The "
+                            "directory to which --all-configs writes the "
+                            "cmake fragments.")
+        parser.add_argument("--cmake-presets", action="store", default=None,
+                            type=lambda p: Path(p).resolve(), help="Write a "
+                            "CMakePresets.json file with a configure preset "
+                            "for every complete configuration for this "
+                            "system, so that `cmake --preset <config>` "
+                            "configures without this tool.")
+        parser.add_argument("--cmake-user-presets", action="store",
+                            default=None, type=lambda p: Path(p).resolve(),
+                            help="With --cmake-presets, also add the presets "
+                            "file to the include list of this "
+                            "CMakeUserPresets.json file.")
+        parser.add_argument("--incremental", action="store_true",
+                            default=False, help="Only write the cmake "
+                            "fragments of --cmake-fragment or --all-configs "
+                            "whose complete configuration (or the sections it "
+                            "uses) changed since they were last written with "
+                            "--incremental.")
         parser.add_argument("-f", "--force", action="store_true",
                             default=False, help="Forces gen_config to use the "
                             "system name specified in the build_name rather "
@@ -724,6 +2114,16 @@ class GenConfig(FormattedMsg):
         parser.add_argument("-y", "--yes", action="store_true",
                             default=False, help="Automatically say yes to any "
                             "yes/no prompts.")
+        parser.add_argument("--validate", action="store_true",
+                            default=False, help="Validate every section of "
+                            "config-specs.ini, rather than just the sections "
+                            "used by the build name.")
+        parser.add_argument("-j", "--jobs", action="store", default=1,
+                            type=int, help="The number of worker processes "
+                            "used to validate the sections of "
+                            "config-specs.ini and to write the cmake "
+                            "fragments of --all-configs.  0 uses one per CPU core.  "
+                            "Defaults to 1.")
         parser.add_argument(
             "--ci-mode", action="store_true",
             default=False,
@@ -777,6 +2177,14 @@ class GenConfig(FormattedMsg):
                             # "is a helper flag to be used by gen-config.sh, not "
                             # "intended to be used by the user.")
 
+        parser.add_argument("--output-shell-document", action="store_true",
+                            default=False, help=argparse.SUPPRESS)
+                            # help="Generate the configuration and write the "
+                            # "cmake args, cmake fragment path and LoadEnv "
+                            # "args to stdout as bash assignments.  This is a "
+                            # "helper flag to be used by gen-config.sh, not "
+                            # "intended to be used by the user.")
+
         parser.add_argument("--bash-cmake-args-location",
                             action="store",
                             default=None,
@@ -787,47 +2195,139 @@ class GenConfig(FormattedMsg):
         return parser
 
 
-def main(argv):
+# The GenConfig each section name validation worker process formats section
+# names with; see _init_section_name_worker.
+_section_name_worker = None
+
+
+def _init_section_name_worker(argv, gen_config_ini_file):
     """
-    DOCSTRING
+    Initializes a worker process of
+    :func:`GenConfig.validate_config_specs_ini_section_names` with its own
+    :class:`GenConfig`, :class:`LoadEnv` and :class:`ConfigKeywordParser`, so
+    that no parsed data is shared between processes.
+
+    Parameters:
+        argv (list):  The :attr:`GenConfig.argv` of the validating object.
+        gen_config_ini_file (Path):  Its ``gen-config.ini`` file.
     """
-    gc = GenConfig(argv)
+    global _section_name_worker
+    gc = GenConfig(argv, gen_config_ini_file=gen_config_ini_file)
+    gc.load_load_env()
+    gc.load_config_keyword_parser()
+    gc.load_env.args.force = True
+    gc.load_env.silent = True
+    supported_systems = [x for x in gc.load_env.supported_systems_data]
+    _section_name_worker = (gc, supported_systems)
 
-    # To support gen-config.sh, we must conditionally output the load-env.sh args
-    # and exit early
-    if gc.args.output_load_env_args_only:
-        print(" ".join(gc.load_env_args))
-        sys.exit(0)
 
-    gc.validate_config_specs_ini()
-    if gc.args.list_config_flags:
-        gc.list_config_flags()
-    if gc.args.list_configs:
-        gc.list_configs()
+def _get_formatted_section_name(section_name):
+    """
+    Calls :func:`GenConfig.get_formatted_section_name` in a worker process
+    set up by :func:`_init_section_name_worker`.
+    """
+    gc, supported_systems = _section_name_worker
+    return gc.get_formatted_section_name(section_name, supported_systems)
 
-    # Handle generation of configure output
-    if gc.args.cmake_fragment is not None:
-        gc.write_cmake_fragment()
-    else:  # Output bash cmake args to be used by gen-config.sh...
-        #
-        # * gen_config.py saves generated cmake args to, i.e.,
-        #     /tmp/$USER/bash_cmake_args_from_gen_config_82dk2h
-        #
-        # * gen_config.py saves this location to /tmp/$USER/.bash_cmake_args_file_loc
-        #
-        # * gen-config.sh reads and uses the cmake args in the following manner:
-        #
-        #       # gen-config.sh
-        #       bash_cmake_args_file=$(cat /tmp/$USER/.bash_cmake_args_file_loc)
-        #       cmake $(cat $bash_cmake_args_file) /path/to/src
-        #
-        user = getpass.getuser()
-        Path(f"/tmp/{user}").mkdir(parents=True, exist_ok=True)
 
-        if gc.args.bash_cmake_args_location is not None:
-            with open(gc.args.bash_cmake_args_location, "w") as F:
-                F.write(gc.generated_config_flags_str)
+# The GenConfig each CMake fragment worker process writes fragments with; see
+# _init_cmake_fragment_worker.
+_cmake_fragment_worker = None
+
 
+def _init_cmake_fragment_worker(argv, gen_config_ini_file):
+    """
+    Initializes a worker process of :func:`GenConfig.write_all_cmake_fragments`
+    with its own :class:`GenConfig`.  Its
+    :class:`MemoizedSetProgramOptionsCMake` comes from :func:`get_parsed_ini`,
+    so a forked worker reuses the one the parent process already parsed.
+
+    Parameters:
+        argv (list):  The :attr:`GenConfig.argv` of the writing object.
+        gen_config_ini_file (Path):  Its ``gen-config.ini`` file.
+    """
+    global _cmake_fragment_worker
+    _cmake_fragment_worker = GenConfig(argv,
+                                       gen_config_ini_file=gen_config_ini_file)
+    _cmake_fragment_worker.load_set_program_options()
+
+
+def _write_cmake_fragments(complete_configs):
+    """
+    Calls :func:`GenConfig.write_cmake_fragments` in a worker process set up
+    by :func:`_init_cmake_fragment_worker`.
+    """
+    return _cmake_fragment_worker.write_cmake_fragments(complete_configs)
+
+
+def main(argv):
+    """
+    DOCSTRING
+    """
+    with GenConfig(argv) as gc:
+        # To support gen-config.sh, we must conditionally output the load-env.sh args
+        # and exit early
+        if gc.args.output_load_env_args_only:
+            print(" ".join(gc.load_env_args))
+            sys.exit(0)
+
+        # gen-config.sh evals stdout, so anything else printed goes to stderr
+        if gc.args.output_shell_document:
+            with redirect_stdout(sys.stderr):
+                if gc.args.validate:
+                    gc.validate_config_specs_ini()
+                shell_document = gc.get_shell_document()
+            print(shell_document, end="")
+            sys.exit(0)
+
+        # Listing affected configs only needs the `use` graph of config-specs.ini
+        if gc.args.affected_by is not None or gc.args.affected_by_diff is not None:
+            gc.print_affected_configs()
+            sys.exit(0)
+
+        # Otherwise, only the sections needed for the build name are validated
+        # when its configuration is generated.
+        if gc.args.validate:
+            gc.validate_config_specs_ini()
+        if gc.args.list_config_flags:
+            gc.list_config_flags()
+        if gc.args.list_configs:
+            gc.list_configs()
+        if gc.args.canonicalize_build_names:
+            gc.canonicalize_build_names()
+            sys.exit(0)
+        if gc.args.compile:
+            gc.compile_config_specs()
+            sys.exit(0)
+        if gc.args.all_configs:
+            gc.write_all_cmake_fragments()
+            sys.exit(0)
+        if gc.args.cmake_presets is not None:
+            gc.write_cmake_presets()
+            sys.exit(0)
+
+        # Handle generation of configure output
+        if gc.args.cmake_fragment is not None:
+            gc.write_cmake_fragment()
+        else:  # Output bash cmake args to be used by gen-config.sh...
+            #
+            # * gen_config.py saves generated cmake args to, i.e.,
+            #     /tmp/$USER/bash_cmake_args_from_gen_config_82dk2h
+            #
+            # * gen_config.py saves this location to /tmp/$USER/.bash_cmake_args_file_loc
+            #
+            # * gen-config.sh reads and uses the cmake args in the following manner:
+            #
+            #       # gen-config.sh
+            #       bash_cmake_args_file=$(cat /tmp/$USER/.bash_cmake_args_file_loc)
+            #       cmake $(cat $bash_cmake_args_file) /path/to/src
+            #
+            user = getpass.getuser()
+            Path(f"/tmp/{user}").mkdir(parents=True, exist_ok=True)
+
+            if gc.args.bash_cmake_args_location is not None:
+                with open(gc.args.bash_cmake_args_location, "w") as F:
+                    F.write(gc.generated_config_flags_str)
 
 
 if __name__ == "__main__":  # pragma: no cover
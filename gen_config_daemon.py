@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+An optional resident server for ``gen_config.py``, which keeps the parsed
+``.ini`` files, and everything derived from them, in memory between requests
+rather than paying for Python startup, imports and parsing on every
+``source gen-config.sh``.
+
+Start it once per user and host, e.g., on a login node:
+
+.. code-block:: bash
+
+    nohup python3 /path/to/gen_config_daemon.py &
+
+``gen-config.sh`` then sends its ``gen_config.py`` command lines to it over
+the Unix domain socket :func:`get_default_socket_path` (or
+``$GENCONFIG_DAEMON_SOCKET``), and falls back to running ``gen_config.py``
+itself when no server is listening.  As ``gen-config.sh`` evaluates the
+responses, both ends refuse sockets in directories other users can access
+(see :func:`check_socket_dir`), and clients only trust servers run by the
+same user.
+
+Each request is a single line of JSON holding the ``gen_config.py`` command
+line arguments, the working directory and, optionally, the environment of the
+client, e.g.,
+
+.. code-block:: json
+
+    {"argv": ["--list-configs", "ats1"], "cwd": "/path/to/build", "env": {...}}
+
+and each response a single line of JSON holding the exit code and the output
+of running them, e.g.,
+
+.. code-block:: json
+
+    {"returncode": 0, "stdout": "...", "stderr": ""}
+
+All of the modes of ``gen_config.py`` are available this way: listing
+configurations, canonicalizing build names, generating the bash arguments or
+a CMake fragment, etc.  Since the parsed ``.ini`` files are shared through
+:func:`get_parsed_ini`, any number of projects (i.e., sets of ``.ini``
+files) stay resident at once, along with the :class:`ConfigSpecsGraph` and
+:class:`LoadEnv` loaded from them (see :func:`get_derived_object`), and each
+is loaded again as soon as one of its files changes on disk.  Requests that need to read from the terminal, e.g., to ask
+whether to overwrite a CMake fragment file, are answered with
+:data:`DAEMON_UNAVAILABLE`, so the client runs them itself.
+"""
+# asyncio is only imported by the server, so that clients, which only need a
+# blocking socket, start quickly.
+import argparse
+from contextlib import redirect_stderr, redirect_stdout
+import getpass
+import io
+import json
+import os
+from pathlib import Path
+import socket
+import stat
+import struct
+import sys
+import traceback
+
+
+#: The exit code of a client that could not reach a server, which tells
+#: ``gen-config.sh`` to run ``gen_config.py`` itself instead.
+DAEMON_UNAVAILABLE = 75
+
+
+class _InputRequired(Exception):
+    """
+    Raised when a request tries to read from ``stdin``, which a server does
+    not have.
+    """
+
+
+class _NoInput(io.StringIO):
+    """
+    The ``stdin`` of requests, which raises :class:`_InputRequired` on any
+    read, so a request that prompts can be handed back to the client.
+    """
+
+    def read(self, *args):
+        raise _InputRequired()
+
+    def readline(self, *args):
+        raise _InputRequired()
+
+    def readlines(self, *args):
+        raise _InputRequired()
+
+    def __next__(self):
+        raise _InputRequired()
+
+
+def get_default_socket_path():
+    """
+    Gets the socket the server listens on and clients connect to, unless
+    another is specified.
+
+    Returns:
+        Path:  ``$GENCONFIG_DAEMON_SOCKET`` if set, otherwise
+        ``gen-config.sock`` in ``$XDG_RUNTIME_DIR`` if set, or in
+        ``/tmp/$USER`` if not.
+    """
+    if os.environ.get("GENCONFIG_DAEMON_SOCKET", "") != "":
+        return Path(os.environ["GENCONFIG_DAEMON_SOCKET"])
+
+    if os.environ.get("XDG_RUNTIME_DIR", "") != "":
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "gen-config.sock"
+
+    return Path(f"/tmp/{getpass.getuser()}/gen-config.sock")
+
+
+def check_socket_dir(socket_path, create=False):
+    """
+    Checks that the directory of a socket is owned by the current user and
+    that no one else can access it (i.e., its mode is ``0700``), so no other
+    user can create, replace or connect to a socket in it.  A directory such
+    as ``/tmp/$USER`` can be created ahead of time by anyone.
+
+    Parameters:
+        socket_path (str, Path):  The socket.
+        create (bool):  Whether to create the directory, with mode ``0700``,
+            if it does not exist.
+
+    Raises:
+        PermissionError:  If the directory is not a directory only the
+        current user can access.
+    """
+    directory = Path(socket_path).parent
+    if create:
+        try:
+            directory.mkdir(mode=0o700, parents=True)
+        except FileExistsError:
+            pass
+
+    dir_stat = os.lstat(str(directory))
+    if (not stat.S_ISDIR(dir_stat.st_mode) or dir_stat.st_uid != os.getuid()
+            or dir_stat.st_mode & 0o077 != 0):
+        raise PermissionError(
+            f"'{str(directory)}' must be a directory owned by the current "
+            "user that only they can access (mode 0700) to hold the "
+            "gen-config daemon socket."
+        )
+
+
+class GenConfigDaemon:
+    """
+    This class serves ``gen_config.py`` requests over a Unix domain socket,
+    running each with :func:`gen_config.main` in this process.  Requests are
+    run in a worker thread, to keep the event loop free to accept clients,
+    but one at a time, as each changes the working directory, the
+    environment and the output of the process while it runs.
+
+    Usage:
+
+    .. code-block:: python
+
+        GenConfigDaemon("/tmp/user/gen-config.sock").serve_forever()
+
+    Parameters:
+        socket_path (str, Path):  The socket to listen on.  Any existing
+            socket there is replaced.  Its directory is created if needed,
+            and must pass :func:`check_socket_dir`.
+    """
+
+    def __init__(self, socket_path):
+        self.socket_path = Path(socket_path)
+
+    async def start(self):
+        """
+        Starts listening on :attr:`socket_path`, which only the current user
+        may connect to.
+
+        Returns:
+            asyncio.AbstractServer:  The server.
+
+        Raises:
+            PermissionError:  If the directory of :attr:`socket_path` fails
+            :func:`check_socket_dir`.
+        """
+        import asyncio
+        # Importing gen_config here, rather than in each request, is most of
+        # what a resident server saves, along with the objects it shares
+        # between requests.
+        import gen_config
+        self._gen_config = gen_config
+        gen_config.GenConfig.share_load_env = True
+
+        check_socket_dir(self.socket_path, create=True)
+        if self.socket_path.is_socket():
+            self.socket_path.unlink()
+
+        self._stopped = asyncio.Event()
+        self._lock = asyncio.Lock()
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self.handle_client,
+                                                     path=str(self.socket_path))
+        finally:
+            os.umask(old_umask)
+
+        return server
+
+    async def serve(self):
+        """
+        Serves requests until a client asks the server to stop.
+        """
+        server = await self.start()
+        try:
+            await self._stopped.wait()
+        finally:
+            server.close()
+            await server.wait_closed()
+            self._gen_config.GenConfig.share_load_env = False
+            if self.socket_path.is_socket():
+                self.socket_path.unlink()
+
+    def serve_forever(self):
+        """
+        Runs :func:`serve` in an event loop of its own.
+        """
+        import asyncio
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.serve())
+        finally:
+            loop.close()
+
+    async def handle_client(self, reader, writer):
+        """
+        Reads a request from a client, runs it, and writes the response back.
+        A request of ``{"stop": true}`` stops the server instead.
+
+        Parameters:
+            reader (asyncio.StreamReader):  The client's request.
+            writer (asyncio.StreamWriter):  Where to write the response.
+        """
+        import asyncio
+        try:
+            request = json.loads((await reader.readline()).decode())
+            if request.get("stop", False):
+                response = {"returncode": 0, "stdout": "", "stderr": ""}
+                self._stopped.set()
+            else:
+                args = (request["argv"], request["cwd"], request.get("env"))
+                async with self._lock:
+                    response = await asyncio.get_event_loop().run_in_executor(
+                        None, self.run_request, *args
+                    )
+        except (ValueError, KeyError, TypeError, AttributeError):
+            response = {"returncode": 2, "stdout": "",
+                        "stderr": "Malformed gen-config daemon request.\n"}
+
+        writer.write(json.dumps(response).encode() + b"\n")
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def run_request(self, argv, cwd, env=None):
+        """
+        Runs ``gen_config.py`` with the given command line arguments, the way
+        running it in ``cwd`` with the environment ``env`` would.  There is
+        no terminal to answer prompts, so a run that reads from ``stdin``,
+        e.g., to ask whether to overwrite a CMake fragment file, is stopped
+        and answered with :data:`DAEMON_UNAVAILABLE` instead.
+
+        Parameters:
+            argv (list):  The ``gen_config.py`` command line arguments.
+            cwd (str):  The working directory of the client.
+            env (dict):  The environment of the client.  Defaults to that of
+                the server.
+
+        Returns:
+            dict:  The ``"returncode"``, ``"stdout"`` and ``"stderr"`` of the
+            run.
+        """
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        old_cwd = os.getcwd()
+        old_stdin = sys.stdin
+        old_environ = dict(os.environ)
+        returncode = 0
+        try:
+            os.chdir(cwd)
+            if env is not None:
+                os.environ.clear()
+                os.environ.update(env)
+            sys.stdin = _NoInput()
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    self._gen_config.main(list(argv))
+                except _InputRequired:
+                    return {"returncode": DAEMON_UNAVAILABLE, "stdout": "",
+                            "stderr": ""}
+                except SystemExit as e:
+                    if e.code is None:
+                        returncode = 0
+                    elif isinstance(e.code, int):
+                        returncode = e.code
+                    else:
+                        print(e.code, file=sys.stderr)
+                        returncode = 1
+                except Exception:
+                    traceback.print_exc()
+                    returncode = 1
+        finally:
+            sys.stdin = old_stdin
+            if env is not None:
+                os.environ.clear()
+                os.environ.update(old_environ)
+            os.chdir(old_cwd)
+
+        return {"returncode": returncode, "stdout": stdout.getvalue(),
+                "stderr": stderr.getvalue()}
+
+
+def send_request(socket_path, request):
+    """
+    Sends a request to a :class:`GenConfigDaemon` and waits for its response.
+    The server must be run by the current user, on a socket whose directory
+    passes :func:`check_socket_dir`.
+
+    Parameters:
+        socket_path (str, Path):  The socket the server listens on.
+        request (dict):  The request, e.g.,
+            ``{"argv": ["--list-configs"], "cwd": "/path/to/build",
+            "env": dict(os.environ)}``.
+
+    Returns:
+        dict:  The response, or ``None`` if no server is listening.
+
+    Raises:
+        PermissionError:  If the socket or the server listening on it cannot
+        be trusted.
+    """
+    try:
+        check_socket_dir(socket_path)
+    except FileNotFoundError:
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            if hasattr(socket, "SO_PEERCRED"):
+                creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED,
+                                        struct.calcsize("3i"))
+                pid, uid, gid = struct.unpack("3i", creds)
+            else:
+                uid = os.stat(str(socket_path)).st_uid
+            if uid != os.getuid():
+                raise PermissionError(
+                    f"The gen-config daemon listening on '{str(socket_path)}' "
+                    "is not run by the current user."
+                )
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as F:
+                line = F.readline()
+    except PermissionError:
+        raise
+    except OSError:
+        return None
+
+    return json.loads(line.decode()) if line != b"" else None
+
+
+def main(argv):
+    """
+    Starts or stops a :class:`GenConfigDaemon`, or runs a ``gen_config.py``
+    command line through one.  A client that cannot reach a server it trusts
+    exits with :data:`DAEMON_UNAVAILABLE`.
+    """
+    parser = argparse.ArgumentParser(
+        description="Serve gen_config.py requests from a resident process."
+    )
+    parser.add_argument("--socket", default=None, type=Path,
+                        help="The socket to serve on or connect to.  "
+                        "Defaults to $GENCONFIG_DAEMON_SOCKET, or "
+                        "gen-config.sock in $XDG_RUNTIME_DIR or, if unset, "
+                        "in /tmp/$USER.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--stop", action="store_true", default=False,
+                      help="Stop the server listening on the socket.")
+    mode.add_argument("--request", nargs=argparse.REMAINDER, default=None,
+                      metavar="ARGS", help="Run gen_config.py with ARGS "
+                      "through the server listening on the socket.")
+    args = parser.parse_args(argv)
+    socket_path = (args.socket if args.socket is not None
+                   else get_default_socket_path())
+
+    if args.request is None and not args.stop:
+        GenConfigDaemon(socket_path).serve_forever()
+        sys.exit(0)
+
+    request = ({"stop": True} if args.stop
+               else {"argv": args.request, "cwd": os.getcwd(),
+                     "env": dict(os.environ)})
+    try:
+        response = send_request(socket_path, request)
+    except PermissionError as e:
+        print(f"WARNING: Not using the gen-config daemon: {e}",
+              file=sys.stderr)
+        sys.exit(DAEMON_UNAVAILABLE)
+    if response is None:
+        sys.exit(DAEMON_UNAVAILABLE)
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.exit(response["returncode"])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main(sys.argv[1:])      # pragma: no cover
@@ -0,0 +1,258 @@
+import json
+import re
+
+
+class CMakePresets:
+    """
+    This class builds a ``CMakePresets.json`` file with a configure preset for
+    each complete configuration in ``config-specs.ini``, whose cache variables
+    are those its CMake fragment (see :func:`GenConfig.write_cmake_fragment`)
+    sets.  Partial sections used by many complete configurations, such as
+    ``[BUILD-TYPE|DEBUG]``, become hidden presets the complete configurations
+    inherit, so each complete configuration preset only sets what differs
+    from the presets it inherits:
+
+    .. code-block:: json
+
+        {
+          "name": "BUILD-TYPE|DEBUG",
+          "hidden": true,
+          "cacheVariables": {
+            "CMAKE_BUILD_TYPE": {"type": "STRING", "value": "DEBUG"}
+          }
+        },
+        {
+          "name": "rhel7_..._debug_...",
+          "inherits": ["BUILD-TYPE|DEBUG"],
+          "binaryDir": "${sourceDir}/build/${presetName}",
+          "cacheVariables": {...}
+        }
+
+    Presets must be added after the presets they inherit.  However a preset's
+    inherited cache variables are laid out, the cache variables it ends up
+    with are always exactly the ones it was added with, as it overrides (or,
+    with ``null``, unsets) any inherited ones that differ.
+
+    Usage:
+
+    .. code-block:: python
+
+        presets = CMakePresets()
+        presets.add_preset("ATS1", presets.get_cache_variables(
+            ['set(MPI_EXEC_NUMPROCS_FLAG -p CACHE STRING "from .ini configuration")']
+        ), hidden=True)
+        presets.add_preset("ats1_...", {...}, inherits=["ATS1"])
+        presets.to_json()
+    """
+
+    #: The ``CMakePresets.json`` schema version written, i.e., that of
+    #: CMake 3.21.
+    VERSION = 3
+
+    #: A ``set()`` command of a CMake fragment.
+    SET_COMMAND = re.compile(r"^\s*set\s*\((.*)\)\s*$", re.DOTALL)
+
+    #: An argument of a CMake command, either quoted or unquoted.
+    ARGUMENT = re.compile(r'"(?:\\.|[^"\\])*"|(?:\\.|[^\s"\\])+')
+
+    #: An innermost ``${VAR}`` or ``$ENV{VAR}`` variable reference.
+    VARIABLE_REFERENCE = re.compile(r"\$(ENV)?\{([^${}]*)\}")
+
+    def __init__(self):
+        self.configure_presets = []
+        self._resolved_cache_variables = {}
+
+    @classmethod
+    def get_cache_variables(cls, option_list):
+        """
+        Gets the cache variables that running a CMake fragment with
+        ``cmake -C`` would set, given its ``set()`` commands as
+        :func:`SetProgramOptionsCMake.gen_option_list` generates them with
+        the ``"cmake_fragment"`` generator.  As in CMake, a ``set()`` without
+        ``FORCE`` does not change an existing cache variable, a ``set()``
+        without ``CACHE`` only sets a variable for the rest of the fragment,
+        and ``${VAR}`` references are expanded as the fragment goes.
+        ``$ENV{VAR}`` references become the ``$env{VAR}`` preset macro,
+        which CMake also expands when configuring.
+
+        Parameters:
+            option_list (list):  The ``set()`` commands.
+
+        Returns:
+            dict:  The name of each cache variable and its ``"type"`` and
+            ``"value"``.
+        """
+        cache_variables = {}
+        variables = {}
+        for option in option_list:
+            match = cls.SET_COMMAND.match(option)
+            if match is None:
+                continue
+
+            args = [cls.__expand_argument(_, variables, cache_variables)
+                    for _ in cls.ARGUMENT.findall(match.group(1))]
+            if len(args) == 0:
+                continue
+            name = args[0]
+            if "CACHE" not in args[1:]:
+                variables[name] = ";".join(
+                    _ for _ in args[1:] if _ != "PARENT_SCOPE"
+                )
+                continue
+
+            cache_idx = args.index("CACHE", 1)
+            if name in cache_variables and "FORCE" not in args[cache_idx:]:
+                continue
+            cache_variables[name] = {
+                "type": args[cache_idx + 1] if len(args) > cache_idx + 1
+                        else "STRING",
+                "value": ";".join(args[1:cache_idx]),
+            }
+
+        return cache_variables
+
+    @classmethod
+    def __expand_argument(cls, argument, variables, cache_variables):
+        """
+        Removes the quotes from an argument of a ``set()`` command, expands
+        its variable references, and replaces its escape sequences.
+
+        Parameters:
+            argument (str):  The argument, as written in the command.
+            variables (dict):  The normal variables set so far.
+            cache_variables (dict):  The cache variables set so far.
+
+        Returns:
+            str:  The value of the argument.
+        """
+        if len(argument) >= 2 and argument[0] == argument[-1] == '"':
+            argument = argument[1:-1]
+
+        def expand(match):
+            if match.group(1) is not None:
+                return f"$env{{{match.group(2)}}}"
+            if match.group(2) in variables:
+                return variables[match.group(2)]
+            return cache_variables.get(match.group(2), {}).get("value", "")
+
+        # Expand innermost references first, e.g., ${A_${B}}
+        expanded = cls.VARIABLE_REFERENCE.sub(expand, argument)
+        while expanded != argument and "${" in expanded:
+            argument = expanded
+            expanded = cls.VARIABLE_REFERENCE.sub(expand, argument)
+
+        escapes = {"n": "\n", "t": "\t", "r": "\r"}
+        return re.sub(r"\\(.)", lambda m: escapes.get(m.group(1), m.group(1)),
+                      expanded)
+
+    def add_preset(self, name, cache_variables, inherits=(), hidden=False):
+        """
+        Adds a configure preset.
+
+        Parameters:
+            name (str):  The name of the preset.
+            cache_variables (dict):  The cache variables the preset should
+                end up with, e.g., from :func:`get_cache_variables`.
+            inherits (list):  The names of previously added presets for this
+                preset to inherit, in order of precedence.
+            hidden (bool):  Whether the preset is only meant to be inherited,
+                rather than used with ``cmake --preset``.
+
+        Raises:
+            ValueError:  If a preset in ``inherits`` has not been added yet.
+        """
+        missing = [_ for _ in inherits
+                   if _ not in self._resolved_cache_variables]
+        if len(missing) > 0:
+            raise ValueError(f"The preset '{name}' cannot inherit presets "
+                             f"that have not been added: {missing}")
+
+        # As in CMake, earlier presets in `inherits` take precedence, and an
+        # inherited null still counts as a value.
+        inherited = {}
+        for parent in reversed(list(inherits)):
+            inherited.update(self._resolved_cache_variables[parent])
+
+        own = {
+            key: value for key, value in cache_variables.items()
+            if key not in inherited or inherited[key] != value
+        }
+        for key, value in inherited.items():
+            if value is not None and key not in cache_variables:
+                own[key] = None
+
+        self._resolved_cache_variables[name] = {**inherited, **own}
+
+        preset = {"name": name}
+        if hidden:
+            preset["hidden"] = True
+        if len(inherits) > 0:
+            preset["inherits"] = list(inherits)
+        if not hidden:
+            preset["binaryDir"] = "${sourceDir}/build/${presetName}"
+        if len(own) > 0:
+            preset["cacheVariables"] = own
+        self.configure_presets.append(preset)
+
+    def __contains__(self, name):
+        return name in self._resolved_cache_variables
+
+    def get_cache_variables_of_preset(self, name):
+        """
+        Gets the cache variables a preset ends up with once its inherited
+        presets are resolved, as ``cmake --preset`` would set them.
+
+        Parameters:
+            name (str):  The name of the preset.
+
+        Returns:
+            dict:  The name of each cache variable and its ``"type"`` and
+            ``"value"``.
+        """
+        return {
+            key: value for key, value
+            in self._resolved_cache_variables[name].items()
+            if value is not None
+        }
+
+    def to_json(self, fingerprint=None):
+        """
+        Builds the contents of the ``CMakePresets.json`` file.
+
+        Parameters:
+            fingerprint (str):  A key identifying what the presets were
+                generated from, stored in the ``gen-config`` vendor field
+                (see :func:`get_fingerprint`), if any.
+
+        Returns:
+            str:  The contents of the file.
+        """
+        presets = {
+            "version": self.VERSION,
+            "cmakeMinimumRequired": {"major": 3, "minor": 21, "patch": 0},
+            "configurePresets": self.configure_presets,
+        }
+        if fingerprint is not None:
+            presets["vendor"] = {"gen-config": {"fingerprint": fingerprint}}
+
+        return json.dumps(presets, indent=2) + "\n"
+
+    @staticmethod
+    def get_fingerprint(filename):
+        """
+        Gets the fingerprint stored by :func:`to_json` in an existing
+        ``CMakePresets.json`` file.
+
+        Parameters:
+            filename (Path):  The ``CMakePresets.json`` file.
+
+        Returns:
+            str:  The fingerprint, or ``None`` if the file is missing, or was
+            not written with one.
+        """
+        try:
+            with open(filename, "r") as F:
+                presets = json.load(F)
+            return presets["vendor"]["gen-config"]["fingerprint"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import mmap
+from pathlib import Path
+import struct
+
+
+class CompiledConfigSpecs:
+    """
+    This class reads the binary file written by
+    :func:`GenConfig.compile_config_specs`, which holds the fully evaluated
+    option lists (i.e., with every ``use`` expanded and every operation
+    applied) of each complete configuration in ``config-specs.ini``.  The
+    file is memory-mapped, and looking up a complete configuration only
+    reads the one record for it, so the cost of a lookup does not depend on
+    the size of ``config-specs.ini``.
+
+    Usage:
+
+    .. code-block:: python
+
+        with CompiledConfigSpecs("config-specs.bin") as compiled:
+            compiled.get_option_list(
+                "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_none",
+                "cmake_fragment"
+            )
+            # ['set(MPI_EXEC_NUMPROCS_FLAG -p CACHE STRING "from .ini configuration")']
+
+    The file stays mapped until :func:`close` is called, e.g., on leaving the
+    ``with`` block.
+
+    The file is laid out as:
+
+        1. A header (see :attr:`HEADER`) holding :attr:`MAGIC`,
+           :attr:`VERSION`, the number of slots in the offset table, and a
+           key identifying what it was compiled from (see :func:`to_bytes`).
+        2. An open-addressing hash table of section names (see :attr:`SLOT`),
+           where each slot holds the hash of a section name (see
+           :func:`get_name_hash`) and the offset and length of its record.
+           Empty slots have a length of ``0``.
+        3. The records, each a UTF-8 encoded JSON object holding the section
+           name and its option list for each of the :attr:`GENERATORS`.
+
+    Parameters:
+        filename (str, Path):  The compiled file.
+
+    Raises:
+        ValueError:  If the file was not written by this version of
+        :class:`CompiledConfigSpecs`.
+    """
+
+    #: Identifies a compiled ``config-specs.ini`` file.
+    MAGIC = b"GCCS"
+
+    #: Bump this whenever the layout of the file changes.
+    VERSION = 1
+
+    #: The :class:`SetProgramOptionsCMake` generators whose option lists are
+    #: compiled.
+    GENERATORS = ("bash", "cmake_fragment")
+
+    #: Magic, version, number of slots, and source key.
+    HEADER = struct.Struct("<4sII64s")
+
+    #: Section name hash, record offset, and record length.
+    SLOT = struct.Struct("<QQQ")
+
+    def __init__(self, filename):
+        self.filename = Path(filename)
+        with open(self.filename, "rb") as F:
+            self._data = mmap.mmap(F.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._data) < self.HEADER.size:
+            self.close()
+            raise ValueError(f"'{self.filename}' is not a compiled "
+                             "config-specs.ini file.")
+        magic, version, self.n_slots, source_hash = self.HEADER.unpack_from(
+            self._data, 0
+        )
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"'{self.filename}' is not a compiled "
+                             "config-specs.ini file of version "
+                             f"{self.VERSION}.")
+        self.source_hash = source_hash.decode()
+
+    def close(self):
+        """
+        Unmaps the file.  No more lookups can be made afterwards.
+        """
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @classmethod
+    def to_bytes(cls, source_hash, option_lists):
+        """
+        Builds the contents of a compiled ``config-specs.ini`` file.
+
+        Parameters:
+            source_hash (str):  A 64 character hex digest identifying what
+                the file is compiled from, e.g., the contents of
+                ``config-specs.ini`` and the version of the tool compiling
+                it (see :attr:`GenConfig.compiled_config_specs_key`).
+            option_lists (dict):  The option list of each complete
+                configuration for each of the :attr:`GENERATORS`, e.g.,
+                ``{"section": {"bash": [...], "cmake_fragment": [...]}}``.
+
+        Returns:
+            bytes:  The contents of the file.
+        """
+        # Keep the table at most half full, so probing stays short and always
+        # ends at an empty slot.
+        n_slots = 1
+        while n_slots < 2 * len(option_lists):
+            n_slots *= 2
+
+        slots = [(0, 0, 0)] * n_slots
+        records = bytearray()
+        records_offset = cls.HEADER.size + n_slots * cls.SLOT.size
+        for section, section_option_lists in option_lists.items():
+            record = json.dumps(
+                {"section": section, **section_option_lists}
+            ).encode()
+            name_hash = cls.get_name_hash(section)
+            idx = name_hash & (n_slots - 1)
+            while slots[idx][2] != 0:
+                idx = (idx + 1) & (n_slots - 1)
+            slots[idx] = (name_hash, records_offset + len(records), len(record))
+            records += record
+
+        return b"".join([
+            cls.HEADER.pack(cls.MAGIC, cls.VERSION, n_slots,
+                            source_hash.encode()),
+            *[cls.SLOT.pack(*slot) for slot in slots],
+            bytes(records),
+        ])
+
+    @staticmethod
+    def get_name_hash(section):
+        """
+        Hashes a section name for the offset table.  Unlike :func:`hash`,
+        this is the same in every process.
+
+        Parameters:
+            section (str):  The section name.
+
+        Returns:
+            int:  The unsigned 64-bit hash of the name.
+        """
+        return int.from_bytes(
+            hashlib.blake2b(section.encode(), digest_size=8).digest(), "little"
+        )
+
+    def get_record(self, section):
+        """
+        Looks up the record of a complete configuration.
+
+        Parameters:
+            section (str):  The name of the complete configuration.
+
+        Returns:
+            dict:  The section name and its option lists, or ``None`` if the
+            section was not compiled.
+        """
+        name_hash = self.get_name_hash(section)
+        mask = self.n_slots - 1
+        idx = name_hash & mask
+        while True:
+            slot_hash, offset, length = self.SLOT.unpack_from(
+                self._data, self.HEADER.size + idx * self.SLOT.size
+            )
+            if length == 0:
+                return None
+            if slot_hash == name_hash:
+                record = json.loads(self._data[offset:offset + length])
+                if record["section"] == section:
+                    return record
+            idx = (idx + 1) & mask
+
+    def get_option_list(self, section, generator):
+        """
+        Gets the option list of a complete configuration, as
+        :func:`SetProgramOptionsCMake.gen_option_list` would generate it.
+
+        Parameters:
+            section (str):  The name of the complete configuration.
+            generator (str):  One of the :attr:`GENERATORS`.
+
+        Returns:
+            list:  The option list, or ``None`` if the section or generator
+            was not compiled.
+        """
+        record = self.get_record(section)
+        return None if record is None else record.get(generator)
+
+    def __contains__(self, section):
+        return self.get_record(section) is not None
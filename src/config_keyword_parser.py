@@ -1,8 +1,129 @@
+from collections import Counter
+import itertools
+import json
 from keywordparser import KeywordParser
+import math
+from pathlib import Path
 import re
+from src.file_utils import get_file_hash, write_file_atomically
+from src.ini_registry import get_parsed_ini
+from src.suggestion_index import SuggestionIndex
 import sys
 
 
+class ParsedBuildName:
+    """
+    The immutable result of parsing a single build name with
+    :class:`ConfigKeywordParser`, e.g., via
+    :attr:`ConfigKeywordParser.parsed_build_name` or
+    :func:`ConfigKeywordParser.parse_many`.
+
+    To keep many of these cheap to hold in memory, the selected options are
+    stored as a sorted tuple of small integers (:attr:`option_ids`) indexing
+    into an ``option_table`` shared by every result from the same parser, and
+    :attr:`selected_options` and :attr:`selected_options_str` are computed
+    from them on demand.
+
+    Two results are equal, and hash the same, if they select the same options
+    (or fail with the same error), regardless of the build names that were
+    parsed.  For example, ``"mpi_serial"`` and ``"serial"`` give equal results
+    if ``mpi`` is the default for its flag, so these can be used as `dict`
+    keys or `set` members to find the distinct configurations in a
+    collection of build names.
+
+    Parameters:
+        build_name (str):  The build name that was parsed.
+        option_ids (tuple):  The positions in ``option_table`` of the selected
+            options, in ascending order.  Empty on error.
+        error (str):  The error message if the build name could not be parsed,
+            otherwise ``None``.
+        option_table (tuple):  A ``(flag_name, option)`` pair for every option
+            in ``supported-config-flags.ini``, in order, as given by
+            :attr:`ConfigKeywordParser.option_table`.
+    """
+
+    __slots__ = ("build_name", "option_ids", "error", "_option_table", "_hash")
+
+    #: The delimiter placed before each option in :attr:`selected_options_str`.
+    delim = "_"
+
+    def __init__(self, build_name, option_ids, error, option_table):
+        object.__setattr__(self, "build_name", sys.intern(build_name))
+        object.__setattr__(self, "option_ids", tuple(option_ids))
+        object.__setattr__(self, "error", error)
+        object.__setattr__(self, "_option_table", option_table)
+        object.__setattr__(self, "_hash", hash((self.option_ids, error)))
+
+    @property
+    def selected_options(self):
+        """
+        Same as :attr:`ConfigKeywordParser.selected_options`.
+
+        Returns:
+            dict:  The flags and their selected options, or ``None`` if the
+            build name could not be parsed.
+        """
+        if self.error is not None:
+            return None
+
+        selected_options = {}
+        for option_id in self.option_ids:
+            flag_name, option = self._option_table[option_id]
+            if flag_name not in selected_options:
+                selected_options[flag_name] = option
+            elif type(selected_options[flag_name]) == list:
+                selected_options[flag_name].append(option)
+            else:
+                selected_options[flag_name] = [selected_options[flag_name],
+                                               option]
+
+        return selected_options
+
+    @property
+    def selected_options_str(self):
+        """
+        Same as :attr:`ConfigKeywordParser.selected_options_str`.
+
+        Returns:
+            str:  The selected options, each preceded by :attr:`delim`, or
+            ``None`` if the build name could not be parsed.
+        """
+        if self.error is not None:
+            return None
+
+        return "".join(f"{self.delim}{self._option_table[_][1]}"
+                       for _ in self.option_ids)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' objects are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' objects are immutable.")
+
+    def __eq__(self, other):
+        if not isinstance(other, ParsedBuildName):
+            return NotImplemented
+
+        return (self._hash == other._hash
+                and self.option_ids == other.option_ids
+                and self.error == other.error)
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (ParsedBuildName, (self.build_name, self.option_ids, self.error,
+                                  self._option_table))
+
+    def __repr__(self):
+        if self.error is not None:
+            return (f"ParsedBuildName(build_name={self.build_name!r}, "
+                    f"error={self.error!r})")
+
+        return (f"ParsedBuildName(build_name={self.build_name!r}, "
+                f"selected_options_str={self.selected_options_str!r})")
+
+
 class ConfigKeywordParser(KeywordParser):
     """
     This class accepts a configuration file containing supported configuration
@@ -46,14 +167,40 @@ class ConfigKeywordParser(KeywordParser):
             pairs from.
         supported_config_flags_filename (str, Path):  The name of the file to
             load the supported configuration flags and options from.
+        schema_cache_dir (str, Path):  Optional directory in which to store
+            the compiled flag schema (see :func:`__compile_flag_schema`), keyed
+            on the contents of ``supported-config-flags.ini``.  When a cached
+            schema for the same file contents exists, the `.ini` file is not
+            parsed at all.  If ``None`` (the default), nothing is cached.
     """
 
-    def __init__(self, build_name, supported_config_flags_filename):
+    #: Bump this whenever the layout of the schema cache files changes.
+    FLAG_SCHEMA_CACHE_VERSION = 1
+
+    def __init__(self, build_name, supported_config_flags_filename,
+                 schema_cache_dir=None):
         self.config_filename = supported_config_flags_filename
         self._build_name = build_name
         self.delim = "_"
+        self.schema_cache_dir = (None if schema_cache_dir is None
+                                 else Path(schema_cache_dir))
+
+        if not self.__load_flag_schema_cache():
+            self.flag_names = [_ for _ in self.config["configure-flags"].keys()]
+
+    @property
+    def config(self):
+        """
+        The parsed ``supported-config-flags.ini``, shared with any other
+        object in this process using the same file (see
+        :func:`get_parsed_ini`).
+        """
+        if not hasattr(self, "_config"):
+            self._config = get_parsed_ini(
+                self.config_filename
+            ).configparserenhanceddata
 
-        self.flag_names = [_ for _ in self.config["configure-flags"].keys()]
+        return self._config
 
     @property
     def selected_options_str(self):
@@ -74,18 +221,33 @@ class ConfigKeywordParser(KeywordParser):
 
         """
         if not hasattr(self, "_selected_options_str"):
-            selected_options_str = ""
-            for flag in self.selected_options.keys():
-                if type(self.selected_options[flag]) == list:
-                    for option in self.selected_options[flag]:
-                        selected_options_str += f"_{option}"
-                else:
-                    selected_options_str += f"_{self.selected_options[flag]}"
-
-            self._selected_options_str = selected_options_str
+            self._selected_options_str = self.get_selected_options_str(
+                self.selected_options
+            )
 
         return self._selected_options_str
 
+    def get_selected_options_str(self, selected_options):
+        """
+        Joins the options in a `dict` like :attr:`selected_options` (or one
+        generated by :func:`iter_option_combinations`) into a string as
+        described in :attr:`selected_options_str`.
+
+        Parameters:
+            selected_options (dict):  The flags and their selected options.
+
+        Returns:
+            str:  The selected options, each preceded by the delimiter.
+        """
+        selected_options_list = []
+        for options in selected_options.values():
+            if type(options) == list:
+                selected_options_list += options
+            else:
+                selected_options_list.append(options)
+
+        return "".join(f"{self.delim}{_}" for _ in selected_options_list)
+
     @property
     def selected_options(self):
         """
@@ -97,6 +259,26 @@ class ConfigKeywordParser(KeywordParser):
 
         return self._selected_options
 
+    @property
+    def parsed_build_name(self):
+        """
+        The result of parsing the :attr:`build_name` as a
+        :class:`ParsedBuildName`, which is hashable and much smaller than
+        :attr:`selected_options`.
+
+        Raises:
+            ValueError:  If the :attr:`build_name` cannot be parsed, as
+                described in :func:`__parse_selected_options`.
+        """
+        if not hasattr(self, "_parsed_build_name"):
+            self.__assert_options_are_unique_across_all_flags()
+            self._parsed_build_name = ParsedBuildName(
+                self.build_name, self.__parse_build_name(self.build_name),
+                None, self.option_table
+            )
+
+        return self._parsed_build_name
+
     def __parse_selected_options(self):
         """
         Parses the :attr:`build_name` into a dictionary containing the
@@ -105,10 +287,12 @@ class ConfigKeywordParser(KeywordParser):
         The way this happens is:
 
             * Split the :attr:`build_name` by the delimiter ``_``.
+            * Look up each piece of the :attr:`build_name` in the
+              :attr:`option_index`, collecting the matched options for each
+              flag.  Matching is case-insensitive, and the spelling from the
+              `.ini` file is used in the result.
             * For each supported flag name in the ``supported-config-flags.ini``:
 
-                * Find the options for this flag that exist in the
-                  :attr:`build_name`.
                 * If more than one option is found in the :attr:`build_name`
                   and the flag type is ``SELECT_ONE``, raise an exception.
                 * If no option is found in the :attr:`build_name`, use the
@@ -122,58 +306,521 @@ class ConfigKeywordParser(KeywordParser):
             dict:  A `dict` containing key/value pairs of flags and selected
             options, as found in the :attr:`build_name`.
         """
-        self.__assert_options_are_unique_across_all_flags()
-        self.__assert_all_build_name_options_are_valid()
+        self._selected_options = self.parsed_build_name.selected_options
 
-        build_name_options = self.build_name.split(self.delim)
-        selected_options = {}
+    def __parse_build_name(self, build_name):
+        """
+        Does the work of :func:`__parse_selected_options` for any build name,
+        without touching the state of this object.  This assumes the flag
+        schema has already been checked via
+        :func:`__assert_options_are_unique_across_all_flags`.
+
+        Parameters:
+            build_name (str):  The build name to parse.
+
+        Returns:
+            tuple:  The positions in :attr:`option_table` of the selected
+            options, in ascending order.
 
+        Raises:
+            ValueError:  If the ``build_name`` contains invalid options, or
+                multiple options for a ``SELECT_ONE`` flag.
+        """
+        option_index = self.option_index
+        if not hasattr(self, "_flag_offsets"):
+            self.__compile_option_table()
+
+        ranks_in_build_name = {flag_name: set() for flag_name in self.flag_names}
+        invalid_options = []
+        for option in build_name.split(self.delim):
+            if option == "":
+                continue
+            try:
+                flag_name, rank, flag_type = option_index[option.casefold()]
+            except KeyError:
+                invalid_options.append(option)
+                continue
+            ranks_in_build_name[flag_name].add(rank)
+
+        self.__assert_all_build_name_options_are_valid(invalid_options)
+
+        option_ids = []
         for flag_name in self.flag_names:
-            options, flag_type = self.get_options_and_flag_type_for_flag(flag_name)
-            options_in_build_name = [_ for _ in options
-                                     if _ in build_name_options]
+            options, flag_type = self._flag_options[flag_name]
+            ranks = sorted(ranks_in_build_name[flag_name])
 
-            if (flag_type == "SELECT_ONE"
-                    and len(options_in_build_name) > 1):
+            if flag_type == "SELECT_ONE" and len(ranks) > 1:
                 raise ValueError(self.get_msg_for_list(
                     "Multiple options found in build name for SELECT_ONE "
                     f"flag '{flag_name}':",
-                    options_in_build_name
+                    [options[_] for _ in ranks]
                 ))
-            elif (flag_type == "SELECT_MANY"
-                    and len(options_in_build_name) > 1):
-                selected_options[flag_name] = options_in_build_name
-            elif len(options_in_build_name) == 0:
+            elif len(ranks) == 0:
                 # Select default option if none in build name
-                selected_options[flag_name] = options[0]
-            else:  # len(options_in_build_name) == 1 case
-                selected_options[flag_name] = options_in_build_name[0]
+                ranks = [0]
 
+            flag_offset = self._flag_offsets[flag_name]
+            option_ids += [flag_offset + _ for _ in ranks]
 
-        self._selected_options = selected_options
+        return tuple(option_ids)
 
-    def __assert_all_build_name_options_are_valid(self):
+    def parse_many(self, build_names):
         """
-        Helper method to assert all options in a build name are valid.
+        Parses many build names at once, without changing the
+        :attr:`build_name` of this object.  This is much cheaper than setting
+        :attr:`build_name` and reading :attr:`selected_options_str` for each
+        build name in a loop, particularly when build names repeat.  For
+        example:
+
+        .. code-block:: python
+
+            >>> results = ckp.parse_many(["mpi_sparc", "no-mpi_openmp", "bad"])
+            >>> results[0].selected_options_str
+            '_mpi_serial_sparc'
+            >>> results[2].error is None
+            False
+
+        Parameters:
+            build_names (iterable):  The build names to parse.
+
+        Returns:
+            list:  A :class:`ParsedBuildName` for each of the ``build_names``,
+            in the same order.  Build names that cannot be parsed have their
+            ``error`` set to the exception message, rather than raising.
+        """
+        self.__assert_options_are_unique_across_all_flags()
+
+        option_table = self.option_table
+        results = []
+        parsed = {}
+        for build_name in build_names:
+            result = parsed.get(build_name)
+            if result is None:
+                try:
+                    option_ids = self.__parse_build_name(build_name)
+                except ValueError as e:
+                    result = ParsedBuildName(build_name, (), str(e),
+                                             option_table)
+                else:
+                    result = ParsedBuildName(build_name, option_ids, None,
+                                             option_table)
+                parsed[build_name] = result
+            results.append(result)
+
+        return results
+
+    def count_option_combinations(self):
+        """
+        Computes the number of distinct option combinations that can be
+        selected with the flags in ``supported-config-flags.ini``, i.e., the
+        number of items :func:`iter_option_combinations` would yield, without
+        enumerating them.  A ``SELECT_ONE`` flag with ``n`` options contributes
+        a factor of ``n``, and a ``SELECT_MANY`` flag with ``n`` options
+        contributes a factor of ``2**n - 1`` (its non-empty subsets).
+
+        Returns:
+            int:  The number of option combinations.
+        """
+        count = 1
+        for flag_name in self.flag_names:
+            count *= self.__count_flag_choices(flag_name)
+
+        return count
+
+    def iter_option_combinations(self):
+        """
+        Lazily generates every option combination that can be selected with
+        the flags in ``supported-config-flags.ini``:  the product of the
+        options of each ``SELECT_ONE`` flag with the non-empty subsets of the
+        options of each ``SELECT_MANY`` flag.  Each combination is a `dict`
+        shaped like :attr:`selected_options`, and can be turned into the
+        corresponding string with :func:`get_selected_options_str`.  For the
+        example configuration file in the class documentation:
+
+        .. code-block:: python
+
+            >>> combinations = ckp.iter_option_combinations()
+            >>> next(combinations)
+            {'use-mpi': 'mpi', 'node-type': 'serial', 'package-enables': 'no-package-enables'}
+            >>> next(combinations)
+            {'use-mpi': 'mpi', 'node-type': 'serial', 'package-enables': 'empire'}
+
+        Combinations are generated one at a time, so this is safe to use even
+        when :func:`count_option_combinations` is far too large to fit in
+        memory.
+
+        Yields:
+            dict:  The flags and their selected options.
+        """
+        if not hasattr(self, "_flag_options"):
+            self.__compile_flag_schema()
+
+        flag_names = self.flag_names
+
+        def combinations_from(idx, selected_options):
+            if idx == len(flag_names):
+                yield dict(selected_options)
+                return
+            flag_name = flag_names[idx]
+            for choice in self.__iter_flag_choices(flag_name):
+                selected_options[flag_name] = choice
+                yield from combinations_from(idx + 1, selected_options)
+
+        yield from combinations_from(0, {})
+
+    def get_option_combination(self, index):
         """
-        build_name_options = self.build_name.split(self.delim)
+        Computes the option combination that :func:`iter_option_combinations`
+        would yield at position ``index`` without generating any of the ones
+        before it.  Together with :func:`count_option_combinations`, this
+        allows sampling the space of combinations, e.g.:
 
-        valid_options = self.get_options_list_for_all_flags()
-        invalid_options = [_ for _ in build_name_options
-                           if _ not in valid_options and _ != ""]
+        .. code-block:: python
+
+            >>> idx = random.randrange(ckp.count_option_combinations())
+            >>> ckp.get_option_combination(idx)
+
+        Parameters:
+            index (int):  The position of the combination, from ``0`` up to
+                (but not including) :func:`count_option_combinations`.
+
+        Returns:
+            dict:  The flags and their selected options.
 
+        Raises:
+            IndexError:  If ``index`` is out of range.
+        """
+        if not 0 <= index < self.count_option_combinations():
+            raise IndexError(f"Option combination index {index} is out of "
+                             "range.")
+
+        # The last flag varies fastest, so peel off its digit first
+        selected_options = {}
+        for flag_name in reversed(self.flag_names):
+            index, choice_idx = divmod(index,
+                                       self.__count_flag_choices(flag_name))
+            selected_options[flag_name] = self.__get_flag_choice(flag_name,
+                                                                 choice_idx)
+
+        return {_: selected_options[_] for _ in self.flag_names}
+
+    def __count_flag_choices(self, flag_name):
+        """
+        Helper method for :func:`count_option_combinations`.
+
+        Returns:
+            int:  The number of choices for a single flag.
+        """
+        if not hasattr(self, "_flag_options"):
+            self.__compile_flag_schema()
+
+        options, flag_type = self._flag_options[flag_name]
+        if flag_type == "SELECT_ONE":
+            return len(options)
+
+        return 2**len(options) - 1
+
+    def __iter_flag_choices(self, flag_name):
+        """
+        Helper method for :func:`iter_option_combinations` that lazily
+        generates the choices for a single flag:  each option for a
+        ``SELECT_ONE`` flag, or each non-empty subset of options for a
+        ``SELECT_MANY`` flag, smallest subsets first.  Subsets with a single
+        option are given as a `str` and larger ones as a `list`, the same as in
+        :attr:`selected_options`.
+
+        Yields:
+            str, list:  A choice of option(s) for the flag.
+        """
+        options, flag_type = self._flag_options[flag_name]
+        if flag_type == "SELECT_ONE":
+            yield from options
+            return
+
+        for size in range(1, len(options) + 1):
+            for subset in itertools.combinations(options, size):
+                yield subset[0] if size == 1 else list(subset)
+
+    def __get_flag_choice(self, flag_name, choice_idx):
+        """
+        Helper method for :func:`get_option_combination` that computes the
+        choice :func:`__iter_flag_choices` would yield at position
+        ``choice_idx`` for a single flag.
+
+        Returns:
+            str, list:  A choice of option(s) for the flag.
+        """
+        options, flag_type = self._flag_options[flag_name]
+        if flag_type == "SELECT_ONE":
+            return options[choice_idx]
+
+        # Find the size of the subset, then the subset itself, following the
+        # lexicographic order of itertools.combinations
+        n = len(options)
+        size = 1
+        while choice_idx >= self.__n_choose_k(n, size):
+            choice_idx -= self.__n_choose_k(n, size)
+            size += 1
+
+        subset = []
+        first = 0
+        for remaining in range(size, 0, -1):
+            for option_idx in range(first, n):
+                count = self.__n_choose_k(n - option_idx - 1, remaining - 1)
+                if choice_idx < count:
+                    subset.append(options[option_idx])
+                    first = option_idx + 1
+                    break
+                choice_idx -= count
+
+        return subset[0] if size == 1 else subset
+
+    @staticmethod
+    def __n_choose_k(n, k):
+        """
+        The binomial coefficient, i.e., ``math.comb`` for Python < 3.8.
+
+        Returns:
+            int:  The number of ways to choose ``k`` items from ``n``.
+        """
+        if k < 0 or k > n:
+            return 0
+
+        return math.factorial(n) // (math.factorial(k) * math.factorial(n - k))
+
+    def __assert_all_build_name_options_are_valid(self, invalid_options):
+        """
+        Helper method to assert all options in a build name are valid.
+
+        Parameters:
+            invalid_options (list):  The pieces of the :attr:`build_name` that
+                were not found in the :attr:`option_index`.
+        """
         if len(invalid_options) > 0:
             err_msg = ("\n\nThe build name contains the following invalid "
                        "options:\n")
 
             for opt in invalid_options:
                 err_msg += f"\n  - {opt}"
+                suggestions = self.suggestion_index.get_suggestions(opt)
+                if len(suggestions) > 0:
+                    err_msg += ("  (did you mean "
+                                f"{', '.join(repr(_) for _ in suggestions)}?)")
 
             err_msg += ("\n\nValid options can be found in "
                         f"'{self.config_filename}'.")
 
             raise ValueError(err_msg)
 
+    @property
+    def option_index(self):
+        """
+        A lookup table compiled once from ``supported-config-flags.ini`` that
+        maps each casefolded option to a tuple of its flag name, its position
+        (rank) within that flag's options, and the flag type.  For the example
+        configuration file in the class documentation:
+
+        .. code-block:: python
+
+            >>> ckp.option_index["no-mpi"]
+            ('use-mpi', 1, 'SELECT_ONE')
+            >>> ckp.option_index["sparc"]
+            ('package-enables', 2, 'SELECT_MANY')
+
+        This lets a build name be resolved in a single pass over its options,
+        regardless of the number of flags and options in the file.
+
+        Returns:
+            dict:  The casefolded option to ``(flag_name, rank, flag_type)``
+            lookup table.
+        """
+        if not hasattr(self, "_option_index"):
+            self.__compile_flag_schema()
+
+        return self._option_index
+
+    @property
+    def option_table(self):
+        """
+        A ``(flag_name, option)`` pair for every option in
+        ``supported-config-flags.ini``, in the order they appear in the file.
+        The position of an option in this table is its ID in
+        :attr:`ParsedBuildName.option_ids`.
+
+        Returns:
+            tuple:  The table of options.
+        """
+        if not hasattr(self, "_option_table"):
+            self.__compile_option_table()
+
+        return self._option_table
+
+    def __compile_option_table(self):
+        """
+        Builds the :attr:`option_table`, along with ``_flag_offsets``, the
+        position in the table of the first (default) option of each flag.
+        """
+        if not hasattr(self, "_flag_options"):
+            self.__compile_flag_schema()
+
+        option_table = []
+        flag_offsets = {}
+        for flag_name in self.flag_names:
+            options, flag_type = self._flag_options[flag_name]
+            flag_offsets[flag_name] = len(option_table)
+            option_table += [(sys.intern(flag_name), sys.intern(_))
+                             for _ in options]
+
+        self._flag_offsets = flag_offsets
+        self._option_table = tuple(option_table)
+
+    @property
+    def suggestion_index(self):
+        """
+        A :class:`SuggestionIndex` of all the options in
+        ``supported-config-flags.ini``, used to suggest valid options in place
+        of invalid ones found in the :attr:`build_name`.
+
+        Returns:
+            SuggestionIndex:  The index of options.
+        """
+        if not hasattr(self, "_suggestion_index"):
+            self._suggestion_index = SuggestionIndex(
+                self.get_options_list_for_all_flags()
+            )
+
+        return self._suggestion_index
+
+    @property
+    def flag_defaults(self):
+        """
+        The default option for each flag, i.e., the first option listed for
+        the flag in ``supported-config-flags.ini``.
+
+        Returns:
+            dict:  A `dict` of flag names to their default options.
+        """
+        if not hasattr(self, "_flag_defaults"):
+            self.__compile_flag_schema()
+
+        return self._flag_defaults
+
+    def __compile_flag_schema(self):
+        """
+        Reads the options and type of every flag in
+        ``supported-config-flags.ini`` exactly once and stores the tables used
+        when parsing build names:
+
+            * ``_flag_options``:  The options and flag type for each flag.
+            * ``_flag_defaults``:  See :attr:`flag_defaults`.
+            * ``_option_index``:  See :attr:`option_index`.
+
+        If an option appears for more than one flag (ignoring case), the
+        first occurrence is kept in the index; such files are rejected by
+        :func:`__assert_options_are_unique_across_all_flags`.
+
+        If a :attr:`schema_cache_dir` was given, the tables are also saved
+        there so later processes can skip parsing the `.ini` file.
+        """
+        flag_options = {}
+        flag_defaults = {}
+        option_index = {}
+        for flag_name in self.flag_names:
+            options, flag_type = self.get_options_and_flag_type_for_flag(
+                flag_name
+            )
+            flag_options[flag_name] = (options, flag_type)
+            flag_defaults[flag_name] = options[0]
+            for rank, option in enumerate(options):
+                option_index.setdefault(option.casefold(),
+                                        (flag_name, rank, flag_type))
+
+        self._flag_options = flag_options
+        self._flag_defaults = flag_defaults
+        self._option_index = option_index
+
+        self.__write_flag_schema_cache()
+
+    @property
+    def flag_schema_cache_file(self):
+        """
+        The file in :attr:`schema_cache_dir` holding the compiled flag schema
+        for the current contents of ``supported-config-flags.ini``.  The name
+        includes the SHA-256 hash of the `.ini` file, so any change to the
+        file results in a cache miss.
+
+        Returns:
+            Path:  The path to the cache file, or ``None`` if
+            :attr:`schema_cache_dir` is ``None``.
+        """
+        if self.schema_cache_dir is None:
+            return None
+
+        if not hasattr(self, "_config_file_hash"):
+            self._config_file_hash = get_file_hash(self.config_filename)
+
+        return (self.schema_cache_dir /
+                f"flag-schema-{self._config_file_hash}.json")
+
+    def __load_flag_schema_cache(self):
+        """
+        Populates :attr:`flag_names` and the tables described in
+        :func:`__compile_flag_schema` from :attr:`flag_schema_cache_file`, if
+        it exists and was written by this version of the cache format.
+
+        Returns:
+            bool:  ``True`` if the cached schema was loaded, ``False`` if the
+            `.ini` file needs to be parsed instead.
+        """
+        cache_file = self.flag_schema_cache_file
+        if cache_file is None:
+            return False
+
+        try:
+            with open(cache_file, "r") as F:
+                data = json.load(F)
+            if data["version"] != self.FLAG_SCHEMA_CACHE_VERSION:
+                return False
+            flag_names = data["flag_names"]
+            flag_options = {flag_name: (options, flag_type)
+                            for flag_name, (options, flag_type)
+                            in data["flag_options"].items()}
+            flag_defaults = data["flag_defaults"]
+            option_index = {option: tuple(entry)
+                            for option, entry in data["option_index"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        self.flag_names = flag_names
+        self._flag_options = flag_options
+        self._flag_defaults = flag_defaults
+        self._option_index = option_index
+        return True
+
+    def __write_flag_schema_cache(self):
+        """
+        Saves the compiled flag schema to :attr:`flag_schema_cache_file`.  The
+        file is written to a temporary file first and then moved into place so
+        concurrent processes never read a partially written cache.  Failing to
+        write the cache (e.g., a read-only file system) is not an error; the
+        `.ini` file will simply be parsed again next time.
+        """
+        cache_file = self.flag_schema_cache_file
+        if cache_file is None:
+            return
+
+        data = {
+            "version": self.FLAG_SCHEMA_CACHE_VERSION,
+            "flag_names": self.flag_names,
+            "flag_options": self._flag_options,
+            "flag_defaults": self._flag_defaults,
+            "option_index": self._option_index,
+        }
+        try:
+            write_file_atomically(cache_file, json.dumps(data))
+        except OSError:
+            pass
+
     def get_options_and_flag_type_for_flag(self, flag_name):
         """
         A thin wrapper around :func:`get_values_for_section_key` that applies
@@ -204,8 +851,9 @@ class ConfigKeywordParser(KeywordParser):
 
     def __assert_options_are_unique_across_all_flags(self):
         """
-        Ensures options are unique across all flags. So, an exception would be
-        raised for the following ``supported-config-flags.ini``:
+        Ensures options are unique across all flags, ignoring case. So, an
+        exception would be raised for the following
+        ``supported-config-flags.ini``:
 
         .. code-block:: ini
 
@@ -216,10 +864,18 @@ class ConfigKeywordParser(KeywordParser):
             use-asan:
                 yes  # Duplicate of 'yes' in 'use-mpi'!
                 no   # Same here
+
+        This check depends only on ``supported-config-flags.ini``, not on the
+        :attr:`build_name`, so it is run once per parser and skipped for any
+        build names parsed afterwards.
         """
+        if getattr(self, "_flag_schema_is_valid", False):
+            return
+
         options_list = self.get_options_list_for_all_flags()
-        duplicates = [_ for _ in set(options_list)
-                      if options_list.count(_) > 1]
+        counts = Counter(_.casefold() for _ in options_list)
+        duplicates = [_ for _ in dict.fromkeys(options_list)
+                      if counts[_.casefold()] > 1]
         try:
             assert duplicates == []
         except AssertionError:
@@ -234,6 +890,8 @@ class ConfigKeywordParser(KeywordParser):
             )
             sys.exit(msg)
 
+        self._flag_schema_is_valid = True
+
     def get_options_list_for_all_flags(self):
         """
         Get an list of all options for all flags in
@@ -244,11 +902,12 @@ class ConfigKeywordParser(KeywordParser):
             list:  A list containing all options for all flags.
         """
         if not hasattr(self, "_options_list"):
+            if not hasattr(self, "_flag_options"):
+                self.__compile_flag_schema()
+
             options_list = []
             for flag_name in self.flag_names:
-                options, flag_type = self.get_options_and_flag_type_for_flag(
-                    flag_name
-                )
+                options, flag_type = self._flag_options[flag_name]
                 options_list += options
 
             self._options_list = options_list
@@ -282,6 +941,8 @@ class ConfigKeywordParser(KeywordParser):
             delattr(self, "_selected_options_str")
         if hasattr(self, "_selected_options"):
             delattr(self, "_selected_options")
+        if hasattr(self, "_parsed_build_name"):
+            delattr(self, "_parsed_build_name")
 
         self._build_name = new_build_name
 
@@ -318,17 +979,20 @@ class ConfigKeywordParser(KeywordParser):
         Returns:
             str:  The formatted message.
         """
-        extras = "\n- Supported Flags Are:\n"
+        if not hasattr(self, "_flag_options"):
+            self.__compile_flag_schema()
+
+        extras = ["\n- Supported Flags Are:\n"]
         for flag_name in self.flag_names:
-            options, flag_type = self.get_options_and_flag_type_for_flag(flag_name)
+            options, flag_type = self._flag_options[flag_name]
 
-            extras += f"  - {flag_name}\n"
+            extras.append(f"  - {flag_name}\n")
             s = "s" if len(options) > 0 else ""
-            extras += f"    * Option{s} ({flag_type}):\n"
+            extras.append(f"    * Option{s} ({flag_type}):\n")
             for idx, o in enumerate(options):
                 default = " (default)" if idx == 0 else ""
-                extras += (f"      - {o}{default}\n")
+                extras.append(f"      - {o}{default}\n")
 
-        extras += f"\nSee {str(self.config_filename)} for details."
-        msg = self.get_formatted_msg(msg, kind=kind, extras=extras)
+        extras.append(f"\nSee {str(self.config_filename)} for details.")
+        msg = self.get_formatted_msg(msg, kind=kind, extras="".join(extras))
         return msg
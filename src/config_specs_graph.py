@@ -0,0 +1,237 @@
+import json
+from src.file_utils import get_key_hash
+
+
+class ConfigSpecsGraph:
+    """
+    This class describes how the sections of ``config-specs.ini`` depend on
+    one another through ``use`` operations, using only the raw (unparsed)
+    contents of the file.  For example, given:
+
+    .. code-block:: ini
+
+        [ATS1]
+        opt-set-cmake-var MPI_EXEC_NUMPROCS_FLAG STRING : -p
+
+        [ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_none]
+        use ATS1
+
+    the ``ats1_...`` section uses ``ATS1``, so a change to ``ATS1`` changes
+    the result of evaluating the ``ats1_...`` section too.
+
+    The sections that are not ALL-CAPS are complete configurations, which
+    are also indexed by the system name they start with, e.g., ``ats1``.
+    The reverse of :attr:`uses`, :attr:`used_by`, gives the complete
+    configurations affected by a change to any section.
+
+    Usage:
+
+    .. code-block:: python
+
+        graph = ConfigSpecsGraph(
+            ConfigParserEnhanced("config-specs.ini").configparserdata
+        )
+        graph.uses["ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_none"]
+        # ['ATS1']
+        graph.complete_configs_by_system["ats1"]
+        # ['ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_none']
+
+    Parameters:
+        config_specs_data (configparser.ConfigParser):  The raw data of
+            ``config-specs.ini``, e.g.,
+            :attr:`ConfigParserEnhanced.configparserdata`.
+    """
+
+    def __init__(self, config_specs_data):
+        self.sections = list(config_specs_data.sections())
+
+        self.uses = {}
+        self.section_hashes = {}
+        for section in self.sections:
+            options = list(config_specs_data[section].items())
+            self.uses[section] = [
+                _ for _ in (self.get_used_section(key) for key, value in options)
+                if _ is not None and config_specs_data.has_section(_)
+            ]
+            self.section_hashes[section] = get_key_hash(section,
+                                                        json.dumps(options))
+
+        self.used_by = {_: [] for _ in self.sections}
+        for section in self.sections:
+            for used in self.uses[section]:
+                self.used_by[used].append(section)
+
+        self.complete_configs = [_ for _ in self.sections if _.upper() != _]
+        self.complete_configs_by_system = {}
+        for section in self.complete_configs:
+            self.complete_configs_by_system.setdefault(
+                self.get_system_name(section), []
+            ).append(section)
+
+        self._chain_hashes = {}
+
+    @staticmethod
+    def get_used_section(option_key):
+        """
+        Gets the name of the section referenced by a ``use`` operation.
+
+        Parameters:
+            option_key (str):  The key of an option in a section, e.g.,
+                ``"use ATS1"``.
+
+        Returns:
+            str:  The name of the section used, or ``None`` if the option is
+            not a ``use`` operation.
+        """
+        tokens = option_key.split(maxsplit=1)
+        if len(tokens) != 2 or tokens[0] != "use":
+            return None
+
+        return tokens[1].strip().strip("'\"")
+
+    @staticmethod
+    def get_system_name(section):
+        """
+        Gets the name of the system a complete configuration is for.
+
+        Parameters:
+            section (str):  The name of the section, e.g.,
+                ``"ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_none"``.
+
+        Returns:
+            str:  The system name, e.g., ``"ats1"``.
+        """
+        return section.split("_")[0]
+
+    def get_chain_hash(self, section):
+        """
+        Gets a hash of the contents of a section together with the contents
+        of every section it reaches through ``use`` operations, so it changes
+        whenever the result of evaluating the section could change.  Hashes
+        are memoized, so each section is only hashed once.
+
+        Parameters:
+            section (str):  The name of the section.
+
+        Returns:
+            str:  The hex digest of the section and its dependencies.
+        """
+        if section not in self._chain_hashes:
+            # Guard against infinite recursion on a `use` cycle; the cycle
+            # itself is reported by find_use_cycle().
+            self._chain_hashes[section] = self.section_hashes[section]
+            self._chain_hashes[section] = get_key_hash(
+                self.section_hashes[section],
+                *[self.get_chain_hash(_) for _ in self.uses[section]]
+            )
+
+        return self._chain_hashes[section]
+
+    def get_reachable_sections(self, section):
+        """
+        Gets a section and every section it reaches through ``use``
+        operations, directly or through other sections, i.e., every section
+        that affects the result of evaluating it.
+
+        Parameters:
+            section (str):  The name of the section.
+
+        Returns:
+            list:  The section names, starting with ``section`` itself,
+            each listed once in the order they are first reached.
+        """
+        reachable = [section]
+        seen = {section}
+        for reached in reachable:  # Grows as new sections are reached
+            for used in self.uses[reached]:
+                if used not in seen:
+                    seen.add(used)
+                    reachable.append(used)
+
+        return reachable
+
+    def find_use_cycle(self):
+        """
+        Looks for sections that ``use`` each other in a cycle, e.g.,
+
+        .. code-block:: ini
+
+            [A]
+            use B
+
+            [B]
+            use A
+
+        Returns:
+            list:  The sections in the first cycle found, starting and ending
+            with the same section, e.g., ``["A", "B", "A"]``, or ``None`` if
+            there are no cycles.
+        """
+        # Iterative depth-first search; a section is "on the path" while its
+        # uses are being searched, and reaching it again means a cycle.
+        finished = set()
+        for root in self.sections:
+            if root in finished:
+                continue
+
+            path = [root]
+            on_path = {root}
+            to_search = [iter(self.uses[root])]
+            while len(to_search) > 0:
+                used = next(to_search[-1], None)
+                if used is None:
+                    section = path.pop()
+                    on_path.discard(section)
+                    finished.add(section)
+                    to_search.pop()
+                    continue
+                if used in on_path:
+                    return path[path.index(used):] + [used]
+                if used not in finished:
+                    path.append(used)
+                    on_path.add(used)
+                    to_search.append(iter(self.uses[used]))
+
+        return None
+
+    def get_affected_complete_configs(self, sections):
+        """
+        Gets the complete configurations affected by a change to any of the
+        given sections, i.e., those among the sections themselves and every
+        section that reaches one of them through ``use`` operations.  Only
+        the sections that use them are visited, so this is fast even for
+        files with many complete configurations.
+
+        Parameters:
+            sections (iterable):  The names of the changed sections.  Names
+                not in this graph are ignored.
+
+        Returns:
+            list:  The affected complete configurations, in the order they
+            appear in the file.
+        """
+        affected = {_ for _ in sections if _ in self.used_by}
+        to_visit = list(affected)
+        while len(to_visit) > 0:
+            for user in self.used_by[to_visit.pop()]:
+                if user not in affected:
+                    affected.add(user)
+                    to_visit.append(user)
+
+        return [_ for _ in self.complete_configs if _ in affected]
+
+    def get_changed_sections(self, other):
+        """
+        Compares this graph with one for another version of the same file.
+
+        Parameters:
+            other (ConfigSpecsGraph):  The graph of the other version.
+
+        Returns:
+            set:  The sections that were added, removed, or whose contents
+            differ between the two versions.
+        """
+        return {
+            _ for _ in set(self.sections) | set(other.sections)
+            if self.section_hashes.get(_) != other.section_hashes.get(_)
+        }
@@ -0,0 +1,185 @@
+"""
+Helpers for the files :class:`GenConfig` and :class:`ConfigKeywordParser`
+cache between runs.
+"""
+import fcntl
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+
+
+def get_file_hash(filename):
+    """
+    Computes the SHA-256 hash of the contents of a file.
+
+    Parameters:
+        filename (str, Path):  The file to hash.
+
+    Returns:
+        str:  The hex digest of the file contents.
+    """
+    return hashlib.sha256(Path(filename).read_bytes()).hexdigest()
+
+
+def get_file_identity(filename):
+    """
+    Gets the identity of a file on disk, i.e., its device, inode, size and
+    modification time, which changes whenever the file is written or
+    replaced.  This is much cheaper than :func:`get_file_hash`, as the file
+    is not read, at the cost of also changing when a file is rewritten with
+    the same contents.
+
+    Parameters:
+        filename (str, Path):  The file.
+
+    Returns:
+        tuple:  The ``st_dev``, ``st_ino``, ``st_size`` and ``st_mtime_ns``
+        of the file.
+    """
+    stat = Path(filename).stat()
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+# resolved path -> (stat identity, hash) of every file hashed by
+# get_file_hashes in this process
+_file_hashes = {}
+
+
+def get_file_hashes(filenames, cache_file=None):
+    """
+    Gets the :func:`get_file_hash` of each of the given files, only reading
+    those whose :func:`get_file_identity` changed since they were last
+    hashed, by this process or, if a ``cache_file`` is given, by any process
+    sharing it.  As the hashes only depend on the contents of the files,
+    they are the same for, e.g., every checkout of the same files.
+
+    Parameters:
+        filenames (list):  The files to hash.
+        cache_file (str, Path):  A JSON file recording the identity and hash
+            of each file hashed, updated with :func:`write_file_atomically`.
+            Defaults to only reusing the hashes of this process.
+
+    Returns:
+        list:  The hex digest of the contents of each file, in the same order
+        as ``filenames``.
+    """
+    cached = {}
+    if cache_file is not None:
+        try:
+            with open(cache_file, "r") as F:
+                cached = json.load(F)
+        except (OSError, ValueError):
+            pass
+        if not isinstance(cached, dict):
+            cached = {}
+
+    hashes = []
+    changed = False
+    for filename in filenames:
+        path = os.path.realpath(filename)
+        identity = list(get_file_identity(path))
+        if path in _file_hashes and _file_hashes[path][0] == identity:
+            file_hash = _file_hashes[path][1]
+        elif (isinstance(cached.get(path), list) and len(cached[path]) == 2
+                and cached[path][0] == identity):
+            file_hash = cached[path][1]
+        else:
+            file_hash = get_file_hash(path)
+
+        _file_hashes[path] = (identity, file_hash)
+        if cached.get(path) != [identity, file_hash]:
+            cached[path] = [identity, file_hash]
+            changed = True
+        hashes.append(file_hash)
+
+    if changed and cache_file is not None:
+        try:
+            write_file_atomically(cache_file, json.dumps(cached))
+        except OSError:
+            pass
+
+    return hashes
+
+
+def get_key_hash(*key_parts):
+    """
+    Combines any number of strings (e.g., file paths and the hashes from
+    :func:`get_file_hash`) into a single SHA-256 hash, suitable for naming a
+    cache file.
+
+    Returns:
+        str:  The hex digest of the combined key.
+    """
+    key = hashlib.sha256()
+    for part in key_parts:
+        key.update(str(part).encode())
+        key.update(b"\0")
+
+    return key.hexdigest()
+
+
+def write_file_atomically(filename, contents):
+    """
+    Writes ``contents`` to a temporary file in the same directory as
+    ``filename`` and then renames it into place, so that other processes
+    reading ``filename`` only ever see the old or the new contents, never a
+    partially written file.  Any missing parent directories are created.
+
+    Parameters:
+        filename (str, Path):  The file to write.
+        contents (str, bytes):  The contents to write.
+
+    Raises:
+        OSError:  If the file cannot be written.
+    """
+    filename = Path(filename)
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_file = tempfile.mkstemp(dir=filename.parent,
+                                    prefix=f".{filename.name}.")
+    try:
+        with os.fdopen(fd, "wb" if isinstance(contents, bytes) else "w") as F:
+            F.write(contents)
+        os.replace(tmp_file, filename)
+    except BaseException:
+        os.unlink(tmp_file)
+        raise
+
+
+def write_file_if_changed(filename, contents):
+    """
+    Writes ``contents`` to ``filename`` with :func:`write_file_atomically`,
+    unless ``filename`` already holds exactly ``contents``, in which case it
+    is left untouched, so its modification time does not change and nothing
+    depending on it (e.g., a CMake build tree including a fragment) is
+    rebuilt.  The comparison and the write happen under an advisory lock on a
+    ``.<name>.lock`` file next to ``filename``, so concurrent writers of the
+    same file take turns.
+
+    Parameters:
+        filename (str, Path):  The file to write.
+        contents (str, bytes):  The contents to write.
+
+    Returns:
+        bool:  ``True`` if the file was written, ``False`` if it was
+        unchanged.
+
+    Raises:
+        OSError:  If the file cannot be written.
+    """
+    filename = Path(filename)
+    if isinstance(contents, str):
+        contents = contents.encode()
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    with open(filename.parent / f".{filename.name}.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if (filename.is_file() and get_file_hash(filename) ==
+                    hashlib.sha256(contents).hexdigest()):
+                return False
+            write_file_atomically(filename, contents)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+    return True
@@ -0,0 +1,112 @@
+"""
+A process-wide registry of parsed ``.ini`` files, so that each file is read
+and parsed at most once per process, no matter how many :class:`GenConfig`,
+:class:`ConfigKeywordParser` or :class:`SetProgramOptionsCMake` objects use
+it, and of the objects built from them, such as :class:`ConfigSpecsGraph`.
+"""
+from configparserenhanced import ConfigParserEnhanced
+import os
+from pathlib import Path
+
+
+# (parser_class, resolved path) -> (stat identity, parsed object)
+_parsed_inis = {}
+
+# (key, resolved paths) -> (stat identities, object)
+_derived_objects = {}
+
+
+def get_file_identities(filenames):
+    """
+    Gets the stat identity (i.e., device, inode, size and modification time)
+    of each file, which :func:`get_parsed_ini` and
+    :func:`get_derived_object` use to tell whether it changed.
+
+    Parameters:
+        filenames (list):  The files.
+
+    Returns:
+        tuple:  The identity of each file, or ``None`` for a missing file.
+    """
+    identities = []
+    for filename in filenames:
+        try:
+            stat = Path(filename).stat()
+        except OSError:
+            identities.append(None)
+            continue
+        identities.append(
+            (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        )
+
+    return tuple(identities)
+
+
+def get_parsed_ini(filename, parser_class=ConfigParserEnhanced):
+    """
+    Gets the ``parser_class(filename)`` object shared by every caller in this
+    process asking for the same class and file.  Both its raw and its parsed
+    data are lazily evaluated and cached on the object, so they are only
+    computed by the first caller that needs them.  If the file has changed
+    since the object was created (i.e., its device, inode, size or
+    modification time differ), a new object is created in its place.
+
+    Parameters:
+        filename (str, Path):  The ``.ini`` file.
+        parser_class (type):  :class:`ConfigParserEnhanced` or a subclass of
+            it, e.g., :class:`SetProgramOptionsCMake`.
+
+    Returns:
+        ConfigParserEnhanced:  The shared ``parser_class`` object.
+    """
+    path = Path(os.path.realpath(filename))
+    identity = get_file_identities([path])[0]
+    if identity is None:
+        # Let the parser report the missing file in its usual way.
+        return parser_class(filename)
+
+    key = (parser_class, path)
+    if key not in _parsed_inis or _parsed_inis[key][0] != identity:
+        _parsed_inis[key] = (identity, parser_class(path))
+
+    return _parsed_inis[key][1]
+
+
+def get_derived_object(key, filenames, factory):
+    """
+    Gets the object built by ``factory()`` from the given ``.ini`` files,
+    shared by every caller in this process asking for the same ``key`` and
+    files, e.g., the :class:`ConfigSpecsGraph` of a ``config-specs.ini``.
+    If any of the files has changed since the object was built (see
+    :func:`get_file_identities`), a new object is built in its place.
+
+    Parameters:
+        key (str, tuple):  Identifies what ``factory`` builds from the files.
+        filenames (list):  The ``.ini`` files the object is built from.
+        factory (callable):  Builds the object.
+
+    Returns:
+        object:  The shared object.
+    """
+    paths = tuple(Path(os.path.realpath(_)) for _ in filenames)
+    identities = get_file_identities(paths)
+    if None in identities:
+        # Let the factory report the missing file in its usual way.
+        return factory()
+
+    registry_key = (key, paths)
+    if (registry_key not in _derived_objects
+            or _derived_objects[registry_key][0] != identities):
+        _derived_objects[registry_key] = (identities, factory())
+
+    return _derived_objects[registry_key][1]
+
+
+def clear_parsed_inis():
+    """
+    Forgets every object returned by :func:`get_parsed_ini` and
+    :func:`get_derived_object`, so that the next call for each file parses
+    it again.
+    """
+    _parsed_inis.clear()
+    _derived_objects.clear()
@@ -0,0 +1,126 @@
+from configparserenhanced import ConfigParserEnhanced
+from setprogramoptions import SetProgramOptionsCMake
+
+
+class MemoizedSetProgramOptionsCMake(SetProgramOptionsCMake):
+    """
+    This class is a :class:`SetProgramOptionsCMake` that evaluates each
+    section reached through a ``use`` operation only once.  In
+    ``config-specs.ini``, partial sections such as ``[COMMON]`` or
+    ``[BUILD-TYPE|DEBUG]`` are used by hundreds of complete configurations:
+
+    .. code-block:: ini
+
+        [BUILD-TYPE|DEBUG]
+        opt-set-cmake-var CMAKE_BUILD_TYPE STRING : DEBUG
+
+        [rhel7_..._debug_...]
+        use BUILD-TYPE|DEBUG
+
+    The first time a section is used, the operations it (and every section
+    it uses in turn) applies to the option list are recorded, i.e., the
+    options added by ``opt-set``, ``opt-set-cmake-var``, etc., and the
+    options removed by ``opt-remove``.  Every later ``use`` of the section
+    replays the recorded operations through the same helpers rather than
+    parsing the section again, so evaluating many complete configurations
+    costs one parse per unique section.  The results are the same as those
+    of :class:`SetProgramOptionsCMake`.
+
+    Parameters:
+        filename (str, Path):  The ``config-specs.ini`` file.
+    """
+
+    def __init__(self, filename=None):
+        super().__init__(filename)
+        self._evaluated_uses = {}
+        self._recordings = []
+
+    @ConfigParserEnhanced.operation_handler
+    def _handler_use(self, section_name, handler_parameters):
+        """
+        Handler for ``use`` operations, which applies the operations of the
+        used section, replaying them if the section was used before.
+
+        Parameters:
+            section_name (str):  The name of the section being processed.
+            handler_parameters (HandlerParameters):  The parameters passed to
+                the handler.
+
+        Returns:
+            int:  ``0`` on success.
+        """
+        used_section = handler_parameters.params[0]
+        if used_section in handler_parameters.data_internal["processed_sections"]:
+            # Let ConfigParserEnhanced report the cycle.
+            return super()._handler_use(section_name, handler_parameters)
+
+        if used_section in self._evaluated_uses:
+            self.__replay(section_name, handler_parameters,
+                          self._evaluated_uses[used_section])
+            return 0
+
+        self._recordings.append([])
+        try:
+            self._parse_section_r(used_section, handler_parameters,
+                                  finalize=False)
+        finally:
+            operations = self._recordings.pop()
+
+        self._evaluated_uses[used_section] = operations
+        if len(self._recordings) > 0:
+            self._recordings[-1].extend(operations)
+
+        return 0
+
+    def _option_handler_helper_add(self, section_name, handler_parameters):
+        """
+        Adds an option to the option list, recording the operation for the
+        section being evaluated for the first time, if any.
+        """
+        self.__record("_option_handler_helper_add", handler_parameters)
+        return super()._option_handler_helper_add(section_name,
+                                                  handler_parameters)
+
+    def _option_handler_helper_remove(self, section_name, handler_parameters):
+        """
+        Removes options from the option list, recording the operation for the
+        section being evaluated for the first time, if any.
+        """
+        self.__record("_option_handler_helper_remove", handler_parameters)
+        return super()._option_handler_helper_remove(section_name,
+                                                     handler_parameters)
+
+    def __record(self, helper_name, handler_parameters):
+        """
+        Records an operation on the option list for the innermost section
+        being evaluated for the first time.
+
+        Parameters:
+            helper_name (str):  The name of the helper applying the operation.
+            handler_parameters (HandlerParameters):  The parameters passed to
+                the helper.
+        """
+        if len(self._recordings) > 0:
+            self._recordings[-1].append((
+                helper_name,
+                handler_parameters.op,
+                handler_parameters.value,
+                list(handler_parameters.params),
+            ))
+
+    def __replay(self, section_name, handler_parameters, operations):
+        """
+        Applies recorded operations to the option list being built.
+
+        Parameters:
+            section_name (str):  The name of the section being processed.
+            handler_parameters (HandlerParameters):  The parameters of the
+                ``use`` operation, which share the option list being built.
+            operations (list):  The operations recorded by :func:`__record`.
+        """
+        replay_parameters = self._new_handler_parameters(handler_parameters)
+        for helper_name, op, value, params in operations:
+            replay_parameters.op = op
+            replay_parameters.value = value
+            replay_parameters.params = params
+            getattr(self, helper_name)(section_name, replay_parameters)
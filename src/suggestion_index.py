@@ -0,0 +1,86 @@
+from collections import Counter, defaultdict
+import heapq
+
+
+class SuggestionIndex:
+    """
+    This class indexes a collection of valid strings (e.g., the options in
+    ``supported-config-flags.ini`` or the complete configurations in
+    ``config-specs.ini``) by their character n-grams, so that the closest
+    matches to a misspelled string can be found without comparing it against
+    every candidate.  Matching is case-insensitive.
+
+    Usage:
+
+    .. code-block:: python
+
+        index = SuggestionIndex(["mpi", "no-mpi", "serial", "openmp"])
+        index.get_suggestions("opnmp")  # ['openmp']
+
+    Candidates are ranked by the Dice coefficient of their n-grams with those
+    of the misspelled string, which only requires looking at candidates that
+    share at least one n-gram with it.
+
+    Parameters:
+        candidates (iterable):  The valid strings to suggest from.
+        n (int):  The length of the n-grams to index.
+    """
+
+    def __init__(self, candidates, n=3):
+        self.n = n
+        self.candidates = list(dict.fromkeys(candidates))
+
+        self._ngram_counts = []
+        self._postings = defaultdict(list)
+        for idx, candidate in enumerate(self.candidates):
+            ngrams = self.get_ngrams(candidate)
+            self._ngram_counts.append(len(ngrams))
+            for ngram in ngrams:
+                self._postings[ngram].append(idx)
+
+    def get_ngrams(self, string):
+        """
+        Gets the set of casefolded n-grams of a string.  The string is padded
+        with spaces so its first and last characters are represented in as
+        many n-grams as the characters in the middle, and strings shorter than
+        :attr:`n` still have n-grams.
+
+        Parameters:
+            string (str):  The string to split into n-grams.
+
+        Returns:
+            set:  The n-grams of the string.
+        """
+        padding = " " * (self.n - 1)
+        padded = f"{padding}{string.casefold()}{padding}"
+        return {padded[i:i + self.n] for i in range(len(padded) - self.n + 1)}
+
+    def get_suggestions(self, string, k=3, min_similarity=0.3):
+        """
+        Finds the candidates most similar to ``string``.
+
+        Parameters:
+            string (str):  The (likely misspelled) string to find matches for.
+            k (int):  The maximum number of suggestions to return.
+            min_similarity (float):  Candidates less similar than this, from
+                ``0`` (no n-grams in common) to ``1`` (same n-grams), are never
+                suggested.
+
+        Returns:
+            list:  Up to ``k`` candidates, most similar first.  Candidates that
+            are equally similar are given in the order they were indexed.
+        """
+        ngrams = self.get_ngrams(string)
+        shared_ngram_counts = Counter()
+        for ngram in ngrams:
+            shared_ngram_counts.update(self._postings.get(ngram, ()))
+
+        scored_candidates = []
+        for idx, shared_ngram_count in shared_ngram_counts.items():
+            similarity = (2 * shared_ngram_count /
+                          (len(ngrams) + self._ngram_counts[idx]))
+            if similarity >= min_similarity:
+                scored_candidates.append((-similarity, idx))
+
+        return [self.candidates[idx] for _, idx
+                in heapq.nsmallest(k, scored_candidates)]
@@ -65,4 +65,7 @@ def use_tmpdir(monkeypatch, request, tmpdir):
                                 "gen-config.ini"),
                     tmpdir.join("gen-config.ini"))
 
+    # Keep anything GenConfig caches between runs out of the user's home
+    monkeypatch.setenv("GENCONFIG_CACHE_DIR", str(tmpdir.join(".gen-config-cache")))
+
     monkeypatch.chdir(tmpdir)
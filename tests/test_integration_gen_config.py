@@ -1,6 +1,10 @@
 import getpass
+import io
+import json
+import os
 from pathlib import Path
 import pytest
+import subprocess
 import sys
 import textwrap
 from unittest.mock import patch
@@ -12,6 +16,7 @@ root_dir = (Path.cwd()/".."
 sys.path.append(str(root_dir))
 from configparserenhanced import ConfigParserEnhanced
 from gen_config import GenConfig
+from src.cmake_presets import CMakePresets
 import gen_config
 
 
@@ -38,6 +43,84 @@ def test_list_config_flags(capsys):
     assert str(SE.value) == str(0)
 
 
+@pytest.mark.parametrize("cmake_fragment", [True, False])
+def test_output_shell_document_evaluates_in_bash(cmake_fragment, capsys):
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force",
+    ]
+    if cmake_fragment:
+        argv += ["--cmake-fragment", "test_fragment.cmake"]
+    argv += ["ats1_intel-hsw_empire_sparc"]
+
+    with pytest.raises(SystemExit) as SE:
+        gen_config.main(argv + ["--output-shell-document"])
+    out, err = capsys.readouterr()
+    assert str(SE.value) == str(0)
+
+    result = subprocess.run(
+        ["bash", "-c", out + 'printf "%s\\0" "$cmake_args" "$cmake_fragment" '
+                             '"${load_env_args[@]}"'],
+        stdout=subprocess.PIPE, universal_newlines=True, check=True
+    )
+    cmake_args, fragment, *load_env_args = result.stdout.split("\0")[:-1]
+
+    gc = GenConfig(argv)
+    assert load_env_args == gc.load_env_args
+    if cmake_fragment:
+        assert cmake_args == ""
+        assert fragment == str(Path("test_fragment.cmake").resolve())
+        assert "CMake fragment file written" in err
+    else:
+        assert cmake_args == gc.generated_config_flags_str
+        assert fragment == ""
+
+
+@pytest.mark.parametrize("argv", [
+    ["--help"],
+    ["--output-load-env-args-only", "--force", "ats1_intel-hsw"],
+])
+def test_fast_paths_skip_unneeded_imports(argv):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(root_dir/"gen_config.py"),
+         "--config-specs", "test-config-specs.ini",
+         "--supported-config-flags", "test-supported-config-flags.ini",
+         "--supported-systems", "test-supported-systems.ini",
+         "--supported-envs", "test-supported-envs.ini",
+         "--environment-specs", "test-environment-specs.ini"] + argv,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    assert result.returncode == 0, result.stderr
+
+    # Lines look like "import time:  self [us] | cumulative | module", with
+    # the module indented by how deeply it was imported.
+    lines = [_.split("|") for _ in result.stderr.splitlines()
+             if _.startswith("import time:") and "[us]" not in _]
+    imported = {_[-1].strip() for _ in lines}
+    assert "src.ini_registry" in imported
+    for module in ["LoadEnv.load_env", "setprogramoptions",
+                   "src.memoized_set_program_options", "concurrent.futures",
+                   "src.cmake_presets", "src.compiled_config_specs",
+                   "src.config_keyword_parser", "src.config_specs_graph",
+                   "src.suggestion_index"]:
+        assert module not in imported
+
+    # Everything imported after interpreter startup (which ends with site),
+    # i.e., by gen_config.py, took about 65ms when measured; allow for slower
+    # machines.
+    startup_end = max(i for i, _ in enumerate(lines) if _[-1] == " site")
+    gen_config_import_us = sum(
+        int(_[1]) for _ in lines[startup_end + 1:]
+        if not _[-1].startswith("  ")
+    )
+    assert gen_config_import_us < 250000
+
+
 # Primarily to check a branch coverage
 @pytest.mark.parametrize("test_from_main", [True, False])
 @pytest.mark.parametrize("sys_name", ["ats1", "ats2"])
@@ -67,6 +150,45 @@ def test_list_configs_shows_correct_sections(sys_name, test_from_main, capsys):
         assert f"- {config}" in exc_msg
 
 
+def test_list_config_flags_and_configs_messages_are_cached(capsys):
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force", "ats1"
+    ]
+
+    def list_flags_and_configs():
+        gc = GenConfig(argv)
+        with pytest.raises(SystemExit):
+            gc.list_config_flags()
+        with pytest.raises(SystemExit):
+            gc.list_configs()
+        out, err = capsys.readouterr()
+        return out
+
+    expected_msgs = list_flags_and_configs()
+    assert "- ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_none" in expected_msgs
+    assert "- muelu" in expected_msgs
+
+    def raise_if_called(*args, **kwargs):
+        raise AssertionError("Message was not cached")
+
+    with patch("src.config_specs_graph.ConfigSpecsGraph",
+               side_effect=raise_if_called), \
+            patch("src.config_keyword_parser.ConfigKeywordParser."
+                  "get_msg_showing_supported_flags",
+                  side_effect=raise_if_called):
+        assert list_flags_and_configs() == expected_msgs
+
+    # Changing config-specs.ini must invalidate the cached list of configs
+    with open("test-config-specs.ini", "a") as F:
+        F.write("\n[ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_openmp_none]\n")
+    assert "_mpi_openmp_none" in list_flags_and_configs()
+
+
 @pytest.mark.parametrize("extra_args", [
     ["--list-configs"],
     ["--list-config-flags"],
@@ -205,6 +327,339 @@ def test_cmake_fragment_file_stored_correctly(data):
     assert test_fragment_contents == data["expected_fragment_contents"]
 
 
+@pytest.mark.parametrize("jobs", ["1", "2"])
+@pytest.mark.parametrize("all_systems", [True, False])
+def test_all_configs_cmake_fragments_written_to_output_dir(all_systems, jobs):
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force",
+    ]
+    with pytest.raises(SystemExit) as SE:
+        gen_config.main(argv + ["--all-configs", "--output-dir", "fragments",
+                                "--jobs", jobs]
+                        + (["--all-systems"] if all_systems else [])
+                        + ["ats1"])
+    assert str(SE.value) == str(0)
+
+    config_specs = ConfigParserEnhanced("test-config-specs.ini").configparserdata
+    expected_configs = [_ for _ in config_specs.sections()
+                        if _.upper() != _
+                        and (all_systems or _.startswith("ats1"))]
+    assert sorted(_.name for _ in Path("fragments").iterdir()) == sorted(
+        f"{_}.cmake" for _ in expected_configs
+    )
+
+    complete_config = "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_empire_sparc"
+    gen_config.main(argv + ["--cmake-fragment", "expected.cmake",
+                            complete_config])
+    with open("expected.cmake", "r") as F:
+        expected_fragment_contents = F.read()
+    with open(Path("fragments")/f"{complete_config}.cmake", "r") as F:
+        assert F.read() == expected_fragment_contents
+
+
+def test_incremental_all_configs_only_rewrites_changed_fragments():
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--all-configs", "--output-dir", "fragments", "--incremental",
+        "--force", "ats1"
+    ]
+    files = GenConfig(argv).write_all_cmake_fragments()
+    assert len(files) > 1
+    assert GenConfig(argv).write_all_cmake_fragments() == []
+
+    with open("test-config-specs.ini", "r") as F:
+        config_specs = F.read()
+    with open("test-config-specs.ini", "w") as F:
+        F.write(config_specs.replace(
+            "opt-set-cmake-var Trilinos_ENABLE_Panzer BOOL : ON",
+            "opt-set-cmake-var Trilinos_ENABLE_Panzer BOOL : OFF"
+        ))
+
+    complete_config = "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_empire_sparc"
+    assert GenConfig(argv).write_all_cmake_fragments() == [
+        Path("fragments").resolve()/f"{complete_config}.cmake"
+    ]
+    with open(Path("fragments")/f"{complete_config}.cmake", "r") as F:
+        assert "Trilinos_ENABLE_Panzer OFF" in F.read()
+
+
+@pytest.mark.parametrize("version", ["tool_version",
+                                     "set_program_options_version"])
+def test_incremental_all_configs_rewrites_fragments_of_other_versions(version):
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--all-configs", "--output-dir", "fragments", "--incremental",
+        "--force", "ats1"
+    ]
+    files = GenConfig(argv).write_all_cmake_fragments()
+    assert GenConfig(argv).write_all_cmake_fragments() == []
+
+    with patch.object(GenConfig, version, "changed"):
+        assert sorted(GenConfig(argv).write_all_cmake_fragments()) == sorted(files)
+
+
+def test_incremental_cmake_fragment_skipped_when_up_to_date(capsys):
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--cmake-fragment", "test_fragment.cmake", "--incremental",
+        "--force", "ats1_intel-hsw_empire_sparc"
+    ]
+    gen_config.main(argv)
+    capsys.readouterr()
+
+    # No overwrite prompt, as nothing is written
+    with patch("builtins.input", side_effect=AssertionError("prompted")):
+        gen_config.main(argv)
+    out, err = capsys.readouterr()
+    assert "CMake fragment file is up to date" in out
+
+
+def test_cmake_presets_match_cmake_fragments(capsys):
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force",
+    ]
+    presets_argv = argv + ["--cmake-presets", "gen-config-presets.json",
+                           "--cmake-user-presets", "CMakeUserPresets.json",
+                           "ats1"]
+    with pytest.raises(SystemExit) as SE:
+        gen_config.main(presets_argv)
+    assert str(SE.value) == str(0)
+
+    with open("gen-config-presets.json", "r") as F:
+        presets = json.load(F)["configurePresets"]
+    presets_by_name = {_["name"]: _ for _ in presets}
+
+    def get_cache_variables(name):
+        cache_variables = {}
+        for parent in reversed(presets_by_name[name].get("inherits", [])):
+            cache_variables.update(get_cache_variables(parent))
+        cache_variables.update(presets_by_name[name].get("cacheVariables", {}))
+        return cache_variables
+
+    gc = GenConfig(argv + ["ats1"])
+    complete_configs = gc.config_specs_graph.complete_configs_by_system["ats1"]
+    assert [_["name"] for _ in presets if not _.get("hidden", False)] == \
+        complete_configs
+    assert presets_by_name["ATS1"]["hidden"]
+    for complete_config in complete_configs:
+        assert "ATS1" in presets_by_name[complete_config]["inherits"]
+        assert {
+            key: value for key, value
+            in get_cache_variables(complete_config).items()
+            if value is not None
+        } == CMakePresets.get_cache_variables(
+            gc.get_option_list("cmake_fragment", complete_config)
+        )
+
+    with open("CMakeUserPresets.json", "r") as F:
+        assert json.load(F) == {"version": 4,
+                                "include": ["gen-config-presets.json"]}
+
+    # Nothing changed, so nothing is generated again
+    capsys.readouterr()
+    with pytest.raises(SystemExit):
+        gen_config.main(presets_argv)
+    out, err = capsys.readouterr()
+    assert "CMake presets file is up to date" in out
+
+    # A changed tool or SetProgramOptionsCMake generates them again
+    for version in ["tool_version", "set_program_options_version"]:
+        with patch.object(GenConfig, version, version), \
+                pytest.raises(SystemExit):
+            gen_config.main(presets_argv)
+        out, err = capsys.readouterr()
+        assert "configure presets written to" in out
+
+
+def test_all_configs_without_output_dir_raises():
+    gc = GenConfig([
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--all-configs",
+        "--force", "ats1"
+    ])
+    with pytest.raises(ValueError, match="requires the --output-dir flag"):
+        gc.write_all_cmake_fragments()
+
+
+@pytest.mark.parametrize("data", [
+    {
+        "affected_by": ["ATS1-EMPIRE"],
+        "expected": ["ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_empire_sparc"],
+    },
+    {
+        "affected_by": ["ATS1"],
+        "expected": [
+            "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_none",
+            "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_sparc",
+            "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_no-mpi_serial_sparc",
+            "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_empire_sparc",
+        ],
+    },
+])
+def test_affected_by_lists_configs_using_sections(data, capsys):
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+    ]
+    for section in data["affected_by"]:
+        argv += ["--affected-by", section]
+
+    with pytest.raises(SystemExit) as SE:
+        gen_config.main(argv)
+
+    out, err = capsys.readouterr()
+    assert str(SE.value) == str(0)
+    assert out.splitlines() == data["expected"]
+
+
+def test_affected_by_diff_lists_changed_configs():
+    with open("test-config-specs.ini", "r") as F:
+        config_specs = F.read()
+    with open("new-config-specs.ini", "w") as F:
+        F.write(config_specs.replace(
+            "opt-set-cmake-var Trilinos_ENABLE_Panzer BOOL : ON",
+            "opt-set-cmake-var Trilinos_ENABLE_Panzer BOOL : OFF"
+        ))
+
+    gc = GenConfig([
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--affected-by-diff", "test-config-specs.ini", "new-config-specs.ini",
+    ])
+    output_stream = io.StringIO()
+    gc.print_affected_configs(output_stream=output_stream)
+
+    assert output_stream.getvalue().splitlines() == [
+        "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_empire_sparc",
+    ]
+
+
+def test_affected_by_missing_section_raises():
+    gc = GenConfig([
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--affected-by", "ATS1-EMPRIE",
+    ])
+    with pytest.raises(ValueError) as excinfo:
+        gc.print_affected_configs(output_stream=io.StringIO())
+
+    assert "-  ATS1-EMPRIE" in excinfo.value.args[0]
+    assert "- ATS1-EMPIRE" in excinfo.value.args[0]
+
+
+def test_compiled_config_specs_used_until_config_specs_changes():
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force",
+    ]
+    build_name = "ats1_intel-hsw_empire_sparc"
+    gen_config.main(argv + ["--cmake-fragment", "expected.cmake", build_name])
+    with open("expected.cmake", "r") as F:
+        expected_fragment_contents = F.read()
+
+    # Compiling again, or after --validate, finds the validation stamp
+    # matching, so nothing was loaded by validating.
+    for compile_argv in [["--compile"], ["--compile"],
+                         ["--validate", "--compile"]]:
+        with pytest.raises(SystemExit) as SE:
+            gen_config.main(argv + compile_argv)
+        assert str(SE.value) == str(0)
+
+    def raise_if_called(*args, **kwargs):
+        raise AssertionError("config-specs.ini was evaluated")
+
+    with patch("src.memoized_set_program_options.MemoizedSetProgramOptionsCMake."
+               "gen_option_list",
+               side_effect=raise_if_called):
+        gen_config.main(argv + ["--cmake-fragment", "compiled.cmake",
+                                build_name])
+    with open("compiled.cmake", "r") as F:
+        assert F.read() == expected_fragment_contents
+
+    with GenConfig(argv + [build_name]) as gc:
+        compiled = gc.compiled_config_specs
+        assert compiled is not None
+    # Closed along with the GenConfig
+    with pytest.raises(ValueError):
+        build_name in compiled
+
+    # A changed tool is evaluated again
+    with patch.object(GenConfig, "tool_version", "changed"):
+        assert GenConfig(argv + [build_name]).compiled_config_specs is None
+
+    # As is a changed config-specs.ini
+    with open("test-config-specs.ini", "a") as F:
+        F.write("\n")
+    assert GenConfig(argv + [build_name]).compiled_config_specs is None
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_only_sections_used_by_build_name_validated_without_validate_flag(validate):
+    with open("test-config-specs.ini", "a") as F:
+        F.write(
+            "\n[ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_serial_mpi_sparc]\n"
+            "invalid-operation CMAKE_BUILD_TYPE STRING : DEBUG\n"
+        )
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--cmake-fragment", "test_fragment.cmake",
+        "--force",
+        "ats1_intel-hsw_sparc"
+    ]
+
+    if validate:
+        with pytest.raises(ValueError):
+            gen_config.main(["--validate"] + argv)
+        assert not Path("test_fragment.cmake").exists()
+    else:
+        gen_config.main(argv)
+        with open("test_fragment.cmake", "r") as F:
+            assert "TPL_ENABLE_MPI ON" in F.read()
+
+
 @pytest.mark.parametrize("data", [
     {"--yes flag": False, "should_exit": False, "user_input": ["Y"]},
     {"--yes flag": False, "should_exit": False, "user_input": ["8", "y"]},
@@ -251,6 +706,66 @@ def test_existing_cmake_fragment_file_asks_user_for_overwrite(mock_input, data):
             assert "not recognized" not in script_input_text
 
 
+@patch("gen_config.input", side_effect=AssertionError("prompted"))
+def test_unchanged_cmake_fragment_file_left_untouched(mock_input, capsys):
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--cmake-fragment", "test_fragment.cmake",
+        "--force",
+        "ats1_intel-hsw"
+    ]
+    with open("test_fragment.cmake", "w") as F:
+        F.write('set(MPI_EXEC_NUMPROCS_FLAG -p CACHE STRING "from .ini configuration")')
+    os.utime("test_fragment.cmake", ns=(0, 0))
+
+    gen_config.main(argv)
+
+    out, err = capsys.readouterr()
+    assert "CMake fragment file is unchanged" in out
+    assert Path("test_fragment.cmake").stat().st_mtime_ns == 0
+
+
+def test_canonicalize_build_names_streams_one_line_per_build_name(monkeypatch, capsys):
+    build_names = [
+        "ats1_intel-hsw",
+        "",
+        "ats1_intel-hsw_sparc",
+        "ats1_intel-hsw_not-an-option",
+        "ats1_intel-hsw_mpi_no-mpi",
+    ]
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(build_names) + "\n"))
+
+    with pytest.raises(SystemExit) as SE:
+        gen_config.main([
+            "--config-specs", "test-config-specs.ini",
+            "--supported-config-flags", "test-supported-config-flags.ini",
+            "--supported-systems", "test-supported-systems.ini",
+            "--supported-envs", "test-supported-envs.ini",
+            "--environment-specs", "test-environment-specs.ini",
+            "--canonicalize-build-names",
+            "--force", "ats1"
+        ])
+    assert str(SE.value) == str(0)
+
+    out, err = capsys.readouterr()
+    results = [json.loads(_) for _ in out.splitlines() if _.startswith("{")]
+    assert [_["build_name"] for _ in results] == [_ for _ in build_names if _]
+    assert results[0]["complete_config"] == (
+        "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_none"
+    )
+    assert results[1]["complete_config"] == (
+        "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_sparc"
+    )
+    assert "- not-an-option" in results[2]["error"]
+    assert "complete_config" not in results[2]
+    assert ("Multiple options found in build name for SELECT_ONE flag "
+            "'use-mpi'" in results[3]["error"])
+
+
 ###############################################################################
 ##########################     Validation     #################################
 ###############################################################################
@@ -294,6 +809,24 @@ def test_invalid_option_in_build_name_raises(data):
     for opt in data["invalid_options"]:
         assert f"- {opt}" in exc_msg
 
+def test_missing_complete_config_suggests_closest_configs():
+    gc = GenConfig([
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force", "ats1_intel-hsw_no-mpi"
+    ])
+
+    with pytest.raises(ValueError) as excinfo:
+        gc.assert_complete_config_exists()
+
+    exc_msg = excinfo.value.args[0]
+    assert "'ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_no-mpi_serial_none'" in exc_msg
+    assert "- ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_no-mpi_serial_sparc" in exc_msg
+    assert "Run with --list-configs" in exc_msg
+
 # config_specs.ini and supported-systems.ini integration
 # =======================
 @pytest.mark.parametrize("data", [
@@ -547,8 +1080,172 @@ def test_multiple_invalid_config_specs_sections_are_shown_in_one_err_msg():
     should_raise = True
     run_common_config_specs_validation_test(test_ini_filename, bad_section_names, should_raise)
 
+@pytest.mark.parametrize("jobs", ["2", "0"])
+def test_parallel_section_name_validation_matches_serial(jobs, monkeypatch):
+    # Don't let validated sections from one run be skipped in the next
+    monkeypatch.setenv("GENCONFIG_CACHE_DIR", "")
+    bad_section_names = [
+        "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_serial_sparc",
+        "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_sparc_serial",
+        "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_sparc_serial_mpi",
+    ]
+    with open("test-config-specs.ini", "r") as F:
+        config_specs = F.read()
+    for sec_name in bad_section_names:
+        config_specs += (
+            f"\n[{sec_name}]\n"
+            "opt-set-cmake-var CMAKE_BUILD_TYPE STRING : DEBUG\n"
+        )
+    with open("test-config-specs.ini", "w") as F:
+        F.write(config_specs)
+
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force", "ats1_env-name_mpi"
+    ]
+    exc_msgs = []
+    for extra_args in [[], ["--jobs", jobs]]:
+        gc = GenConfig(extra_args + argv)
+        with pytest.raises(ValueError) as excinfo:
+            gc.validate_config_specs_ini()
+        exc_msgs.append(excinfo.value.args[0])
+
+    assert exc_msgs[0] == exc_msgs[1]
+    assert get_expected_config_specs_exc_msg(
+        bad_section_names, "test-config-specs.ini"
+    ) in exc_msgs[1]
+
+
+def test_only_changed_sections_are_revalidated():
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force", "ats1_intel-hsw"
+    ]
+    all_sections = set(ConfigParserEnhanced(
+        "test-config-specs.ini"
+    ).configparserdata.sections())
+
+    gc = GenConfig(argv)
+    assert gc.validated_sections == set()
+    gc.validate_config_specs_ini()
+
+    gc = GenConfig(argv)
+    assert gc.validated_sections == all_sections
+    gc.validate_config_specs_ini()
+
+    # Changing a section invalidates it and the sections that use it
+    with open("test-config-specs.ini", "r") as F:
+        config_specs = F.read()
+    with open("test-config-specs.ini", "w") as F:
+        F.write(config_specs.replace(
+            "opt-set-cmake-var Trilinos_ENABLE_Panzer BOOL : ON",
+            "opt-set-cmake-var Trilinos_ENABLE_Panzer BOOL : OFF"
+        ))
+
+    gc = GenConfig(argv)
+    assert all_sections - gc.validated_sections == {
+        "ATS1-EMPIRE",
+        "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_empire_sparc",
+    }
+    gc.validate_config_specs_ini()
+
+    # Changing supported-config-flags.ini invalidates every section
+    with open("test-supported-config-flags.ini", "a") as F:
+        F.write("\n")
+
+    gc = GenConfig(argv)
+    assert gc.validated_sections == set()
+
+
+
+def test_validation_skipped_when_stamp_matches(monkeypatch):
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force", "ats1_intel-hsw"
+    ]
+    gc = GenConfig(argv)
+    assert not gc.validation_stamp_matches()
+    gc.validate_config_specs_ini()
+    assert gc.validation_stamp_matches()
+
+    validated = []
+    monkeypatch.setattr(
+        GenConfig, "validate_config_specs_ini_section_names",
+        lambda self, section_names=None: validated.append(section_names)
+    )
+    monkeypatch.setattr(
+        GenConfig, "validate_config_specs_ini_operations",
+        lambda self, section_names=None: validated.append(section_names)
+    )
+    gc = GenConfig(argv)
+    gc.validate_config_specs_ini()
+    gc.validate_complete_config()
+    assert gc.has_been_validated
+    assert validated == []
+
+    # Changing any of the .ini files invalidates the stamp
+    with open("test-environment-specs.ini", "a") as F:
+        F.write("\n")
+
+    gc = GenConfig(argv)
+    assert not gc.validation_stamp_matches()
+    gc.validate_config_specs_ini()
+    assert validated == [None, None]
+
+    # Rewriting the same contents, e.g., in a fresh checkout, does not
+    gc.validate_config_specs_ini()
+    for filename in Path.cwd().glob("test-*.ini"):
+        contents = filename.read_text()
+        filename.unlink()
+        filename.write_text(contents)
+    assert GenConfig(argv).validation_stamp_matches()
+
+    # Changing the tool does, and also invalidates every section
+    monkeypatch.setattr(GenConfig, "tool_version", "changed")
+    gc = GenConfig(argv)
+    assert not gc.validation_stamp_matches()
+    assert gc.validated_sections == set()
+
+
 # Operation Validation
 # ====================
+def test_use_cycle_raises():
+    valid_section_name = "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_sparc"
+    with open("test_config_specs_use_cycle.ini", "w") as F:
+        F.write("[ATS1]\n"
+                "use ATS1-COMMON\n\n"
+                "[ATS1-COMMON]\n"
+                "use ATS1\n\n"
+                f"[{valid_section_name}]\n"
+                "use ATS1\n")
+    gc = GenConfig([
+        "--config-specs", "test_config_specs_use_cycle.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force",
+        "ats1_any_build_name"
+    ])
+
+    with pytest.raises(ValueError) as excinfo:
+        gc.validate_config_specs_ini_operations()
+
+    assert "ATS1 -> ATS1-COMMON -> ATS1" in excinfo.value.args[0]
+
+
 @pytest.mark.parametrize("data", [
     {
         "operations": ["use"],
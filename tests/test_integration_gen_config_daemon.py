@@ -0,0 +1,183 @@
+import os
+from pathlib import Path
+import pytest
+import subprocess
+import sys
+import threading
+import time
+
+root_dir = (Path.cwd()/".."
+            if (Path.cwd()/"conftest.py").exists()
+            else Path.cwd())
+
+sys.path.append(str(root_dir))
+import gen_config
+import gen_config_daemon
+from gen_config_daemon import check_socket_dir, GenConfigDaemon, send_request
+
+
+@pytest.fixture
+def daemon_socket():
+    socket_path = Path.cwd()/"daemon"/"gen-config.sock"
+    thread = threading.Thread(
+        target=GenConfigDaemon(socket_path).serve_forever
+    )
+    thread.start()
+    for _ in range(500):
+        if socket_path.is_socket():
+            break
+        time.sleep(0.01)
+
+    yield socket_path
+
+    send_request(socket_path, {"stop": True})
+    thread.join()
+    assert not socket_path.exists()
+    assert not gen_config.GenConfig.share_load_env
+
+
+def test_daemon_runs_gen_config_requests(daemon_socket, capsys):
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force",
+    ]
+    response = send_request(daemon_socket, {
+        "argv": argv + ["--cmake-fragment", "test_fragment.cmake",
+                        "ats1_intel-hsw"],
+        "cwd": str(Path.cwd()),
+    })
+    assert response["returncode"] == 0
+    assert "CMake fragment file written" in response["stdout"]
+    with open("test_fragment.cmake", "r") as F:
+        assert F.read() == ('set(MPI_EXEC_NUMPROCS_FLAG -p CACHE STRING '
+                            '"from .ini configuration")')
+
+    with pytest.raises(SystemExit) as SE:
+        gen_config_daemon.main(["--socket", str(daemon_socket), "--request"]
+                               + argv + ["--list-configs", "ats1"])
+    out, err = capsys.readouterr()
+    assert str(SE.value) == str(0)
+    assert "ats1_intel-19.0.4-mpich-7.7.15-hsw-openmp_mpi_serial_none" in out
+
+
+def test_daemon_hands_prompts_back_to_the_client(daemon_socket):
+    with open("test_fragment.cmake", "w") as F:
+        F.write("set(OUTDATED ON)")
+
+    response = send_request(daemon_socket, {
+        "argv": [
+            "--config-specs", "test-config-specs.ini",
+            "--supported-config-flags", "test-supported-config-flags.ini",
+            "--supported-systems", "test-supported-systems.ini",
+            "--supported-envs", "test-supported-envs.ini",
+            "--environment-specs", "test-environment-specs.ini",
+            "--force", "--cmake-fragment", "test_fragment.cmake",
+            "ats1_intel-hsw",
+        ],
+        "cwd": str(Path.cwd()),
+    })
+    assert response["returncode"] == gen_config_daemon.DAEMON_UNAVAILABLE
+    with open("test_fragment.cmake", "r") as F:
+        assert F.read() == "set(OUTDATED ON)"
+
+
+def test_daemon_runs_requests_in_the_client_environment(daemon_socket):
+    cache_dir = Path.cwd()/"client-cache"
+    response = send_request(daemon_socket, {
+        "argv": [
+            "--config-specs", "test-config-specs.ini",
+            "--supported-config-flags", "test-supported-config-flags.ini",
+            "--supported-systems", "test-supported-systems.ini",
+            "--supported-envs", "test-supported-envs.ini",
+            "--environment-specs", "test-environment-specs.ini",
+            "--compile",
+        ],
+        "cwd": str(Path.cwd()),
+        "env": {**os.environ, "GENCONFIG_CACHE_DIR": str(cache_dir)},
+    })
+    assert response["returncode"] == 0
+    assert len(list(cache_dir.iterdir())) > 0
+    assert os.environ["GENCONFIG_CACHE_DIR"] != str(cache_dir)
+
+
+def test_daemon_reports_errors(daemon_socket):
+    response = send_request(daemon_socket, {
+        "argv": ["--config-specs", "missing-config-specs.ini", "ats1"],
+        "cwd": str(Path.cwd()),
+    })
+    assert response["returncode"] != 0
+
+    response = send_request(daemon_socket, {"argv": ["ats1"]})
+    assert response["returncode"] == 2
+    assert "Malformed" in response["stderr"]
+
+
+def test_client_does_not_import_asyncio():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime",
+         str(root_dir/"gen_config_daemon.py"), "--socket", "missing.sock",
+         "--request", "--list-configs"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    assert result.returncode == gen_config_daemon.DAEMON_UNAVAILABLE
+
+    imported = {
+        _.split("|")[-1].strip() for _ in result.stderr.splitlines()
+        if _.startswith("import time:")
+    }
+    assert "asyncio" not in imported
+    assert "gen_config" not in imported
+
+
+def test_daemon_shares_loaded_objects_between_requests(daemon_socket):
+    assert gen_config.GenConfig.share_load_env
+
+    argv = [
+        "--config-specs", "test-config-specs.ini",
+        "--supported-config-flags", "test-supported-config-flags.ini",
+        "--supported-systems", "test-supported-systems.ini",
+        "--supported-envs", "test-supported-envs.ini",
+        "--environment-specs", "test-environment-specs.ini",
+        "--force",
+    ]
+    gc = gen_config.GenConfig(argv + ["ats1_intel-hsw"])
+    gc.load_load_env()
+    other = gen_config.GenConfig(argv + ["ats2_cuda"])
+    other.load_load_env()
+    assert other.load_env is gc.load_env
+    assert other.load_env.build_name == "ats2_cuda"
+    assert other.config_specs_graph is gc.config_specs_graph
+
+
+def test_client_without_daemon_exits_unavailable():
+    with pytest.raises(SystemExit) as SE:
+        gen_config_daemon.main(["--socket", "missing.sock", "--request",
+                                "--list-configs"])
+
+    assert SE.value.code == gen_config_daemon.DAEMON_UNAVAILABLE
+
+
+def test_daemon_socket_dir_is_private(daemon_socket):
+    assert daemon_socket.parent.stat().st_mode & 0o777 == 0o700
+
+
+def test_socket_dir_accessible_by_others_is_refused():
+    shared_dir = Path.cwd()/"shared"
+    shared_dir.mkdir()
+    shared_dir.chmod(0o755)
+    socket_path = shared_dir/"gen-config.sock"
+
+    with pytest.raises(PermissionError, match="mode 0700"):
+        check_socket_dir(socket_path, create=True)
+    with pytest.raises(PermissionError, match="mode 0700"):
+        send_request(socket_path, {"stop": True})
+    with pytest.raises(SystemExit) as SE:
+        gen_config_daemon.main(["--socket", str(socket_path), "--request",
+                                "--list-configs"])
+
+    assert SE.value.code == gen_config_daemon.DAEMON_UNAVAILABLE
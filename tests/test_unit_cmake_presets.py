@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+import pytest
+import sys
+
+root_dir = (Path.cwd()/".."
+            if (Path.cwd()/"conftest.py").exists()
+            else Path.cwd())
+sys.path.append(str(root_dir))
+from src.cmake_presets import CMakePresets
+
+
+def test_cache_variables_follow_cmake_set_semantics():
+    cache_variables = CMakePresets.get_cache_variables([
+        'set(MPI_EXEC_NUMPROCS_FLAG -p CACHE STRING "from .ini configuration")',
+        'set(MPI_EXEC_NUMPROCS_FLAG -n CACHE STRING "from .ini configuration")',
+        'set(TPL_ENABLE_MPI OFF CACHE BOOL "from .ini configuration")',
+        'set(TPL_ENABLE_MPI ON CACHE BOOL "from .ini configuration" FORCE)',
+        'set(ARCH HSW)',
+        'set(KOKKOS_ARCH "${ARCH};${TPL_ENABLE_MPI}" CACHE STRING "from .ini configuration")',
+        'set(CMAKE_EXE_LINKER_FLAGS $ENV{LDFLAGS} CACHE STRING "from .ini configuration")',
+        'set(MESSAGE "a \\"quoted\\" value" CACHE STRING "from .ini configuration")',
+    ])
+
+    assert cache_variables == {
+        "MPI_EXEC_NUMPROCS_FLAG": {"type": "STRING", "value": "-p"},
+        "TPL_ENABLE_MPI": {"type": "BOOL", "value": "ON"},
+        "KOKKOS_ARCH": {"type": "STRING", "value": "HSW;ON"},
+        "CMAKE_EXE_LINKER_FLAGS": {"type": "STRING", "value": "$env{LDFLAGS}"},
+        "MESSAGE": {"type": "STRING", "value": 'a "quoted" value'},
+    }
+
+
+def test_presets_only_set_what_differs_from_inherited_presets():
+    common = {"A": {"type": "BOOL", "value": "ON"},
+              "B": {"type": "STRING", "value": "b"}}
+    debug = {"CMAKE_BUILD_TYPE": {"type": "STRING", "value": "DEBUG"},
+             "B": {"type": "STRING", "value": "debug"}}
+    config = {"A": {"type": "BOOL", "value": "ON"},
+              "B": {"type": "STRING", "value": "debug"},
+              "C": {"type": "STRING", "value": "c"}}
+
+    presets = CMakePresets()
+    presets.add_preset("COMMON", common, hidden=True)
+    presets.add_preset("BUILD-TYPE|DEBUG", debug, hidden=True)
+    # Earlier presets in inherits take precedence, so B comes from DEBUG and
+    # CMAKE_BUILD_TYPE, which the config does not set, must be unset.
+    presets.add_preset("config", config,
+                       inherits=["BUILD-TYPE|DEBUG", "COMMON"])
+
+    assert "config" in presets
+    assert presets.get_cache_variables_of_preset("config") == config
+    assert presets.configure_presets[-1] == {
+        "name": "config",
+        "inherits": ["BUILD-TYPE|DEBUG", "COMMON"],
+        "binaryDir": "${sourceDir}/build/${presetName}",
+        "cacheVariables": {"C": {"type": "STRING", "value": "c"},
+                           "CMAKE_BUILD_TYPE": None},
+    }
+
+    with pytest.raises(ValueError):
+        presets.add_preset("other", config, inherits=["MISSING"])
+
+
+def test_fingerprint_round_trips_through_json():
+    presets = CMakePresets()
+    presets.add_preset("config", {"A": {"type": "BOOL", "value": "ON"}})
+    with open("CMakePresets.json", "w") as F:
+        F.write(presets.to_json("abc123"))
+
+    with open("CMakePresets.json", "r") as F:
+        assert json.load(F)["version"] == CMakePresets.VERSION
+    assert CMakePresets.get_fingerprint("CMakePresets.json") == "abc123"
+    assert CMakePresets.get_fingerprint("missing.json") is None
@@ -0,0 +1,64 @@
+from pathlib import Path
+import pytest
+import sys
+
+root_dir = (Path.cwd()/".."
+            if (Path.cwd()/"conftest.py").exists()
+            else Path.cwd())
+sys.path.append(str(root_dir))
+from src.compiled_config_specs import CompiledConfigSpecs
+
+
+def write_compiled(option_lists, source_hash="0" * 64):
+    filename = "config-specs.bin"
+    with open(filename, "wb") as F:
+        F.write(CompiledConfigSpecs.to_bytes(source_hash, option_lists))
+
+    return CompiledConfigSpecs(filename)
+
+
+def test_option_lists_looked_up_by_section():
+    option_lists = {
+        f"ats1_env-{i}_mpi": {
+            "bash": [f"-DVAR_{i}:STRING=\"{i}\""],
+            "cmake_fragment": [f'set(VAR_{i} {i} CACHE STRING "from .ini configuration")'],
+        } for i in range(100)
+    }
+    compiled = write_compiled(option_lists, source_hash="a" * 64)
+
+    assert compiled.source_hash == "a" * 64
+    assert compiled.n_slots == 256
+    for section, section_option_lists in option_lists.items():
+        assert section in compiled
+        for generator, option_list in section_option_lists.items():
+            assert compiled.get_option_list(section, generator) == option_list
+
+    assert "ats1_env-100_mpi" not in compiled
+    assert compiled.get_option_list("ats1_env-100_mpi", "bash") is None
+    assert compiled.get_option_list("ats1_env-0_mpi", "unknown") is None
+
+
+def test_empty_config_specs_compiles():
+    compiled = write_compiled({})
+    assert "ats1_env_mpi" not in compiled
+
+
+@pytest.mark.parametrize("contents", [
+    b"",
+    b"not a compiled file at all, but long enough to hold a header......",
+    CompiledConfigSpecs.HEADER.pack(b"GCCS", 0, 1, b"0" * 64),
+])
+def test_invalid_file_raises(contents):
+    with open("config-specs.bin", "wb") as F:
+        F.write(contents)
+
+    with pytest.raises(ValueError):
+        CompiledConfigSpecs("config-specs.bin")
+
+
+def test_close_unmaps_file():
+    with write_compiled({"ats1_env_mpi": {"bash": []}}) as compiled:
+        assert "ats1_env_mpi" in compiled
+
+    with pytest.raises(ValueError):
+        "ats1_env_mpi" in compiled
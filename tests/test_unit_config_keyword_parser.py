@@ -1,4 +1,5 @@
 from pathlib import Path
+import pickle
 import pytest
 import sys
 import textwrap
@@ -7,7 +8,7 @@ root_dir = (Path.cwd()/".."
             if (Path.cwd()/"conftest.py").exists()
             else Path.cwd())
 sys.path.append(str(root_dir))
-from src.config_keyword_parser import ConfigKeywordParser
+from src.config_keyword_parser import ConfigKeywordParser, ParsedBuildName
 
 
 #####################
@@ -44,19 +45,42 @@ def test_keyword_parser_matches_correctly(data):
     assert ckp.selected_options == data["expected_options"]
 
 
-# TODO: Implement this if we decide to go this route.
-# def test_parser_is_case_sensitive(capsys):
-#     build_name = "ats1_MPI_serial_eMpIrE"
+@pytest.mark.parametrize("data", [
+    {
+        "build_name": "MPI_serial_eMpIrE",
+        "expected_options": {
+            "use-mpi": "mpi",
+            "node-type": "serial",
+            "package-enables": "empire",
+        },
+        "expected_selected_options_str": "_mpi_serial_empire",
+    },
+    {
+        "build_name": "OpenMP_Sparc_NO-MPI_empire",
+        "expected_options": {
+            "use-mpi": "no-mpi",
+            "node-type": "openmp",
+            "package-enables": ["empire", "sparc"],
+        },
+        "expected_selected_options_str": "_no-mpi_openmp_empire_sparc",
+    },
+])
+def test_parser_is_case_insensitive(data):
+    ckp = ConfigKeywordParser(data["build_name"], "test-supported-config-flags.ini")
+    assert ckp.selected_options == data["expected_options"]
+    assert ckp.selected_options_str == data["expected_selected_options_str"]
 
-#     ckp = ConfigKeywordParser(build_name, "test-supported-config-flags.ini")
-#     ckp.selected_options
 
-#     out, err = capsys.readouterr()
-#     msg_expected = textwrap.dedent(
-#         """
-#         |   WARNING:
-#         """
-#     ).strip()
+def test_option_index_compiled_from_config_file():
+    ckp = ConfigKeywordParser("", "test-supported-config-flags.ini")
+    assert ckp.option_index["mpi"] == ("use-mpi", 0, "SELECT_ONE")
+    assert ckp.option_index["openmp"] == ("node-type", 1, "SELECT_ONE")
+    assert ckp.option_index["muelu"] == ("package-enables", 3, "SELECT_MANY")
+    assert ckp.flag_defaults == {
+        "use-mpi": "mpi",
+        "node-type": "serial",
+        "package-enables": "none",
+    }
 
 
 def test_parser_uses_correct_defaults():
@@ -115,6 +139,16 @@ def test_multiple_options_for_select_one_flag_in_build_name_raises(data):
         ckp.selected_options
 
 
+def test_invalid_option_in_build_name_suggests_valid_options():
+    ckp = ConfigKeywordParser("mpi_opnmp_sparc", "test-supported-config-flags.ini")
+
+    with pytest.raises(ValueError) as excinfo:
+        ckp.selected_options
+
+    exc_msg = excinfo.value.args[0]
+    assert "- opnmp  (did you mean 'openmp'" in exc_msg
+
+
 def test_flag_without_type_in_config_ini_raises():
     bad_ini = (
         "[configure-flags]\n"
@@ -195,6 +229,227 @@ def test_options_are_unique_for_all_flags(multiple):
         ckp.selected_options_str
 
 
+def test_options_uniqueness_checked_once_per_parser(monkeypatch):
+    calls = []
+    get_options_list_for_all_flags = ConfigKeywordParser.get_options_list_for_all_flags
+
+    def counting_get_options_list_for_all_flags(self):
+        calls.append(self.build_name)
+        return get_options_list_for_all_flags(self)
+
+    monkeypatch.setattr(ConfigKeywordParser, "get_options_list_for_all_flags",
+                        counting_get_options_list_for_all_flags)
+
+    ckp = ConfigKeywordParser("mpi", "test-supported-config-flags.ini")
+    for build_name in ["mpi", "no-mpi_openmp", "sparc_empire", "serial"]:
+        ckp.build_name = build_name
+        ckp.selected_options_str
+
+    assert calls == ["mpi"]
+
+
+##############################
+#  Parsing Many Build Names  #
+##############################
+def test_parse_many_matches_parsing_one_build_name_at_a_time():
+    build_names = [
+        "mpi_serial_empire",
+        "no-mpi_openmp_sparc_empire",
+        "openmp",
+        "",
+        "mpi_no-mpi_serial_empire",
+        "mpi_not-an-option",
+        "no-mpi_openmp_sparc_empire",
+    ]
+    ckp = ConfigKeywordParser("mpi", "test-supported-config-flags.ini")
+    results = ckp.parse_many(build_names)
+
+    assert [_.build_name for _ in results] == build_names
+    assert ckp.build_name == "mpi"
+    for result in results:
+        ckp.build_name = result.build_name
+        try:
+            expected_selected_options = ckp.selected_options
+            expected_selected_options_str = ckp.selected_options_str
+        except ValueError as e:
+            assert result.error == str(e)
+            assert result.selected_options is None
+            assert result.selected_options_str is None
+        else:
+            assert result.error is None
+            assert result.selected_options == expected_selected_options
+            assert result.selected_options_str == expected_selected_options_str
+
+
+def test_parse_many_reports_errors_as_data():
+    ckp = ConfigKeywordParser("", "test-supported-config-flags.ini")
+    multiple, invalid = ckp.parse_many(["mpi_no-mpi", "mpi_not-an-option"])
+
+    assert ("Multiple options found in build name for SELECT_ONE flag "
+            "'use-mpi':" in multiple.error)
+    assert "- not-an-option" in invalid.error
+
+
+#####################
+#  ParsedBuildName  #
+#####################
+def test_parsed_build_name_matches_selected_options():
+    ckp = ConfigKeywordParser("openmp_muelu_empire_sparc",
+                              "test-supported-config-flags.ini")
+    parsed = ckp.parsed_build_name
+
+    assert isinstance(parsed, ParsedBuildName)
+    assert parsed.build_name == "openmp_muelu_empire_sparc"
+    assert parsed.error is None
+    assert parsed.option_ids == (0, 3, 5, 6, 7)
+    assert parsed.selected_options == ckp.selected_options
+    assert parsed.selected_options_str == ckp.selected_options_str
+
+    ckp.build_name = "no-mpi"
+    assert ckp.parsed_build_name.selected_options_str == "_no-mpi_serial_none"
+
+
+def test_parsed_build_names_with_same_options_are_equal():
+    ckp = ConfigKeywordParser("", "test-supported-config-flags.ini")
+    default, explicit, different, error_1, error_2 = ckp.parse_many([
+        "", "mpi_serial_none", "no-mpi", "mpi_no-mpi", "mpi_no-mpi"
+    ])
+
+    assert default == explicit
+    assert hash(default) == hash(explicit)
+    assert default != different
+    assert error_1 == error_2
+    assert default != error_1
+    assert len({default, explicit, different, error_1, error_2}) == 3
+    assert {default: "value"}[explicit] == "value"
+
+
+def test_parsed_build_name_is_immutable_and_compact():
+    ckp = ConfigKeywordParser("sparc_empire", "test-supported-config-flags.ini")
+    parsed = ckp.parsed_build_name
+
+    with pytest.raises(AttributeError):
+        parsed.option_ids = ()
+    with pytest.raises(AttributeError):
+        parsed.new_attribute = "value"
+    with pytest.raises(AttributeError):
+        del parsed.error
+    assert not hasattr(parsed, "__dict__")
+
+    other = ckp.parse_many(["empire_sparc"])[0]
+    assert parsed._option_table is other._option_table
+
+    unpickled = pickle.loads(pickle.dumps(parsed))
+    assert unpickled == parsed
+    assert unpickled.selected_options_str == "_mpi_serial_empire_sparc"
+
+
+##############################
+#  Option Combination Space  #
+##############################
+def test_option_combinations_counted_and_enumerated_consistently():
+    ckp = ConfigKeywordParser("", "test-supported-config-flags.ini")
+    # use-mpi (2) x node-type (2) x non-empty subsets of package-enables (2**5 - 1)
+    assert ckp.count_option_combinations() == 2 * 2 * 31
+
+    combinations = list(ckp.iter_option_combinations())
+    assert len(combinations) == ckp.count_option_combinations()
+    selected_options_strs = [ckp.get_selected_options_str(_)
+                             for _ in combinations]
+    assert len(set(selected_options_strs)) == len(selected_options_strs)
+
+    # Every combination should round trip through the build name parser
+    results = ckp.parse_many(_[1:] for _ in selected_options_strs)
+    for combination, result in zip(combinations, results):
+        assert result.error is None
+        assert result.selected_options == combination
+
+    for idx, combination in enumerate(combinations):
+        assert ckp.get_option_combination(idx) == combination
+
+
+def test_option_combinations_are_generated_lazily():
+    test_ini = (
+        "[configure-flags]\n"
+        "node-type:  SELECT_ONE\n"
+        "    serial\n"
+        "    openmp\n"
+        "kokkos-arch:  SELECT_MANY\n" +
+        "".join(f"    arch-{_}\n" for _ in range(60))
+    )
+    test_ini_filename = "test_option_combinations_are_generated_lazily.ini"
+    with open(test_ini_filename, "w") as F:
+        F.write(test_ini)
+
+    ckp = ConfigKeywordParser("", test_ini_filename)
+    assert ckp.count_option_combinations() == 2 * (2**60 - 1)
+
+    combinations = ckp.iter_option_combinations()
+    assert next(combinations) == {"node-type": "serial", "kokkos-arch": "arch-0"}
+    assert next(combinations) == {"node-type": "serial", "kokkos-arch": "arch-1"}
+
+    last = ckp.count_option_combinations() - 1
+    assert ckp.get_option_combination(last) == {
+        "node-type": "openmp",
+        "kokkos-arch": [f"arch-{_}" for _ in range(60)],
+    }
+    with pytest.raises(IndexError):
+        ckp.get_option_combination(last + 1)
+
+
+#######################
+#  Flag Schema Cache  #
+#######################
+def test_flag_schema_cache_is_written_and_reused(monkeypatch):
+    ckp = ConfigKeywordParser("no-mpi_sparc", "test-supported-config-flags.ini",
+                              schema_cache_dir="cache")
+    expected_selected_options = ckp.selected_options
+    assert ckp.flag_schema_cache_file.exists()
+    assert ckp.flag_schema_cache_file.parent == Path("cache")
+
+    # A warm parser should not need to read the .ini file contents at all
+    def raise_if_called(*args, **kwargs):
+        raise AssertionError("supported-config-flags.ini was parsed")
+
+    monkeypatch.setattr(ConfigKeywordParser, "config", property(raise_if_called))
+    monkeypatch.setattr(ConfigKeywordParser, "get_options_and_flag_type_for_flag",
+                        raise_if_called)
+
+    ckp = ConfigKeywordParser("no-mpi_sparc", "test-supported-config-flags.ini",
+                              schema_cache_dir="cache")
+    assert ckp.selected_options == expected_selected_options
+    assert ckp.option_index["sparc"] == ("package-enables", 2, "SELECT_MANY")
+    assert "- sparc" in ckp.get_msg_showing_supported_flags("Message here.")
+
+
+def test_flag_schema_cache_not_used_when_config_file_changes():
+    ckp = ConfigKeywordParser("openmp", "test-supported-config-flags.ini",
+                              schema_cache_dir="cache")
+    assert ckp.selected_options["node-type"] == "openmp"
+    old_cache_file = ckp.flag_schema_cache_file
+
+    with open("test-supported-config-flags.ini", "a") as F:
+        F.write("build-type:  SELECT_ONE\n    debug\n    release\n")
+
+    ckp = ConfigKeywordParser("openmp_release", "test-supported-config-flags.ini",
+                              schema_cache_dir="cache")
+    assert ckp.flag_schema_cache_file != old_cache_file
+    assert ckp.selected_options["build-type"] == "release"
+    assert ckp.flag_schema_cache_file.exists()
+
+
+def test_flag_schema_cache_with_wrong_version_is_ignored():
+    ckp = ConfigKeywordParser("", "test-supported-config-flags.ini",
+                              schema_cache_dir="cache")
+    ckp.selected_options
+    with open(ckp.flag_schema_cache_file, "w") as F:
+        F.write('{"version": -1}')
+
+    ckp = ConfigKeywordParser("empire", "test-supported-config-flags.ini",
+                              schema_cache_dir="cache")
+    assert ckp.selected_options["package-enables"] == "empire"
+
+
 ##########
 #  Misc  #
 ##########
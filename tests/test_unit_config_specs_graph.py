@@ -0,0 +1,172 @@
+from pathlib import Path
+import pytest
+import sys
+
+root_dir = (Path.cwd()/".."
+            if (Path.cwd()/"conftest.py").exists()
+            else Path.cwd())
+sys.path.append(str(root_dir))
+from configparserenhanced import ConfigParserEnhanced
+from src.config_specs_graph import ConfigSpecsGraph
+
+
+def get_graph(config_specs):
+    filename = "test_config_specs_graph.ini"
+    with open(filename, "w") as F:
+        F.write(config_specs)
+
+    return ConfigSpecsGraph(ConfigParserEnhanced(filename).configparserdata)
+
+
+@pytest.mark.parametrize("data", [
+    {"option_key": "use ATS1", "expected_section": "ATS1"},
+    {"option_key": "use   BUILD-TYPE|DEBUG", "expected_section": "BUILD-TYPE|DEBUG"},
+    {"option_key": "use 'ATS1'", "expected_section": "ATS1"},
+    {"option_key": "opt-set-cmake-var FOO STRING", "expected_section": None},
+    {"option_key": "use", "expected_section": None},
+])
+def test_used_section_parsed_from_option_key(data):
+    assert ConfigSpecsGraph.get_used_section(data["option_key"]) == data["expected_section"]
+
+
+def test_uses_found_for_each_section():
+    graph = get_graph(
+        "[COMMON]\n"
+        "opt-set-cmake-var A STRING : a\n\n"
+        "[ATS1]\n"
+        "use COMMON\n"
+        "opt-set-cmake-var B STRING : b\n\n"
+        "[ats1_env_mpi]\n"
+        "use ATS1\n"
+        "use DOES-NOT-EXIST\n"
+    )
+    assert graph.sections == ["COMMON", "ATS1", "ats1_env_mpi"]
+    assert graph.uses == {
+        "COMMON": [],
+        "ATS1": ["COMMON"],
+        "ats1_env_mpi": ["ATS1"],
+    }
+
+
+def test_chain_hash_changes_with_used_sections():
+    config_specs = (
+        "[COMMON]\n"
+        "opt-set-cmake-var A STRING : a\n\n"
+        "[OTHER]\n"
+        "opt-set-cmake-var C STRING : c\n\n"
+        "[ats1_env_mpi]\n"
+        "use COMMON\n\n"
+        "[ats1_env_no-mpi]\n"
+        "use OTHER\n"
+    )
+    graph = get_graph(config_specs)
+    changed_graph = get_graph(config_specs.replace("STRING : a", "STRING : z"))
+
+    assert changed_graph.get_chain_hash("COMMON") != graph.get_chain_hash("COMMON")
+    assert (changed_graph.get_chain_hash("ats1_env_mpi")
+            != graph.get_chain_hash("ats1_env_mpi"))
+    assert (changed_graph.get_chain_hash("ats1_env_no-mpi")
+            == graph.get_chain_hash("ats1_env_no-mpi"))
+
+
+def test_reachable_sections_follow_use_chains_once():
+    graph = get_graph(
+        "[COMMON]\n"
+        "opt-set-cmake-var A STRING : a\n\n"
+        "[ATS1]\n"
+        "use COMMON\n\n"
+        "[MPI]\n"
+        "use COMMON\n\n"
+        "[UNUSED]\n"
+        "opt-set-cmake-var B STRING : b\n\n"
+        "[ats1_env_mpi]\n"
+        "use ATS1\n"
+        "use MPI\n"
+    )
+    assert graph.get_reachable_sections("ats1_env_mpi") == [
+        "ats1_env_mpi", "ATS1", "MPI", "COMMON"
+    ]
+    assert graph.get_reachable_sections("COMMON") == ["COMMON"]
+
+
+def test_complete_configs_indexed_by_system():
+    graph = get_graph(
+        "[ATS1]\n"
+        "opt-set-cmake-var A STRING : a\n\n"
+        "[ats1_env_mpi]\n"
+        "use ATS1\n\n"
+        "[ats10_env_mpi]\n"
+        "use ATS1\n\n"
+        "[ats1_env_no-mpi]\n"
+        "use ATS1\n"
+    )
+    assert graph.complete_configs == [
+        "ats1_env_mpi", "ats10_env_mpi", "ats1_env_no-mpi"
+    ]
+    assert graph.complete_configs_by_system == {
+        "ats1": ["ats1_env_mpi", "ats1_env_no-mpi"],
+        "ats10": ["ats10_env_mpi"],
+    }
+
+
+@pytest.mark.parametrize("data", [
+    {"uses": "", "expected_cycle": None},
+    {"uses": "[A]\nuse B\n\n[B]\nuse C\n\n[C]\nuse A\n",
+     "expected_cycle": ["A", "B", "C", "A"]},
+    {"uses": "[A]\nuse B\n\n[B]\nuse B\n", "expected_cycle": ["B", "B"]},
+    {"uses": "[A]\nuse C\n\n[B]\nuse C\n\n[C]\nopt-set-cmake-var C STRING : c\n",
+     "expected_cycle": None},
+])
+def test_use_cycles_found(data):
+    graph = get_graph(
+        "[COMMON]\n"
+        "opt-set-cmake-var A STRING : a\n\n"
+        "[ats1_env_mpi]\n"
+        "use COMMON\n\n"
+        + data["uses"]
+    )
+    assert graph.find_use_cycle() == data["expected_cycle"]
+
+
+def test_affected_complete_configs_found_through_uses():
+    graph = get_graph(
+        "[COMMON]\n"
+        "opt-set-cmake-var A STRING : a\n\n"
+        "[BUILD-TYPE|DEBUG]\n"
+        "use COMMON\n\n"
+        "[BUILD-TYPE|RELEASE]\n"
+        "use COMMON\n\n"
+        "[ats1_env_debug]\n"
+        "use BUILD-TYPE|DEBUG\n\n"
+        "[ats1_env_release]\n"
+        "use BUILD-TYPE|RELEASE\n\n"
+        "[ats2_env_release]\n"
+        "use BUILD-TYPE|RELEASE\n"
+    )
+    assert graph.used_by["COMMON"] == ["BUILD-TYPE|DEBUG", "BUILD-TYPE|RELEASE"]
+    assert graph.get_affected_complete_configs(["BUILD-TYPE|RELEASE"]) == [
+        "ats1_env_release", "ats2_env_release"
+    ]
+    assert graph.get_affected_complete_configs(["COMMON"]) == [
+        "ats1_env_debug", "ats1_env_release", "ats2_env_release"
+    ]
+    assert graph.get_affected_complete_configs(
+        ["ats1_env_debug", "DOES-NOT-EXIST"]
+    ) == ["ats1_env_debug"]
+
+
+def test_changed_sections_found_between_versions():
+    config_specs = (
+        "[COMMON]\n"
+        "opt-set-cmake-var A STRING : a\n\n"
+        "[OLD]\n"
+        "opt-set-cmake-var B STRING : b\n\n"
+        "[ats1_env_mpi]\n"
+        "use COMMON\n"
+    )
+    graph = get_graph(config_specs)
+    new_graph = get_graph(
+        config_specs.replace("STRING : a", "STRING : z").replace("[OLD]", "[NEW]")
+    )
+    assert new_graph.get_changed_sections(graph) == {"COMMON", "OLD", "NEW"}
+    assert graph.get_changed_sections(graph) == set()
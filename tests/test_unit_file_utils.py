@@ -0,0 +1,60 @@
+import os
+from pathlib import Path
+import sys
+
+root_dir = (Path.cwd()/".."
+            if (Path.cwd()/"conftest.py").exists()
+            else Path.cwd())
+sys.path.append(str(root_dir))
+from src.file_utils import (get_file_hash, get_file_hashes, get_file_identity,
+                            write_file_if_changed)
+
+
+def test_write_file_if_changed_leaves_identical_file_untouched():
+    assert write_file_if_changed("out/fragment.cmake", "set(A ON)") is True
+    assert Path("out/fragment.cmake").read_text() == "set(A ON)"
+
+    os.utime("out/fragment.cmake", ns=(0, 0))
+    assert write_file_if_changed("out/fragment.cmake", "set(A ON)") is False
+    assert Path("out/fragment.cmake").stat().st_mtime_ns == 0
+
+
+def test_write_file_if_changed_replaces_changed_file():
+    Path("fragment.cmake").write_text("set(A ON)")
+    inode = Path("fragment.cmake").stat().st_ino
+
+    assert write_file_if_changed("fragment.cmake", b"set(A OFF)") is True
+    assert Path("fragment.cmake").read_text() == "set(A OFF)"
+    # Renamed into place rather than rewritten
+    assert Path("fragment.cmake").stat().st_ino != inode
+    assert [_.name for _ in Path.cwd().glob(".fragment.cmake.*")
+            if _.name != ".fragment.cmake.lock"] == []
+
+
+def test_get_file_identity_changes_when_file_is_written():
+    Path("fragment.cmake").write_text("set(A ON)")
+    identity = get_file_identity("fragment.cmake")
+    assert get_file_identity("fragment.cmake") == identity
+
+    os.utime("fragment.cmake", ns=(0, 0))
+    assert get_file_identity("fragment.cmake") != identity
+
+
+def test_get_file_hashes_only_rehashes_changed_files(monkeypatch):
+    Path("a.ini").write_text("[A]\n")
+    Path("b.ini").write_text("[B]\n")
+    expected = [get_file_hash("a.ini"), get_file_hash("b.ini")]
+    assert get_file_hashes(["a.ini", "b.ini"], "hashes.json") == expected
+
+    hashed = []
+    monkeypatch.setattr("src.file_utils.get_file_hash",
+                        lambda filename: hashed.append(filename) or "x")
+    monkeypatch.setattr("src.file_utils._file_hashes", {})
+    # Reused from the cache file by another process
+    assert get_file_hashes(["a.ini", "b.ini"], "hashes.json") == expected
+    assert hashed == []
+
+    os.utime("b.ini", ns=(0, 0))
+    assert get_file_hashes(["a.ini", "b.ini"], "hashes.json") == [expected[0],
+                                                                  "x"]
+    assert hashed == [os.path.realpath("b.ini")]
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import pytest
 import sys
@@ -231,6 +232,44 @@ def test_invalid_gen_config_file_raises(data):
         gc.args
 
 
+def test_gen_config_ini_paths_resolved_per_object():
+    project_dir = Path("project")
+    project_dir.mkdir()
+    with open(project_dir/"gen-config.ini", "w") as F:
+        F.write("[gen-config]\n"
+                "supported-config-flags : test-supported-config-flags.ini\n"
+                "config-specs : test-config-specs.ini\n"
+                "\n"
+                "[load-env]\n"
+                "supported-systems : test-supported-systems.ini\n"
+                "supported-envs : test-supported-envs.ini\n"
+                "environment-specs : test-environment-specs.ini\n")
+    for filename in Path.cwd().glob("test-*.ini"):
+        (project_dir/filename.name).write_text(filename.read_text())
+    Path("test-config-specs.ini").unlink()
+
+    # Only test-config-specs.ini is missing from the working directory, so
+    # only it is resolved from the directory of gen-config.ini.
+    gc = GenConfig(["build_name"],
+                   gen_config_ini_file=project_dir/"gen-config.ini")
+    assert gc.gen_config_config_data["gen-config"]["config-specs"] == str(
+        project_dir/"test-config-specs.ini"
+    )
+    assert gc.gen_config_config_data["gen-config"][
+        "supported-config-flags"] == "test-supported-config-flags.ini"
+
+    # From another working directory, every path is resolved that way, from
+    # the paths in the file rather than those resolved by the first object.
+    Path("elsewhere").mkdir()
+    os.chdir("elsewhere")
+    other = GenConfig(["build_name"],
+                      gen_config_ini_file=Path("..")/project_dir/"gen-config.ini")
+    for key in ["supported-config-flags", "config-specs"]:
+        assert other.gen_config_config_data["gen-config"][key] == str(
+            Path("..")/project_dir/f"test-{key}.ini"
+        )
+
+
 def test_config_file_specified_in_gen_config_ini_does_not_exist_raises():
     bad_gen_config_ini = (
         f"[gen-config]\n"
@@ -0,0 +1,77 @@
+from pathlib import Path
+import pytest
+import sys
+
+root_dir = (Path.cwd()/".."
+            if (Path.cwd()/"conftest.py").exists()
+            else Path.cwd())
+sys.path.append(str(root_dir))
+from configparserenhanced import ConfigParserEnhanced
+from setprogramoptions import SetProgramOptionsCMake
+from src.ini_registry import (clear_parsed_inis, get_derived_object,
+                              get_parsed_ini)
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    clear_parsed_inis()
+    yield
+    clear_parsed_inis()
+
+
+def test_same_file_parsed_once_per_class():
+    with open("registry_test.ini", "w") as F:
+        F.write("[SECTION]\nkey: value\n")
+
+    cpe = get_parsed_ini("registry_test.ini")
+    assert cpe.configparserdata["SECTION"]["key"] == "value"
+    assert get_parsed_ini(Path.cwd() / "registry_test.ini") is cpe
+    assert get_parsed_ini("./registry_test.ini", ConfigParserEnhanced) is cpe
+
+    spo = get_parsed_ini("registry_test.ini", SetProgramOptionsCMake)
+    assert isinstance(spo, SetProgramOptionsCMake)
+    assert spo is not cpe
+
+    clear_parsed_inis()
+    assert get_parsed_ini("registry_test.ini") is not cpe
+
+
+def test_changed_file_parsed_again():
+    with open("registry_test.ini", "w") as F:
+        F.write("[SECTION]\nkey: value\n")
+    cpe = get_parsed_ini("registry_test.ini")
+
+    with open("registry_test.ini", "w") as F:
+        F.write("[SECTION]\nkey: new value\n")
+    changed_cpe = get_parsed_ini("registry_test.ini")
+
+    assert changed_cpe is not cpe
+    assert changed_cpe.configparserdata["SECTION"]["key"] == "new value"
+
+
+def test_missing_file_raises_when_read():
+    cpe = get_parsed_ini("does_not_exist.ini")
+    with pytest.raises(IOError, match="Unable to load configuration .ini file"):
+        cpe.configparserdata
+
+
+def test_derived_object_built_again_when_a_file_changes():
+    for filename in ["a.ini", "b.ini"]:
+        with open(filename, "w") as F:
+            F.write("[SECTION]\n")
+
+    built = []
+
+    def factory():
+        built.append(object())
+        return built[-1]
+
+    obj = get_derived_object("graph", ["a.ini", "b.ini"], factory)
+    assert get_derived_object("graph", ["./a.ini", "b.ini"], factory) is obj
+    assert get_derived_object("other", ["a.ini", "b.ini"], factory) is not obj
+    assert len(built) == 2
+
+    with open("b.ini", "a") as F:
+        F.write("key: value\n")
+    assert get_derived_object("graph", ["a.ini", "b.ini"], factory) is not obj
+    assert len(built) == 3
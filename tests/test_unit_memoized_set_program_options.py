@@ -0,0 +1,75 @@
+from pathlib import Path
+import pytest
+import sys
+from unittest.mock import patch
+
+root_dir = (Path.cwd()/".."
+            if (Path.cwd()/"conftest.py").exists()
+            else Path.cwd())
+sys.path.append(str(root_dir))
+from setprogramoptions import SetProgramOptionsCMake
+from src.memoized_set_program_options import MemoizedSetProgramOptionsCMake
+
+
+CONFIG_SPECS = (
+    "[COMMON]\n"
+    "opt-set-cmake-var CMAKE_CXX_FLAGS STRING : -O2\n"
+    "opt-set-cmake-var TPL_ENABLE_MPI BOOL : ON\n\n"
+    "[BUILD-TYPE|DEBUG]\n"
+    "use COMMON\n"
+    "opt-set-cmake-var CMAKE_BUILD_TYPE STRING : DEBUG\n\n"
+    "[NO-MPI]\n"
+    "opt-remove TPL_ENABLE_MPI\n"
+    "opt-set-cmake-var TPL_ENABLE_MPI BOOL FORCE : OFF\n\n"
+    "[ats1_env_debug_mpi]\n"
+    "use BUILD-TYPE|DEBUG\n"
+    "opt-set-cmake-var Trilinos_ENABLE_Panzer BOOL : ON\n\n"
+    "[ats1_env_debug_no-mpi]\n"
+    "use BUILD-TYPE|DEBUG\n"
+    "use NO-MPI\n\n"
+    "[ats1_env_debug-twice_no-mpi]\n"
+    "use NO-MPI\n"
+    "use BUILD-TYPE|DEBUG\n"
+    "use COMMON\n"
+    "opt-remove CMAKE SUBSTR\n"
+)
+
+
+@pytest.fixture
+def config_specs_file():
+    with open("memoized_config_specs.ini", "w") as F:
+        F.write(CONFIG_SPECS)
+
+    return "memoized_config_specs.ini"
+
+
+@pytest.mark.parametrize("generator", ["bash", "cmake_fragment"])
+def test_option_lists_match_set_program_options(config_specs_file, generator):
+    spo = SetProgramOptionsCMake(config_specs_file)
+    memoized_spo = MemoizedSetProgramOptionsCMake(config_specs_file)
+
+    for section in spo.configparserdata.sections():
+        assert (memoized_spo.gen_option_list(section, generator)
+                == spo.gen_option_list(section, generator))
+
+
+def test_used_sections_parsed_once(config_specs_file):
+    memoized_spo = MemoizedSetProgramOptionsCMake(config_specs_file)
+    parsed_sections = []
+    parse_section_r = MemoizedSetProgramOptionsCMake._parse_section_r
+
+    def count_parses(self, section_name, *args, **kwargs):
+        parsed_sections.append(section_name)
+        return parse_section_r(self, section_name, *args, **kwargs)
+
+    with patch.object(MemoizedSetProgramOptionsCMake, "_parse_section_r",
+                      count_parses):
+        for section in memoized_spo.configparserdata.sections():
+            if section.upper() != section:
+                memoized_spo.gen_option_list(section, "bash")
+
+    assert sorted(parsed_sections) == sorted([
+        "ats1_env_debug_mpi", "BUILD-TYPE|DEBUG", "COMMON",
+        "ats1_env_debug_no-mpi", "NO-MPI",
+        "ats1_env_debug-twice_no-mpi",
+    ])
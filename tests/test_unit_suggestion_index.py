@@ -0,0 +1,51 @@
+from pathlib import Path
+import pytest
+import sys
+import time
+
+root_dir = (Path.cwd()/".."
+            if (Path.cwd()/"conftest.py").exists()
+            else Path.cwd())
+sys.path.append(str(root_dir))
+from src.suggestion_index import SuggestionIndex
+
+
+@pytest.mark.parametrize("data", [
+    {"string": "no-package-enable", "expected_suggestion": "no-package-enables"},
+    {"string": "deprecated-of", "expected_suggestion": "deprecated-off"},
+    {"string": "opnmp", "expected_suggestion": "openmp"},
+    {"string": "SERIAL", "expected_suggestion": "serial"},
+    {"string": "relase-debug", "expected_suggestion": "release-debug"},
+])
+def test_closest_candidate_suggested_first(data):
+    index = SuggestionIndex([
+        "mpi", "no-mpi", "serial", "openmp", "debug", "release",
+        "release-debug", "deprecated-on", "deprecated-off",
+        "no-package-enables", "empire", "sparc",
+    ])
+    assert index.get_suggestions(data["string"])[0] == data["expected_suggestion"]
+
+
+def test_suggestions_limited_to_k_and_min_similarity():
+    index = SuggestionIndex(["mpi", "no-mpi", "serial", "openmp"])
+    assert len(index.get_suggestions("mpi", k=1)) == 1
+    assert index.get_suggestions("mpi", k=2) == ["mpi", "no-mpi"]
+    assert index.get_suggestions("zzzzzz") == []
+
+
+def test_duplicate_candidates_suggested_once():
+    index = SuggestionIndex(["mpi", "mpi", "no-mpi"])
+    assert index.get_suggestions("mpi") == ["mpi", "no-mpi"]
+
+
+def test_suggestions_fast_for_many_candidates():
+    index = SuggestionIndex(f"option-{_}-{_ * 7919 % 1000}" for _ in range(5000))
+
+    start = time.perf_counter()
+    for _ in range(10):
+        suggestions = index.get_suggestions("optoin-1234-46")
+    elapsed = (time.perf_counter() - start) / 10
+
+    assert suggestions[0] == "option-1234-46"
+    # Generous bound so this isn't flaky on loaded machines
+    assert elapsed < 0.05